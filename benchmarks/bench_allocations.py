@@ -0,0 +1,77 @@
+import tracemalloc
+
+import numpy as np
+
+import py_synth
+
+
+def create_sound(waveform_type: py_synth.WaveformType, duration: float) -> py_synth.Sound:
+    """
+    Returns a sound with a curved envelope, so every ADSR segment is exercised.
+    """
+    envelope = py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(20, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(50),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.SINE),
+    )
+    return py_synth.Sound(
+        waveform_type=waveform_type,
+        frequency=py_synth.BaseFrequency(440.0),
+        duration=duration,
+        envelope=envelope,
+    )
+
+
+def steady_state_bytes(blocks, warmup: int = 4) -> int:
+    """
+    Returns the peak bytes allocated while rendering a block, once the first blocks have
+    sized the scratch buffers.
+    """
+    blocks = iter(blocks)
+    for _ in range(warmup):
+        next(blocks)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in blocks:
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - start
+
+
+def poly_blocks(poly_synth: py_synth.PolySynth, sound: py_synth.Sound, num_blocks: int):
+    """
+    Yields the blocks of a PolySynth playing a four-note chord.
+    """
+    for note in range(4):
+        poly_synth.note_on(sound, note)
+    for _ in range(num_blocks):
+        yield poly_synth.render_block()
+
+
+if __name__ == "__main__":
+    block_size = py_synth.Synthesizer.BLOCK_SIZE
+    block_bytes = block_size * np.dtype(np.float64).itemsize
+    print(f"Block: {block_size} samples, {block_bytes} bytes")
+    print(f"{'Renderer':<36} {'Waveform':<10} {'Peak bytes':>11}")
+
+    for waveform_type in py_synth.WaveformType:
+        sound = create_sound(waveform_type, duration=10.0)
+        for name, synth in (
+            ("Synthesizer", py_synth.Synthesizer(show=False)),
+            ("Synthesizer (wavetable)", py_synth.Synthesizer(show=False, wavetable_size=2048)),
+        ):
+            # Render once so the shared curve shapes are cached before measuring.
+            for _ in synth.render_blocks(sound):
+                pass
+            for label, out in ((" new blocks", None), (" out=", np.empty(block_size))):
+                allocated = steady_state_bytes(synth.render_blocks(sound, out=out))
+                print(f"{name + label:<36} {waveform_type.name:<10} {allocated:>11}")
+
+        poly_synth = py_synth.PolySynth(num_voices=8, block_size=block_size)
+        allocated = steady_state_bytes(poly_blocks(poly_synth, sound, num_blocks=64))
+        print(f"{'PolySynth':<36} {waveform_type.name:<10} {allocated:>11}")
@@ -0,0 +1,49 @@
+import time
+
+import numpy as np
+
+import py_synth
+
+
+NUM_SOUNDS = 2000
+DURATION = 0.1
+
+
+def best_time(function, repeat: int = 3) -> float:
+    """
+    Returns the best wall time of calling function.
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+if __name__ == "__main__":
+    envelope = py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(20, py_synth.CurveType.SINE),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(50),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.SINE),
+    )
+    frequencies = np.random.default_rng(0).uniform(40.0, 200.0, NUM_SOUNDS)
+
+    print(f"{NUM_SOUNDS} one-shots of {DURATION * 1e3:g} ms at CD_QUALITY")
+    print(f"{'Waveform':<10} {'dtype':<8} {'save_sound loop':>16} {'render loop':>12} {'render_batch':>13} {'Speedup':>8}")
+    for waveform_type in (py_synth.WaveformType.SINE, py_synth.WaveformType.SAWTOOTH):
+        sounds = [
+            py_synth.Sound(waveform_type, py_synth.BaseFrequency(float(frequency)), DURATION, envelope)
+            for frequency in frequencies
+        ]
+        for dtype in (np.float64, np.float32):
+            synth = py_synth.Synthesizer(dtype=dtype, file_backend=py_synth.NullBackend())
+            save_time = best_time(lambda: [synth.save_sound(sound, "batch", "wav") for sound in sounds])
+            render_time = best_time(lambda: [synth.render(sound) for sound in sounds])
+            batch_time = best_time(lambda: synth.render_batch(sounds))
+            print(
+                f"{waveform_type.name:<10} {np.dtype(dtype).name:<8} {save_time * 1e3:>13.1f} ms"
+                f" {render_time * 1e3:>9.1f} ms {batch_time * 1e3:>10.1f} ms {save_time / batch_time:>7.2f}x"
+            )
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Headless `import py_synth` must stay under this many milliseconds, numpy included.
+BUDGET_MS = 250.0
+
+# Modules that must only be loaded on first playback or plotting.
+LAZY_MODULES = ("sounddevice", "soundfile", "matplotlib")
+
+
+def import_times(module: str = "py_synth") -> dict:
+    """
+    Imports a module in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        dict: The self and cumulative import time in microseconds of every loaded module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # The header line.
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+if __name__ == "__main__":
+    runs = [import_times() for _ in range(5)]
+    best = min(runs, key=lambda times: times["py_synth"][1])
+
+    total_ms = best["py_synth"][1] / 1e3
+    numpy_ms = best["numpy"][1] / 1e3
+    own_ms = sum(
+        self_us for name, (self_us, _) in best.items() if name.startswith("py_synth")
+    ) / 1e3
+    print(f"import py_synth: {total_ms:.1f} ms (numpy {numpy_ms:.1f} ms, py_synth modules {own_ms:.1f} ms)")
+    print(f"Budget: {BUDGET_MS:.1f} ms")
+
+    loaded = sorted(
+        name for name in best if name.split(".")[0] in LAZY_MODULES
+    )
+    if loaded:
+        sys.exit(f"Modules that should be lazy were imported: {', '.join(loaded)}")
+    if total_ms > BUDGET_MS:
+        sys.exit(f"import py_synth took {total_ms:.1f} ms, over the {BUDGET_MS:.1f} ms budget")
@@ -0,0 +1,82 @@
+import sys
+import tracemalloc
+
+import py_synth
+
+
+NUM_EVENTS = 1_000_000
+
+
+class DictFrequency:
+    """
+    The previous, ``__dict__``-backed frequency, for comparison.
+    """
+
+    def __init__(self, value: float):
+        self.value = value
+
+
+class DictSound:
+    """
+    The previous, ``__dict__``-backed sound, for comparison.
+    """
+
+    def __init__(self, waveform_type, frequency, duration, envelope, seed=None):
+        self.waveform_type = waveform_type
+        self.frequency = frequency
+        self.duration = duration
+        self.envelope = envelope
+        self.seed = seed
+
+
+def measure(create_event, num_events: int) -> float:
+    """
+    Returns the bytes allocated per event when keeping num_events events alive.
+    """
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    events = [create_event(index) for index in range(num_events)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The list itself holds one pointer per event.
+    list_bytes = sys.getsizeof(events)
+    del events
+    return (current - start - list_bytes) / num_events
+
+
+if __name__ == "__main__":
+    num_events = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_EVENTS
+    envelope = py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(20, py_synth.CurveType.SINE),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(50),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.SINE),
+    )
+    notes = [note.value for note in py_synth.Notes]
+
+    def dict_event(index: int) -> DictSound:
+        return DictSound(
+            py_synth.WaveformType.SINE,
+            DictFrequency(notes[index % len(notes)]),
+            0.25 + index * 1e-6,
+            envelope,
+        )
+
+    def slots_event(index: int) -> py_synth.Sound:
+        return py_synth.Sound(
+            py_synth.WaveformType.SINE,
+            py_synth.BaseFrequency(notes[index % len(notes)]),
+            0.25 + index * 1e-6,
+            envelope,
+        )
+
+    # Each event owns its frequency and duration and shares the envelope.
+    dict_bytes = measure(dict_event, num_events)
+    slots_bytes = measure(slots_event, num_events)
+    print(f"{num_events} events")
+    print(f"{'Sound + frequency':<20} {'Bytes/event':>12} {'Total MB':>9}")
+    print(f"{'__dict__':<20} {dict_bytes:>12.1f} {dict_bytes * num_events / 1e6:>9.1f}")
+    print(f"{'__slots__':<20} {slots_bytes:>12.1f} {slots_bytes * num_events / 1e6:>9.1f}")
+    print(f"Saving: {1 - slots_bytes / dict_bytes:.0%}")
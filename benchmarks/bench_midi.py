@@ -0,0 +1,111 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import py_synth
+
+
+DIVISION = 480
+
+
+def variable_length(value: int) -> bytes:
+    """
+    Encodes a value as a MIDI variable-length quantity.
+    """
+    encoded = [value & 0x7F]
+    value >>= 7
+    while value:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(encoded))
+
+
+def write_midi(path: Path, num_notes: int, num_tracks: int = 8, seed: int = 0):
+    """
+    Writes a format 1 MIDI file of random overlapping notes with tempo changes.
+
+    Note-offs are written as note-ons with velocity 0 under running status, as most
+    sequencers do.
+    """
+    rng = np.random.default_rng(seed)
+    tempo_track = bytearray()
+    for index in range(64):
+        tempo = int(60e6 / rng.uniform(80, 160))
+        tempo_track += variable_length(0 if index == 0 else DIVISION * 16)
+        tempo_track += b"\xff\x51\x03" + tempo.to_bytes(3, "big")
+    tempo_track += b"\x00\xff\x2f\x00"
+
+    tracks = [bytes(tempo_track)]
+    notes_per_track = num_notes // num_tracks
+    for track in range(num_tracks):
+        channel = track % 16
+        starts = np.cumsum(rng.integers(0, DIVISION // 2, notes_per_track))
+        ends = starts + rng.integers(1, DIVISION * 2, notes_per_track)
+        keys = rng.integers(36, 96, notes_per_track)
+        velocities = rng.integers(1, 128, notes_per_track)
+
+        # Note-ons sort before note-offs at the same tick: (tick, kind, key).
+        events = sorted(
+            [(int(tick), 1, int(key), int(velocity)) for tick, key, velocity in zip(starts, keys, velocities)]
+            + [(int(tick), 0, int(key), 0) for tick, key in zip(ends, keys)]
+        )
+        data = bytearray(b"\x00" + bytes([0xC0 | channel, track % 128]))
+        status = bytes([0x90 | channel])
+        previous = 0
+        held = set()
+        for tick, kind, key, velocity in events:
+            # Skip overlapping repeats of a held key, which would end the held note early.
+            if kind == 1 and key in held or kind == 0 and key not in held:
+                continue
+            (held.add if kind == 1 else held.discard)(key)
+            data += variable_length(tick - previous)
+            data += status
+            data += bytes([key, velocity])
+            status = b""  # Running status for the rest of the track.
+            previous = tick
+        data += b"\x00\xff\x2f\x00"
+        tracks.append(bytes(data))
+
+    with open(path, "wb") as file:
+        file.write(b"MThd" + (6).to_bytes(4, "big"))
+        file.write((1).to_bytes(2, "big") + len(tracks).to_bytes(2, "big") + DIVISION.to_bytes(2, "big"))
+        for data in tracks:
+            file.write(b"MTrk" + len(data).to_bytes(4, "big") + data)
+
+
+if __name__ == "__main__":
+    num_notes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "large.mid"
+        write_midi(path, num_notes)
+        size_mb = path.stat().st_size / 1e6
+
+        best = float("inf")
+        for _ in range(3):
+            started = time.perf_counter()
+            notes = py_synth.read_midi(path)
+            best = min(best, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        score = py_synth.Score.from_midi(
+            path,
+            py_synth.Instrument(
+                py_synth.WaveformType.TRIANGLE,
+                py_synth.ADSREnvelope(
+                    attack=py_synth.AttackPercent(5, py_synth.CurveType.LINEAR),
+                    decay=py_synth.DecayPercent(20, py_synth.CurveType.EXPONENTIAL),
+                    sustain_level=py_synth.SustainLevel(0.6),
+                    sustain=py_synth.SustainPercent(55),
+                    release=py_synth.ReleasePercent(20, py_synth.CurveType.EXPONENTIAL),
+                ),
+            ),
+        )
+        score.starts
+        score_time = time.perf_counter() - started
+
+    print(f"File: {size_mb:.1f} MB, {len(notes)} notes, {notes.starts[-1]:.0f} s")
+    print(f"read_midi: {best:.3f} s ({size_mb / best:.1f} MB/s, {len(notes) / best / 1e6:.2f} M notes/s)")
+    print(f"Score.from_midi (sorted): {score_time:.3f} s")
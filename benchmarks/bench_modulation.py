@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+
+import py_synth
+
+
+DURATION = 10.0
+CONTROL_INTERVALS = (1, 8, 32, 64, 256)
+
+
+def render_time(synth: py_synth.Synthesizer, sound: py_synth.Sound, repeat: int = 5) -> float:
+    """
+    Returns the best time to render a sound.
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        synth.render(sound)
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+if __name__ == "__main__":
+    sample_rate = py_synth.SampleRate.CD_QUALITY
+    envelope = py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(20, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(50),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.SINE),
+    )
+    modulators = {
+        "none": None,
+        "vibrato (LFO)": py_synth.LFO(5.0, 0.3),
+        "sweep (Ramp)": py_synth.Ramp(
+            [(0.0, 0.0), (DURATION / 2, 24.0, py_synth.CurveType.SINE), (DURATION, 0.0, py_synth.CurveType.TANH)]
+        ),
+    }
+
+    print(f"{DURATION:g} s SAWTOOTH at {sample_rate.name}, render time by control interval")
+    print(f"{'Modulation':<16}" + "".join(f"{interval:>12}" for interval in CONTROL_INTERVALS) + f"{'Max cents':>12}")
+    for name, modulator in modulators.items():
+        sound = py_synth.Sound(
+            py_synth.WaveformType.SAWTOOTH,
+            py_synth.BaseFrequency(220.0),
+            DURATION,
+            envelope,
+            frequency_modulation=modulator,
+        )
+        row = f"{name:<16}"
+        for interval in CONTROL_INTERVALS:
+            synth = py_synth.Synthesizer(sample_rate, control_interval=interval)
+            row += f"{render_time(synth, sound) * 1e3:>9.1f} ms"
+
+        # The pitch error of the coarsest interval against evaluating every sample.
+        error = 0.0
+        if modulator is not None:
+            num_samples = int(sample_rate.value * DURATION)
+            exact = sound.frequency_block(sample_rate.value, 0, num_samples)
+            coarse = sound.frequency_block(sample_rate.value, 0, num_samples, CONTROL_INTERVALS[-1])
+            error = np.abs(1200 * np.log2(coarse / exact)).max()
+        print(row + f"{error:>12.4f}")
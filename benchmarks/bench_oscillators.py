@@ -0,0 +1,57 @@
+import timeit
+
+import py_synth
+
+
+WAVEFORM_TYPES = (
+    py_synth.WaveformType.SQUARE,
+    py_synth.WaveformType.SAWTOOTH,
+    py_synth.WaveformType.PULSE,
+)
+
+
+def time_waveform(
+    sample_rate: py_synth.SampleRate,
+    waveform_type: py_synth.WaveformType,
+    band_limited: bool,
+    frequency: float = 3520.0,
+    duration: float = 1.0,
+    repeat: int = 5,
+) -> float:
+    """
+    Returns the best time in seconds to generate one waveform.
+    """
+    waveform = py_synth.Waveform(sample_rate.value, band_limited=band_limited)
+    num_samples = int(sample_rate.value * duration)
+    return min(
+        timeit.repeat(
+            lambda: waveform.generate(waveform_type, frequency, num_samples),
+            number=1,
+            repeat=repeat,
+        )
+    )
+
+
+if __name__ == "__main__":
+    print(f"{'Sample rate':<16} {'Waveform':<10} {'Naive [ms]':>11} {'PolyBLEP [ms]':>14} {'Ratio':>7}")
+    for sample_rate in py_synth.SampleRate:
+        for waveform_type in WAVEFORM_TYPES:
+            naive = time_waveform(sample_rate, waveform_type, band_limited=False)
+            band_limited = time_waveform(sample_rate, waveform_type, band_limited=True)
+            print(
+                f"{sample_rate.name:<16} {waveform_type.name:<10} {naive * 1e3:>11.2f}"
+                f" {band_limited * 1e3:>14.2f} {band_limited / naive:>7.2f}"
+            )
+
+    # The alternative to band-limiting: rendering naively at 192 kHz instead of 44.1 kHz.
+    for waveform_type in WAVEFORM_TYPES:
+        oversampled = time_waveform(
+            py_synth.SampleRate.HIGH_RESOLUTION, waveform_type, band_limited=False
+        )
+        band_limited = time_waveform(
+            py_synth.SampleRate.CD_QUALITY, waveform_type, band_limited=True
+        )
+        print(
+            f"{waveform_type.name}: naive HIGH_RESOLUTION {oversampled * 1e3:.2f} ms,"
+            f" PolyBLEP CD_QUALITY {band_limited * 1e3:.2f} ms"
+        )
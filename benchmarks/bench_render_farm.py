@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+import time
+
+import py_synth
+
+
+ENVELOPES = {
+    "pluck": py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(2, py_synth.CurveType.LINEAR),
+        decay=py_synth.DecayPercent(30, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.3),
+        sustain=py_synth.SustainPercent(48),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.EXPONENTIAL),
+    ),
+    "pad": py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(30, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(10, py_synth.CurveType.SINE),
+        sustain_level=py_synth.SustainLevel(0.8),
+        sustain=py_synth.SustainPercent(40),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.SINE),
+    ),
+}
+
+
+def sample_pack(duration: float) -> list:
+    """
+    Returns a job for every note, waveform type and envelope.
+    """
+    return [
+        py_synth.RenderJob(
+            py_synth.Sound(
+                waveform_type=waveform_type,
+                frequency=py_synth.FullRangeFrequency(note.value),
+                duration=duration,
+                envelope=envelope,
+            ),
+            f"{waveform_type.name.lower()}_{name}_{note.name}",
+        )
+        for note in py_synth.Notes
+        for waveform_type in py_synth.WaveformType
+        for name, envelope in ENVELOPES.items()
+    ]
+
+
+if __name__ == "__main__":
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    jobs = sample_pack(duration)
+    cpus = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1)))
+    print(f"{len(jobs)} files of {duration:g} s, {cpus} CPUs")
+    print(f"{'Workers':>7} {'Time [s]':>9} {'Files/s':>8} {'Speedup':>8}")
+
+    serial = None
+    for workers in counts:
+        with tempfile.TemporaryDirectory() as directory:
+            synth = py_synth.Synthesizer(
+                show=False, file_backend=py_synth.SoundFileBackend(directory)
+            )
+            started = time.perf_counter()
+            synth.render_many(jobs, workers=workers)
+            elapsed = time.perf_counter() - started
+
+        serial = serial or elapsed
+        print(f"{workers:>7} {elapsed:>9.2f} {len(jobs) / elapsed:>8.1f} {serial / elapsed:>8.2f}")
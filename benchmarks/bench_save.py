@@ -0,0 +1,77 @@
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import py_synth
+
+
+FORMATS = (
+    ("wav", "PCM_16"),
+    ("wav", "PCM_24"),
+    ("wav", "FLOAT"),
+    ("flac", "PCM_16"),
+    ("flac", "PCM_24"),
+    ("ogg", "VORBIS"),
+)
+
+
+def create_sound(duration: float) -> py_synth.Sound:
+    """
+    Returns a sawtooth sound with a curved envelope.
+    """
+    envelope = py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(1, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(1, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(97),
+        release=py_synth.ReleasePercent(1, py_synth.CurveType.SINE),
+    )
+    return py_synth.Sound(
+        waveform_type=py_synth.WaveformType.SAWTOOTH,
+        frequency=py_synth.BaseFrequency(220.0),
+        duration=duration,
+        envelope=envelope,
+    )
+
+
+def peak_rss_mb() -> float:
+    """
+    Returns the peak resident set size of the process in MB.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+if __name__ == "__main__":
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    block_size = int(sys.argv[2]) if len(sys.argv) > 2 else py_synth.Synthesizer.BLOCK_SIZE
+    sound = create_sound(minutes * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        synth = py_synth.Synthesizer(
+            show=False, file_backend=py_synth.SoundFileBackend(directory)
+        )
+        num_samples = int(synth.sample_rate * sound.duration)
+        print(f"{minutes:g} min at {synth.sample_rate} Hz, {num_samples} samples, blocks of {block_size}")
+        print(
+            f"{'Format':<6} {'Subtype':<8} {'Time [s]':>9} {'Audio MB/s':>11} {'File MB':>8}"
+            f" {'Peak traced MB':>15} {'Peak RSS MB':>12}"
+        )
+
+        for file_format, subtype in FORMATS:
+            tracemalloc.start()
+            started = time.perf_counter()
+            synth.save_sound(sound, "bench", file_format, subtype, block_size)
+            elapsed = time.perf_counter() - started
+            _, traced = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            # Throughput in MB of rendered float32 audio per second.
+            audio_mb = num_samples * 4 / 1e6
+            file_mb = (Path(directory) / f"bench.{file_format}").stat().st_size / 1e6
+            print(
+                f"{file_format:<6} {subtype:<8} {elapsed:>9.2f} {audio_mb / elapsed:>11.1f}"
+                f" {file_mb:>8.1f} {traced / 1e6:>15.2f} {peak_rss_mb():>12.1f}"
+            )
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+import py_synth
+
+
+NUM_BLOCKS = 200
+
+
+def create_score(
+    num_events: int, notes_per_second: float, instrument: py_synth.Instrument
+) -> py_synth.Score:
+    """
+    Returns a score of random notes at a fixed rate.
+    """
+    rng = np.random.default_rng(0)
+    notes = list(py_synth.Notes)[36:72]
+    score = py_synth.Score()
+    for index in range(num_events):
+        score.add(
+            index / notes_per_second,
+            notes[rng.integers(len(notes))],
+            duration=0.5,
+            instrument=instrument,
+            velocity=0.5,
+        )
+    return score
+
+
+def time_blocks(score: py_synth.Score) -> float:
+    """
+    Returns the mean time in milliseconds to render a block of the score.
+    """
+    score.starts  # Sort the events before timing.
+    sequencer = py_synth.Sequencer(score, py_synth.PolySynth(num_voices=64, block_size=1024))
+    started = time.perf_counter()
+    for _ in range(NUM_BLOCKS):
+        sequencer.render_block()
+    return (time.perf_counter() - started) / NUM_BLOCKS * 1e3
+
+
+if __name__ == "__main__":
+    instrument = py_synth.Instrument(
+        py_synth.WaveformType.SAWTOOTH,
+        py_synth.ADSREnvelope(
+            attack=py_synth.AttackPercent(5, py_synth.CurveType.LINEAR),
+            decay=py_synth.DecayPercent(20, py_synth.CurveType.EXPONENTIAL),
+            sustain_level=py_synth.SustainLevel(0.6),
+            sustain=py_synth.SustainPercent(55),
+            release=py_synth.ReleasePercent(20, py_synth.CurveType.EXPONENTIAL),
+        ),
+    )
+
+    # Same density, growing score: the block time should stay flat.
+    print(f"{'Events':>8} {'Notes/s':>8} {'Active voices':>14} {'Block [ms]':>11}")
+    for num_events in (1_000, 10_000, 100_000):
+        score = create_score(num_events, 20.0, instrument)
+        print(f"{num_events:>8} {20.0:>8.0f} {20.0 * 0.5:>14.0f} {time_blocks(score):>11.3f}")
+
+    # Same score size, growing density: the block time should follow the active voices.
+    for notes_per_second in (10.0, 40.0, 100.0):
+        score = create_score(100_000, notes_per_second, instrument)
+        active = min(notes_per_second * 0.5, 64)
+        print(
+            f"{100_000:>8} {notes_per_second:>8.0f} {active:>14.0f} {time_blocks(score):>11.3f}"
+        )
@@ -0,0 +1,73 @@
+import os
+import time
+
+import py_synth
+
+
+NUM_VOICES = 16
+DURATION = 2.0
+
+
+def create_sounds() -> list:
+    """
+    Returns one held sound per voice, cycling through the waveform types.
+    """
+    envelope = py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(10, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(70),
+        release=py_synth.ReleasePercent(10, py_synth.CurveType.SINE),
+    )
+    waveform_types = [
+        waveform_type
+        for waveform_type in py_synth.WaveformType
+        if waveform_type != py_synth.WaveformType.NOISE
+    ]
+    notes = list(py_synth.Notes)[24:24 + NUM_VOICES]
+    return [
+        py_synth.Sound(
+            waveform_type=waveform_types[index % len(waveform_types)],
+            frequency=py_synth.FullRangeFrequency(note.value),
+            duration=DURATION,
+            envelope=envelope,
+        )
+        for index, note in enumerate(notes)
+    ]
+
+
+def time_render(sample_rate: py_synth.SampleRate, threads: int, block_size: int) -> float:
+    """
+    Returns the time in seconds to render all voices for the whole duration.
+    """
+    poly_synth = py_synth.PolySynth(
+        sample_rate, num_voices=NUM_VOICES, block_size=block_size, threads=threads
+    )
+    for note, sound in enumerate(create_sounds()):
+        poly_synth.note_on(sound, note)
+
+    num_blocks = int(sample_rate.value * DURATION) // block_size
+    started = time.perf_counter()
+    for _ in range(num_blocks):
+        poly_synth.render_block()
+    elapsed = time.perf_counter() - started
+    poly_synth.close()
+    return elapsed
+
+
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    thread_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, max(cpus, 2) + 1)))
+    print(f"{NUM_VOICES} voices, {DURATION:g} s, {cpus} CPUs")
+    print(f"{'Sample rate':<16} {'Block':>6} {'Threads':>8} {'Time [ms]':>10} {'Speedup':>8}")
+
+    for sample_rate in py_synth.SampleRate:
+        for block_size in (256, py_synth.Synthesizer.BLOCK_SIZE):
+            serial = None
+            for threads in thread_counts:
+                elapsed = time_render(sample_rate, threads, block_size)
+                serial = serial or elapsed
+                print(
+                    f"{sample_rate.name:<16} {block_size:>6} {threads:>8}"
+                    f" {elapsed * 1e3:>10.1f} {serial / elapsed:>8.2f}"
+                )
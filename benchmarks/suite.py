@@ -0,0 +1,309 @@
+"""
+The benchmark suite: every waveform, curve, envelope and sample rate, with saved baselines.
+
+    python -m benchmarks.suite                          # quick run, durations up to 10 s
+    python -m benchmarks.suite --full                   # durations up to 10 min
+    python -m benchmarks.suite --filter save_sound --save before.json
+    python -m benchmarks.suite --filter save_sound --compare before.json
+
+Comparing exits with status 1 when a case got slower or uses more memory than the
+threshold allows, so the suite can guard a CI job.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+import py_synth
+from py_synth.curve import Curve
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The durations of every case, from 10 ms to 10 min.
+DURATIONS = (0.01, 0.1, 1.0, 10.0, 60.0, 600.0)
+QUICK_MAX_DURATION = 10.0
+
+# The shortest time a timed repetition should take, to keep timer noise small.
+MIN_REPETITION_TIME = 0.02
+
+
+class Case:
+    """
+    A benchmark case: a function that processes num_samples samples at sample_rate per call.
+
+    Attributes:
+        name (str): The unique name, e.g. 'waveform.generate[SINE,CD_QUALITY,1s]'.
+        sample_rate (int): The sample rate in Hz.
+        num_samples (int): The number of samples processed per call.
+        run (Callable[[], None]): The function to time.
+    """
+
+    def __init__(self, name: str, sample_rate: int, num_samples: int, run: Callable[[], None]):
+        self.name = name
+        self.sample_rate = sample_rate
+        self.num_samples = num_samples
+        self.run = run
+
+
+def create_envelope(curve: py_synth.CurveType = py_synth.CurveType.SINE) -> py_synth.ADSREnvelope:
+    """
+    Returns an envelope with a curve in every segment.
+    """
+    return py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, curve),
+        decay=py_synth.DecayPercent(20, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(50),
+        release=py_synth.ReleasePercent(20, curve),
+    )
+
+
+def format_duration(duration: float) -> str:
+    """
+    Formats a duration for a case name, e.g. '10ms', '1s' or '10min'.
+    """
+    if duration < 1:
+        return f"{duration * 1e3:g}ms"
+    if duration < 60:
+        return f"{duration:g}s"
+    return f"{duration / 60:g}min"
+
+
+def create_cases(max_duration: float, directory: str, file_format: str) -> List[Case]:
+    """
+    Returns all benchmark cases up to max_duration seconds of audio.
+    """
+    cases = []
+    for sample_rate in py_synth.SampleRate:
+        rate = sample_rate.value
+        waveform = py_synth.Waveform(rate)
+        curve = Curve(rate)
+        envelope = create_envelope()
+        synth = py_synth.Synthesizer(
+            sample_rate,
+            show=False,
+            file_backend=(
+                py_synth.NullBackend() if file_format == "null" else py_synth.SoundFileBackend(directory)
+            ),
+        )
+        sound_format = "wav" if file_format == "null" else file_format
+
+        for duration in DURATIONS:
+            if duration > max_duration:
+                continue
+            label = format_duration(duration)
+            num_samples = int(rate * duration)
+
+            # Every value a case uses is bound as a default, since the loops move on
+            # before the cases run.
+            for waveform_type in py_synth.WaveformType:
+                cases.append(
+                    Case(
+                        f"waveform.generate[{waveform_type.name},{sample_rate.name},{label}]",
+                        rate,
+                        num_samples,
+                        lambda waveform=waveform, waveform_type=waveform_type, num_samples=num_samples: (
+                            waveform.generate(waveform_type, 440.0, num_samples)
+                        ),
+                    )
+                )
+
+            for curve_type in py_synth.CurveType:
+                def apply_curve(curve=curve, curve_type=curve_type, num_samples=num_samples):
+                    # Time the curve itself, not the shared cache of normalized shapes.
+                    Curve.shape_cache.clear()
+                    curve.apply_curve(curve_type, num_samples, 0.2, 0.9)
+
+                cases.append(
+                    Case(
+                        f"curve.apply_curve[{curve_type.name},{sample_rate.name},{label}]",
+                        rate,
+                        num_samples,
+                        apply_curve,
+                    )
+                )
+
+            def generate_envelope(envelope=envelope, rate=rate, duration=duration):
+                Curve.shape_cache.clear()
+                envelope.generate(rate, duration)
+
+            cases.append(
+                Case(f"envelope.generate[{sample_rate.name},{label}]", rate, num_samples, generate_envelope)
+            )
+
+            sound = py_synth.Sound(
+                py_synth.WaveformType.SAWTOOTH, py_synth.BaseFrequency(220.0), duration, envelope
+            )
+            cases.append(
+                Case(
+                    f"synthesizer.save_sound[{sample_rate.name},{label}]",
+                    rate,
+                    num_samples,
+                    lambda synth=synth, sound=sound, sound_format=sound_format: (
+                        synth.save_sound(sound, "benchmark", sound_format)
+                    ),
+                )
+            )
+    return cases
+
+
+def measure(case: Case, repeat: int, max_time: float) -> dict:
+    """
+    Times a case and traces its peak memory.
+
+    Short calls are repeated within each timed repetition, like timeit's autorange, and
+    repetitions stop early once max_time has been spent.
+
+    Returns:
+        dict: The best and median time per call, samples per second, real-time factor and peak bytes.
+    """
+    case.run()  # Warm up caches and scratch buffers.
+
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            case.run()
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_REPETITION_TIME:
+            break
+        number *= 2
+
+    times = [elapsed / number]
+    spent = elapsed
+    while len(times) < repeat and spent < max_time:
+        started = time.perf_counter()
+        for _ in range(number):
+            case.run()
+        elapsed = time.perf_counter() - started
+        times.append(elapsed / number)
+        spent += elapsed
+
+    tracemalloc.start()
+    case.run()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "best": best,
+        "median": float(np.median(times)),
+        "repeat": len(times),
+        "number": number,
+        "samples": case.num_samples,
+        "samples_per_second": case.num_samples / best,
+        "real_time_factor": best / (case.num_samples / case.sample_rate),
+        "peak_bytes": peak_bytes,
+    }
+
+
+def environment() -> dict:
+    """
+    Returns the machine and version details saved with the results.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "py_synth": py_synth.__version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def print_result(name: str, result: dict, baseline: dict = None, threshold: float = 0.1) -> bool:
+    """
+    Prints one result row, compared with its baseline if given.
+
+    Returns:
+        bool: Whether the case regressed against the baseline.
+    """
+    row = (
+        f"{name:<58} {result['best'] * 1e3:>10.3f} {result['samples_per_second'] / 1e6:>9.2f}"
+        f" {result['real_time_factor']:>9.5f} {result['peak_bytes'] / 1e6:>9.2f}"
+    )
+    if baseline is None:
+        print(row)
+        return False
+
+    time_ratio = result["best"] / baseline["best"]
+    memory_ratio = (result["peak_bytes"] + 1) / (baseline["peak_bytes"] + 1)
+    regressed = time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+    improved = time_ratio < 1 / (1 + threshold)
+    marker = "REGRESSED" if regressed else "improved" if improved else ""
+    print(f"{row} {time_ratio:>7.2f}x {memory_ratio:>7.2f}x {marker}")
+    return regressed
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--full", action="store_true", help="Include durations up to 10 min.")
+    parser.add_argument("--filter", default="", help="Only run cases whose name matches this regular expression.")
+    parser.add_argument("--repeat", type=int, default=5, help="The maximum number of timed repetitions.")
+    parser.add_argument("--max-time", type=float, default=2.0, help="The time budget per case in seconds.")
+    parser.add_argument(
+        "--file-format", default="wav", help="The save_sound format, or 'null' to skip encoding and writing."
+    )
+    parser.add_argument("--save", metavar="PATH", help="Save the results as a JSON baseline.")
+    parser.add_argument("--compare", metavar="PATH", help="Compare the results with a saved baseline.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="The relative slowdown or memory growth that fails --compare."
+    )
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline["environment"]["machine"] != platform.machine():
+            print("Warning: the baseline was recorded on a different machine.", file=sys.stderr)
+
+    max_duration = max(DURATIONS) if args.full else QUICK_MAX_DURATION
+    pattern = re.compile(args.filter)
+    results: Dict[str, dict] = {}
+    regressions = []
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [
+            case for case in create_cases(max_duration, directory, args.file_format) if pattern.search(case.name)
+        ]
+        header = f"{'Case':<58} {'Best [ms]':>10} {'Msmp/s':>9} {'RTF':>9} {'Peak MB':>9}"
+        print(header + (f" {'Time':>8} {'Memory':>8}" if baseline else ""))
+        for case in cases:
+            results[case.name] = measure(case, args.repeat, args.max_time)
+            previous = baseline["results"].get(case.name) if baseline else None
+            if previous is None:
+                print_result(case.name, results[case.name])
+            elif print_result(case.name, results[case.name], previous, args.threshold):
+                regressions.append(case.name)
+
+    if args.save:
+        Path(args.save).write_text(
+            json.dumps({"environment": environment(), "results": results}, indent=2) + "\n"
+        )
+        print(f"Saved {len(results)} results to {args.save}")
+
+    if baseline is not None:
+        print(f"{len(regressions)} of {len(results)} cases regressed by more than {args.threshold:.0%}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,36 @@
+from py_synth.version import __version__
 from py_synth.synthesizer import Synthesizer
+from py_synth.audio_backend import (
+    AudioBackend,
+    AudioStream,
+    SoundDeviceBackend,
+    SoundFileBackend,
+    MemoryBackend,
+    MemoryStream,
+    NullBackend,
+)
+from py_synth.realtime import RealtimePlayer, FakeStreamBackend
+from py_synth.instrumentation import (
+    BlockEvent,
+    CallbackSink,
+    Instrumentation,
+    RenderStats,
+    StageStats,
+    StatsSink,
+)
+from py_synth.render_farm import RenderJob
+from py_synth.poly_synth import PolySynth, Voice
+from py_synth.sequencer import Instrument, Score, Sequencer
+from py_synth.midi import MidiNotes, read_midi
+from py_synth.pitch import TuningSystem, frequency_to_midi, midi_to_frequency
+from py_synth.cache import LRUCache
+from py_synth.render_cache import RenderCache
+from py_synth.overview import Overview, OverviewBuilder
+from py_synth.synthesizer_debugger import SynthesizerDebugger
 from py_synth.curve import CurveType
-from py_synth.waveform import Waveform, WaveformType
+from py_synth.modulation import LFO, Modulator, Ramp
+from py_synth.waveform import Waveform, WaveformType, Oscillator
+from py_synth.wavetable import Interpolation, Wavetable, WavetableOscillator
 from py_synth.sound import SampleRate, Sound
 from py_synth.notes import Notes
 from py_synth.frequency import (
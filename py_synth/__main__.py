@@ -0,0 +1,93 @@
+import argparse
+from pathlib import Path
+from typing import List
+import numpy as np
+
+import py_synth
+
+
+def profile(args: argparse.Namespace):
+    """
+    Renders a sound with instrumentation and prints the per-stage breakdown of each render.
+    """
+    instrumentation = py_synth.Instrumentation(trace_allocations=args.trace_allocations)
+    if args.save:
+        path = Path(args.save)
+        file_backend = py_synth.SoundFileBackend(path.parent)
+        filename, file_format = path.stem, path.suffix.lstrip(".") or "wav"
+    else:
+        file_backend = py_synth.NullBackend()
+        filename, file_format = "profile", "wav"
+
+    synth = py_synth.Synthesizer(
+        py_synth.SampleRate[args.sample_rate],
+        show=False,
+        block_size=args.block_size,
+        envelope_cache=py_synth.LRUCache() if args.envelope_cache else None,
+        band_limited=args.band_limited,
+        wavetable_size=args.wavetable_size,
+        dtype=np.dtype(args.dtype),
+        file_backend=file_backend,
+        instrumentation=instrumentation,
+    )
+    curve = py_synth.CurveType[args.curve]
+    sound = py_synth.Sound(
+        py_synth.WaveformType[args.waveform],
+        py_synth.BaseFrequency(args.frequency),
+        args.duration,
+        py_synth.ADSREnvelope(
+            attack=py_synth.AttackPercent(10, curve),
+            decay=py_synth.DecayPercent(20, curve),
+            sustain_level=py_synth.SustainLevel(0.7),
+            sustain=py_synth.SustainPercent(50),
+            release=py_synth.ReleasePercent(20, curve),
+        ),
+    )
+
+    for _ in range(args.repeat):
+        if args.operation == "render":
+            synth.render(sound)
+        else:
+            synth.save_sound(sound, filename, file_format, args.subtype)
+        print(instrumentation.last.breakdown())
+        print()
+
+
+def main(argv: List[str] = None):
+    """
+    Runs the command line interface.
+
+    Args:
+        argv (List[str]): The arguments. Defaults to the process arguments.
+    """
+    parser = argparse.ArgumentParser(prog="python -m py_synth")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("profile", help="Print the time spent in each stage of a render.")
+    command.add_argument("--operation", choices=("save", "render"), default="save")
+    command.add_argument("--waveform", choices=[item.name for item in py_synth.WaveformType], default="SINE")
+    command.add_argument("--frequency", type=float, default=440.0)
+    command.add_argument("--duration", type=float, default=10.0)
+    command.add_argument("--curve", choices=[item.name for item in py_synth.CurveType], default="LINEAR")
+    command.add_argument(
+        "--sample-rate", choices=[item.name for item in py_synth.SampleRate], default="CD_QUALITY"
+    )
+    command.add_argument("--block-size", type=int, default=py_synth.Synthesizer.BLOCK_SIZE)
+    command.add_argument("--dtype", choices=("float64", "float32"), default="float64")
+    command.add_argument("--band-limited", action="store_true")
+    command.add_argument("--wavetable-size", type=int)
+    command.add_argument("--envelope-cache", action="store_true")
+    command.add_argument("--save", metavar="PATH", help="Write the file here instead of discarding it.")
+    command.add_argument("--subtype", help="The sample encoding of the file, e.g. PCM_24.")
+    command.add_argument("--repeat", type=int, default=1, help="The number of renders.")
+    command.add_argument(
+        "--trace-allocations", action="store_true", help="Trace the peak allocated memory (slower)."
+    )
+    command.set_defaults(run=profile)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
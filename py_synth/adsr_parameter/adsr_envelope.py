@@ -1,11 +1,16 @@
+import time
 import numpy as np
 from .base_adsr_parameter import BaseADSRParameter
+from ..cache import LRUCache
 from ..curve import Curve
+from ..value_object import ValueObject
 
-class ADSREnvelope:
+class ADSREnvelope(ValueObject):
     """
     A class to encapsulate ADSR (Attack, Decay, Sustain, Release) envelope options.
 
+    Envelopes are immutable and compare by their parameters.
+
     Attributes:
         attack (BaseADSRParameter): The attack parameter.
         decay (BaseADSRParameter): The decay parameter.
@@ -14,6 +19,8 @@ class ADSREnvelope:
         sustain_level (BaseADSRParameter): The sustain level parameter.
     """
 
+    __slots__ = ("attack", "decay", "sustain", "release", "sustain_level")
+
     def __init__(
         self,
         attack: BaseADSRParameter,
@@ -32,62 +39,188 @@ class ADSREnvelope:
             release (BaseADSRParameter): The release parameter.
             sustain_level (BaseADSRParameter): The sustain level parameter.
         """
-        self.attack = attack
-        self.decay = decay
-        self.sustain = sustain
-        self.release = release
-        self.sustain_level = sustain_level
+        self._set("attack", attack)
+        self._set("decay", decay)
+        self._set("sustain", sustain)
+        self._set("release", release)
+        self._set("sustain_level", sustain_level)
+
+    def cache_key(self) -> tuple:
+        """
+        Returns a hashable key describing the envelope parameters.
 
-    def generate(self, sample_rate: int, duration: float) -> np.ndarray:
+        Returns:
+            tuple: The type, value and curve of every parameter.
+        """
+        return tuple(
+            (type(parameter).__name__, parameter.value, parameter.curve)
+            for parameter in (
+                self.attack,
+                self.decay,
+                self.sustain,
+                self.release,
+                self.sustain_level,
+            )
+        )
+
+    def generate(
+        self,
+        sample_rate: int,
+        duration: float,
+        cache: LRUCache = None,
+        dtype=np.float64,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
         """
         Generates an ADSR envelope.
 
         Args:
             sample_rate (int): The sample rate in Hz.
             duration (float): The duration of the sound in seconds.
+            cache (LRUCache): A cache to look the envelope up in. Cached envelopes are read-only.
+            dtype (np.dtype): The floating point type of the envelope (float32 or float64).
+            out (np.ndarray): A buffer to write the envelope into. Its dtype overrides dtype.
 
         Returns:
             np.ndarray: The generated ADSR envelope.
         """
         num_samples = int(sample_rate * duration)
-        envelope_array = np.zeros(num_samples)
-        
+        if cache is None:
+            return self.generate_block(
+                sample_rate, duration, 0, num_samples, dtype, out
+            )
+
+        dtype = np.dtype(dtype) if out is None else out.dtype
+        envelope_array = cache.get_or_create(
+            (self.cache_key(), sample_rate, duration, dtype),
+            lambda: self.generate_block(sample_rate, duration, 0, num_samples, dtype),
+        )
+        if out is None:
+            return envelope_array
+        np.copyto(out, envelope_array)
+        return out
+
+    def generate_block(
+        self,
+        sample_rate: int,
+        duration: float,
+        offset: int,
+        num_samples: int,
+        dtype=np.float64,
+        out: np.ndarray = None,
+        stats=None,
+    ) -> np.ndarray:
+        """
+        Generates a block of an ADSR envelope.
+
+        The result equals ``generate(sample_rate, duration)[offset:offset + num_samples]``,
+        but only the samples inside the block are computed.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            duration (float): The duration of the sound in seconds.
+            offset (int): The index of the first sample of the block.
+            num_samples (int): The number of samples in the block.
+            dtype (np.dtype): The floating point type of the envelope (float32 or float64).
+            out (np.ndarray): A buffer of num_samples samples to write the block into.
+                Its dtype overrides dtype.
+            stats (RenderStats): The render stats that the time spent shaping curves is added
+                to as the 'curve' stage, or None.
+
+        Returns:
+            np.ndarray: The generated block of the ADSR envelope.
+        """
+        if out is None:
+            curve = Curve(sample_rate, dtype)
+            envelope_array = np.zeros(num_samples, dtype=curve.dtype)
+        else:
+            curve = Curve(sample_rate, out.dtype)
+            envelope_array = out
+            envelope_array.fill(0.0)
+        block_end = offset + num_samples
+        curve_seconds = 0.0
+        curve_samples = 0
+
+        for segment_start, length, curve_type, start, end in self.segments(
+            sample_rate, duration
+        ):
+            first = max(segment_start, offset)
+            last = min(segment_start + length, block_end)
+            if first >= last:
+                continue
+
+            if curve_type is None:
+                envelope_array[first - offset:last - offset] = start
+            else:
+                if stats is not None:
+                    started = time.perf_counter()
+                curve.apply_curve_segment(
+                    curve_type,
+                    length,
+                    first - segment_start,
+                    last - first,
+                    start,
+                    end,
+                    out=envelope_array[first - offset:last - offset],
+                )
+                if stats is not None:
+                    curve_seconds += time.perf_counter() - started
+                    curve_samples += last - first
+
+        if curve_samples:
+            stats.add("curve", curve_seconds, curve_samples)
+        return envelope_array
+
+    def segments(self, sample_rate: int, duration: float) -> list:
+        """
+        Returns the sample ranges of the envelope phases in the order they are applied.
+
+        Each segment is a tuple ``(start_index, length, curve_type, start_level, end_level)``.
+        The sustain segment has no curve type and holds ``start_level``. Samples not covered
+        by any segment are silent, and later segments overwrite earlier ones.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            duration (float): The duration of the sound in seconds.
+
+        Returns:
+            list: The envelope segments.
+        """
+        num_samples = int(sample_rate * duration)
         attack_samples = int(self.attack.get_value(duration) * sample_rate)
         decay_samples = int(self.decay.get_value(duration) * sample_rate)
         sustain_samples = int(self.sustain.get_value(duration) * sample_rate)
         release_samples = int(self.release.get_value(duration) * sample_rate)
+        sustain_level = self.sustain_level.get_value(duration)
 
-        curve = Curve(sample_rate)
-
+        segments = []
         current_position = 0
 
         if attack_samples > 0:
-            envelope_array[:attack_samples] = curve.apply_curve(
-                self.attack.curve, attack_samples, start=0, end=1
-            )
+            segments.append((0, attack_samples, self.attack.curve, 0, 1))
             current_position += attack_samples
 
         if decay_samples > 0:
-            envelope_array[current_position:current_position + decay_samples] = (
-                curve.apply_curve(
-                    self.decay.curve,
-                    decay_samples,
-                    start=1,
-                    end=self.sustain_level.get_value(duration),
-                )
+            segments.append(
+                (current_position, decay_samples, self.decay.curve, 1, sustain_level)
             )
             current_position += decay_samples
 
         if sustain_samples > 0:
-            envelope_array[current_position:current_position + sustain_samples] = self.sustain_level.get_value(duration)
+            segments.append(
+                (current_position, sustain_samples, None, sustain_level, sustain_level)
+            )
             current_position += sustain_samples
 
         if release_samples > 0:
-            envelope_array[-release_samples:] = curve.apply_curve(
-                self.release.curve,
-                release_samples,
-                start=self.sustain_level.get_value(duration),
-                end=0,
+            segments.append(
+                (
+                    num_samples - release_samples,
+                    release_samples,
+                    self.release.curve,
+                    sustain_level,
+                    0,
+                )
             )
 
-        return envelope_array
+        return segments
@@ -11,6 +11,8 @@ class Attack(BaseADSRParameter):
         curve (CurveType): The curve type for the attack phase.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float, curve: CurveType):
         """
         Initializes the Attack object.
@@ -21,8 +23,7 @@ class Attack(BaseADSRParameter):
         """
         if value < 0:
             raise ValueError("Attack time must be positive.")
-        super().__init__(value)
-        self.curve = curve
+        super().__init__(value, curve)
 
 
 class AttackPercent(BaseADSRParameter):
@@ -34,6 +35,8 @@ class AttackPercent(BaseADSRParameter):
         curve (CurveType): The curve type for the attack phase.
     """
 
+    __slots__ = ()
+
     def __init__(self, percent: float, curve: CurveType):
         """
         Initializes the AttackPercent object.
@@ -44,8 +47,7 @@ class AttackPercent(BaseADSRParameter):
         """
         if not 0 <= percent <= 100:
             raise ValueError("Attack percent must be between 0 and 100.")
-        super().__init__(percent)
-        self.curve = curve
+        super().__init__(percent, curve)
 
     def get_value(self, duration: float) -> float:
         """
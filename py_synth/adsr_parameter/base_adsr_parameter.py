@@ -1,10 +1,13 @@
 from ..curve import CurveType
+from ..value_object import ValueObject
 
 
-class BaseADSRParameter:
+class BaseADSRParameter(ValueObject):
+    __slots__ = ("value", "curve")
+
     def __init__(self, value: float, curve: CurveType = CurveType.LINEAR):
-        self.value = value
-        self.curve = curve
+        self._set("value", value)
+        self._set("curve", curve)
 
     def get_value(self, duration: float) -> float:
         return self.value
@@ -11,6 +11,8 @@ class Decay(BaseADSRParameter):
         curve (CurveType): The curve type for the decay phase.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float, curve: CurveType):
         """
         Initializes the Decay object.
@@ -21,8 +23,7 @@ class Decay(BaseADSRParameter):
         """
         if value < 0:
             raise ValueError("Decay time must be positive.")
-        super().__init__(value)
-        self.curve = curve
+        super().__init__(value, curve)
 
 
 class DecayPercent(BaseADSRParameter):
@@ -34,6 +35,8 @@ class DecayPercent(BaseADSRParameter):
         curve (CurveType): The curve type for the decay phase.
     """
 
+    __slots__ = ()
+
     def __init__(self, percent: float, curve: CurveType):
         """
         Initializes the DecayPercent object.
@@ -44,8 +47,7 @@ class DecayPercent(BaseADSRParameter):
         """
         if not 0 <= percent <= 100:
             raise ValueError("Decay percent must be between 0 and 100.")
-        super().__init__(percent)
-        self.curve = curve
+        super().__init__(percent, curve)
 
     def get_value(self, duration: float) -> float:
         """
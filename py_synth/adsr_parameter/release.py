@@ -11,6 +11,8 @@ class Release(BaseADSRParameter):
         curve (CurveType): The curve type for the release time.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float, curve: CurveType = CurveType.LINEAR):
         """
         Initializes the Release object.
@@ -33,6 +35,8 @@ class ReleasePercent(BaseADSRParameter):
         curve (CurveType): The curve type for the release time.
     """
 
+    __slots__ = ()
+
     def __init__(self, percent: float, curve: CurveType = CurveType.LINEAR):
         """
         Initializes the ReleasePercent object.
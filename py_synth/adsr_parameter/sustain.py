@@ -11,6 +11,8 @@ class Sustain(BaseADSRParameter):
         curve (CurveType): The curve type for the sustain time.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float, curve: CurveType = CurveType.LINEAR):
         """
         Initializes the Sustain object.
@@ -33,6 +35,8 @@ class SustainPercent(BaseADSRParameter):
         curve (CurveType): The curve type for the sustain time.
     """
 
+    __slots__ = ()
+
     def __init__(self, percent: float, curve: CurveType = CurveType.LINEAR):
         """
         Initializes the SustainPercent object.
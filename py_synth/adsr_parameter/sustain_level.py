@@ -11,6 +11,8 @@ class SustainLevel(BaseADSRParameter):
         curve (CurveType): The curve type for the sustain level.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float, curve: CurveType = CurveType.LINEAR):
         """
         Initializes the SustainLevel object.
@@ -0,0 +1,357 @@
+from abc import ABC, abstractmethod
+import io
+from pathlib import Path
+from typing import List, Optional, Union
+import numpy as np
+
+from .overview import Overview
+
+
+class AudioStream(ABC):
+    """
+    A destination that audio blocks are written to, used as a context manager.
+
+    Subclasses implement ``write``.
+    """
+
+    @abstractmethod
+    def write(self, block: np.ndarray):
+        """
+        Writes the next block of audio.
+
+        Args:
+            block (np.ndarray): A one-dimensional block of samples.
+        """
+
+    def close(self):
+        """
+        Finishes the stream. Called once after the last block.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+class AudioBackend(ABC):
+    """
+    The interface for the destinations of rendered audio.
+
+    A Synthesizer uses one backend for playback and one for saving files, both chosen
+    when it is constructed. Subclasses implement ``open``.
+
+    Attributes:
+        shared_across_processes (bool): Whether copies of the backend in worker processes
+            deliver their output to the same place as the original, e.g. files on disk.
+            Synthesizer.render_many only renders on worker processes for such backends.
+    """
+
+    shared_across_processes = False
+
+    @abstractmethod
+    def open(
+        self,
+        sample_rate: int,
+        name: str = None,
+        file_format: str = None,
+        subtype: str = None,
+    ) -> AudioStream:
+        """
+        Opens a mono stream for one sound.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            name (str): The name of the sound, e.g. the file name without extension.
+            file_format (str): The file format (e.g., 'wav', 'flac', 'ogg'), or None for playback.
+            subtype (str): The sample encoding of the file (e.g., 'PCM_16', 'PCM_24', 'FLOAT').
+                Defaults to the default subtype of the format.
+
+        Returns:
+            AudioStream: The stream to write the blocks of the sound to.
+        """
+
+    def save_overview(self, overview: Overview, name: str, file_format: str):
+        """
+        Stores the overview of a file next to it. Backends without files ignore it.
+
+        Args:
+            overview (Overview): The overview of the file.
+            name (str): The name the file was opened with.
+            file_format (str): The format the file was opened with.
+        """
+
+
+class SoundDeviceBackend(AudioBackend):
+    """
+    Plays audio on the default output device through sounddevice.
+
+    sounddevice, which initializes PortAudio, is imported when the first stream is opened.
+    """
+
+    def open(
+        self,
+        sample_rate: int,
+        name: str = None,
+        file_format: str = None,
+        subtype: str = None,
+    ) -> AudioStream:
+        return _SoundDeviceStream(sample_rate)
+
+
+class SoundFileBackend(AudioBackend):
+    """
+    Writes audio files to a directory through soundfile.
+
+    Attributes:
+        directory (Path): The directory the files are written to. It is created when the first file is written.
+    """
+
+    shared_across_processes = True
+
+    def __init__(self, directory: Union[str, Path] = None):
+        """
+        Initializes the SoundFileBackend object.
+
+        Args:
+            directory (Union[str, Path]): The output directory. Defaults to the files directory next to the package.
+        """
+        if directory is None:
+            directory = Path(__file__).resolve().parent.parent / "files"
+        self.directory = Path(directory)
+
+    def open(
+        self,
+        sample_rate: int,
+        name: str = None,
+        file_format: str = None,
+        subtype: str = None,
+    ) -> AudioStream:
+        import soundfile as sf
+
+        if name is None or file_format is None:
+            raise ValueError("A file name and format are required to write a file.")
+        _check_format(file_format, subtype)
+
+        self.directory.mkdir(exist_ok=True, parents=True)
+        return _SoundFileStream(
+            sf.SoundFile(
+                self.directory / f"{name}.{file_format}",
+                mode="w",
+                samplerate=sample_rate,
+                channels=1,
+                format=file_format.upper(),
+                subtype=subtype,
+            )
+        )
+
+    def save_overview(self, overview: Overview, name: str, file_format: str):
+        overview.save(self.overview_path(name, file_format))
+
+    def overview_path(self, name: str, file_format: str) -> Path:
+        """
+        Returns the path of the overview sidecar of a file, e.g. 'song.wav.overview.npz'.
+
+        Args:
+            name (str): The name of the file without extension.
+            file_format (str): The format of the file.
+
+        Returns:
+            Path: The path of the sidecar.
+        """
+        return self.directory / f"{name}.{file_format}.overview.npz"
+
+
+class MemoryBackend(AudioBackend):
+    """
+    Keeps everything written to it in memory, so output can be inspected without a device or disk.
+
+    Attributes:
+        streams (List[MemoryStream]): The streams opened through this backend.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty MemoryBackend object.
+        """
+        self.streams: List[MemoryStream] = []
+
+    def open(
+        self,
+        sample_rate: int,
+        name: str = None,
+        file_format: str = None,
+        subtype: str = None,
+    ) -> AudioStream:
+        stream = MemoryStream(sample_rate, name, file_format, subtype)
+        self.streams.append(stream)
+        return stream
+
+    def save_overview(self, overview: Overview, name: str, file_format: str):
+        for stream in reversed(self.streams):
+            if stream.name == name and stream.file_format == file_format:
+                stream.overview = overview
+                return
+
+
+class NullBackend(AudioBackend):
+    """
+    Discards all audio, counting the frames written.
+
+    Attributes:
+        frames (int): The total number of frames written to the backend.
+    """
+
+    def __init__(self):
+        """
+        Initializes the NullBackend object.
+        """
+        self.frames = 0
+
+    def open(
+        self,
+        sample_rate: int,
+        name: str = None,
+        file_format: str = None,
+        subtype: str = None,
+    ) -> AudioStream:
+        return _NullStream(self)
+
+
+class MemoryStream(AudioStream):
+    """
+    A stream that keeps copies of its blocks and, for file formats, the encoded file.
+
+    Attributes:
+        sample_rate (int): The sample rate in Hz.
+        name (str): The name the stream was opened with.
+        file_format (str): The file format the stream was opened with, or None for playback.
+        subtype (str): The sample encoding the stream was opened with, or None for the default.
+        blocks (List[np.ndarray]): Copies of the blocks written.
+        data (Optional[bytes]): The encoded file once the stream is closed, or None for playback.
+        overview (Optional[Overview]): The overview saved for the stream, if any.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        name: str = None,
+        file_format: str = None,
+        subtype: str = None,
+    ):
+        """
+        Initializes the MemoryStream object.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            name (str): The name of the sound.
+            file_format (str): The file format to encode, or None to only keep the samples.
+            subtype (str): The sample encoding of the file. Defaults to the default subtype of the format.
+        """
+        self.sample_rate = sample_rate
+        self.name = name
+        self.file_format = file_format
+        self.subtype = subtype
+        self.blocks: List[np.ndarray] = []
+        self.data: Optional[bytes] = None
+        self.overview: Optional[Overview] = None
+
+        self._file = None
+        if file_format is not None:
+            import soundfile as sf
+
+            _check_format(file_format, subtype)
+            self._buffer = io.BytesIO()
+            self._file = sf.SoundFile(
+                self._buffer,
+                mode="w",
+                samplerate=sample_rate,
+                channels=1,
+                format=file_format.upper(),
+                subtype=subtype,
+            )
+
+    @property
+    def audio(self) -> np.ndarray:
+        """
+        Returns all blocks written as one array.
+        """
+        if not self.blocks:
+            return np.zeros(0)
+        return np.concatenate(self.blocks)
+
+    def write(self, block: np.ndarray):
+        self.blocks.append(block.copy())
+        if self._file is not None:
+            self._file.write(block)
+
+    def close(self):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+            self.data = self._buffer.getvalue()
+
+
+def _check_format(file_format: str, subtype: str = None):
+    """
+    Raises a ValueError if soundfile cannot write the format and subtype.
+    """
+    import soundfile as sf
+
+    if not sf.check_format(file_format.upper(), subtype):
+        if subtype is None:
+            raise ValueError(f"Unsupported file format: {file_format}")
+        raise ValueError(f"Subtype {subtype} is not supported for {file_format} files.")
+
+
+class _SoundDeviceStream(AudioStream):
+    """
+    Writes blocks to a blocking sounddevice output stream as float32 frames.
+    """
+
+    def __init__(self, sample_rate: int):
+        # Imported on first playback: loading sounddevice initializes PortAudio.
+        import sounddevice as sd
+
+        self._stream = sd.OutputStream(samplerate=sample_rate, channels=1)
+        self._stream.start()
+        self._output = np.empty((0, 1), dtype=np.float32)
+
+    def write(self, block: np.ndarray):
+        if len(self._output) < len(block):
+            self._output = np.empty((len(block), 1), dtype=np.float32)
+        output = self._output[:len(block)]
+        output[:, 0] = block
+        self._stream.write(output)
+
+    def close(self):
+        self._stream.stop()
+        self._stream.close()
+
+
+class _SoundFileStream(AudioStream):
+    """
+    Writes blocks to an open soundfile.SoundFile.
+    """
+
+    def __init__(self, file):
+        self._file = file
+
+    def write(self, block: np.ndarray):
+        self._file.write(block)
+
+    def close(self):
+        self._file.close()
+
+
+class _NullStream(AudioStream):
+    """
+    Discards blocks, counting their frames on the backend.
+    """
+
+    def __init__(self, backend: NullBackend):
+        self._backend = backend
+
+    def write(self, block: np.ndarray):
+        self._backend.frames += len(block)
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+import threading
+from typing import Callable, Hashable, Optional
+import numpy as np
+
+
+class LRUCache:
+    """
+    A bounded least-recently-used cache of read-only NumPy arrays.
+
+    Attributes:
+        max_bytes (int): The maximum total size of the cached arrays in bytes.
+        nbytes (int): The current total size of the cached arrays in bytes.
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that found no entry.
+        evictions (int): The number of entries removed to stay within the byte budget.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initializes the LRUCache object.
+
+        Args:
+            max_bytes (int): The maximum total size of the cached arrays in bytes. Should not be negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache size must not be negative.")
+
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __getstate__(self) -> dict:
+        # Caches are copied empty, e.g. when a Synthesizer is sent to a worker process.
+        return {"max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state["max_bytes"])
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Looks up an array and marks it as most recently used.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Optional[np.ndarray]: The cached array, or None if the key is not cached.
+        """
+        with self._lock:
+            array = self._entries.get(key)
+            if array is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return array
+
+    def put(self, key: Hashable, array: np.ndarray) -> np.ndarray:
+        """
+        Stores an array, evicting the least recently used entries to stay within the budget.
+
+        Arrays larger than the whole budget are not stored and are returned unchanged.
+
+        Args:
+            key (Hashable): The cache key.
+            array (np.ndarray): The array to store. It is made read-only if it is stored.
+
+        Returns:
+            np.ndarray: The array, read-only if it was stored.
+        """
+        if array.nbytes > self.max_bytes:
+            return array
+
+        array.setflags(write=False)
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key).nbytes
+
+            while self._entries and self.nbytes + array.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+
+            self._entries[key] = array
+            self.nbytes += array.nbytes
+
+        return array
+
+    def get_or_create(
+        self, key: Hashable, factory: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Returns the cached array for a key, creating and storing it on a miss.
+
+        Args:
+            key (Hashable): The cache key.
+            factory (Callable[[], np.ndarray]): Creates the array on a miss.
+
+        Returns:
+            np.ndarray: The array, read-only if it is cached.
+        """
+        array = self.get(key)
+        if array is None:
+            array = self.put(key, factory())
+        return array
+
+    def clear(self):
+        """
+        Removes all entries and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
@@ -1,6 +1,9 @@
 from enum import Enum, auto
 import numpy as np
 
+from .cache import LRUCache
+from .waveform import check_dtype
+
 
 class CurveType(Enum):
     """
@@ -22,21 +25,35 @@ class Curve:
     """
     A class to generate various curves.
 
+    Normalized 0 -> 1 curve shapes are cached per (CurveType, length, dtype) in ``shape_cache``,
+    which is shared by all instances, and rescaled to the requested start and end values.
+
     Attributes:
         sample_rate (int): The sample rate in Hz.
+        dtype (np.dtype): The floating point type of the generated curves.
+        shape_cache (LRUCache): The cache of normalized curve shapes.
     """
 
-    def __init__(self, sample_rate: int):
+    shape_cache = LRUCache(max_bytes=16 * 1024 * 1024)
+
+    def __init__(self, sample_rate: int, dtype=np.float64):
         """
         Initializes the Curve object with a sample rate.
 
         Args:
             sample_rate (int): The sample rate in Hz.
+            dtype (np.dtype): The floating point type of the generated curves (float32 or float64).
         """
         self.sample_rate = sample_rate
+        self.dtype = check_dtype(dtype)
 
     def apply_curve(
-        self, curve_type: CurveType, length: int, start: float = 0.0, end: float = 1.0
+        self,
+        curve_type: CurveType,
+        length: int,
+        start: float = 0.0,
+        end: float = 1.0,
+        out: np.ndarray = None,
     ) -> np.ndarray:
         """
         Applies the specified curve to a range.
@@ -46,30 +63,78 @@ class Curve:
             length (int): The number of samples in the curve.
             start (float): The starting value of the curve.
             end (float): The ending value of the curve.
+            out (np.ndarray): A buffer of length samples to write the curve into.
 
         Returns:
             np.ndarray: The generated curve.
         """
-        if curve_type == CurveType.LINEAR:
-            return self.linear_curve(length, start, end)
-        elif curve_type == CurveType.EXPONENTIAL:
-            return self.exponential_curve(length, start, end)
-        elif curve_type == CurveType.LOGARITHMIC:
-            return self.logarithmic_curve(length, start, end)
-        elif curve_type == CurveType.SINE:
-            return self.sine_curve(length, start, end)
-        elif curve_type == CurveType.QUADRATIC:
-            return self.quadratic_curve(length, start, end)
-        elif curve_type == CurveType.CUBIC:
-            return self.cubic_curve(length, start, end)
-        elif curve_type == CurveType.SIGMOID:
-            return self.sigmoid_curve(length, start, end)
-        elif curve_type == CurveType.INVERSE_EXPONENTIAL:
-            return self.inverse_exponential_curve(length, start, end)
-        elif curve_type == CurveType.TANH:
-            return self.tanh_curve(length, start, end)
+        return self.apply_curve_segment(curve_type, length, 0, length, start, end, out)
+
+    def apply_curve_segment(
+        self,
+        curve_type: CurveType,
+        length: int,
+        offset: int,
+        count: int,
+        start: float = 0.0,
+        end: float = 1.0,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Generates a slice of a curve without generating the samples before it.
+
+        The result equals ``apply_curve(curve_type, length, start, end)[offset:offset + count]``,
+        which lets block-based renderers evaluate long curves piece by piece.
+
+        Args:
+            curve_type (CurveType): The type of curve to apply.
+            length (int): The number of samples in the full curve.
+            offset (int): The index of the first sample to generate.
+            count (int): The number of samples to generate.
+            start (float): The starting value of the curve.
+            end (float): The ending value of the curve.
+            out (np.ndarray): A buffer of count samples to write the segment into. When the
+                normalized shape is cached, nothing else is allocated.
+
+        Returns:
+            np.ndarray: The generated curve segment.
+        """
+        if curve_type not in _SHAPES:
+            raise ValueError("Unknown curve type")
+
+        key = (curve_type, length, self.dtype)
+        shape = self.shape_cache.get(key)
+        if shape is None and length * self.dtype.itemsize <= self.shape_cache.max_bytes:
+            shape = self.shape_cache.put(
+                key, _evaluate_shape(curve_type, length, 0, length, self.dtype)
+            )
+
+        if shape is not None:
+            shape = shape[offset:offset + count]
         else:
+            shape = _evaluate_shape(curve_type, length, offset, count, self.dtype)
+
+        if out is None:
+            out = np.empty(count, dtype=self.dtype)
+        np.multiply(shape, float(end) - float(start), out=out)
+        out += float(start)
+        return out
+
+    @staticmethod
+    def shape(curve_type: CurveType, x: np.ndarray) -> np.ndarray:
+        """
+        Evaluates a normalized 0 -> 1 curve at arbitrary positions.
+
+        Args:
+            curve_type (CurveType): The type of curve to evaluate.
+            x (np.ndarray): The positions along the curve, from 0.0 (start) to 1.0 (end).
+
+        Returns:
+            np.ndarray: The curve values, from 0.0 at the start to 1.0 at the end.
+        """
+        if curve_type not in _SHAPES:
             raise ValueError("Unknown curve type")
+        return _SHAPES[curve_type](x)
 
     def linear_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -83,7 +148,7 @@ class Curve:
         Returns:
             np.ndarray: The generated linear curve.
         """
-        return np.linspace(start, end, length)
+        return self.apply_curve(CurveType.LINEAR, length, start, end)
 
     def exponential_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -97,9 +162,7 @@ class Curve:
         Returns:
             np.ndarray: The generated exponential curve.
         """
-        return start + (end - start) * (np.exp(np.linspace(0, 1, length)) - 1) / (
-            np.e - 1
-        )
+        return self.apply_curve(CurveType.EXPONENTIAL, length, start, end)
 
     def logarithmic_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -113,9 +176,7 @@ class Curve:
         Returns:
             np.ndarray: The generated logarithmic curve.
         """
-        return start + (end - start) * (np.log(np.linspace(1, np.e, length))) / np.log(
-            np.e
-        )
+        return self.apply_curve(CurveType.LOGARITHMIC, length, start, end)
 
     def sine_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -129,12 +190,7 @@ class Curve:
         Returns:
             np.ndarray: The generated sine curve.
         """
-        return (
-            start
-            + (end - start)
-            * (np.sin(np.linspace(-np.pi / 2, np.pi / 2, length)) + 1)
-            / 2
-        )
+        return self.apply_curve(CurveType.SINE, length, start, end)
 
     def quadratic_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -148,7 +204,7 @@ class Curve:
         Returns:
             np.ndarray: The generated quadratic curve.
         """
-        return start + (end - start) * (np.linspace(0, 1, length) ** 2)
+        return self.apply_curve(CurveType.QUADRATIC, length, start, end)
 
     def cubic_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -162,7 +218,7 @@ class Curve:
         Returns:
             np.ndarray: The generated cubic curve.
         """
-        return start + (end - start) * (np.linspace(0, 1, length) ** 3)
+        return self.apply_curve(CurveType.CUBIC, length, start, end)
 
     def sigmoid_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -176,8 +232,7 @@ class Curve:
         Returns:
             np.ndarray: The generated sigmoid curve.
         """
-        t = np.linspace(-6, 6, length)
-        return start + (end - start) / (1 + np.exp(-t))
+        return self.apply_curve(CurveType.SIGMOID, length, start, end)
 
     def inverse_exponential_curve(
         self, length: int, start: float, end: float
@@ -193,7 +248,7 @@ class Curve:
         Returns:
             np.ndarray: The generated inverse exponential curve.
         """
-        return start + (end - start) * (1 - np.exp(-np.linspace(0, 5, length)))
+        return self.apply_curve(CurveType.INVERSE_EXPONENTIAL, length, start, end)
 
     def tanh_curve(self, length: int, start: float, end: float) -> np.ndarray:
         """
@@ -207,5 +262,40 @@ class Curve:
         Returns:
             np.ndarray: The generated tanh curve.
         """
-        t = np.linspace(-3, 3, length)
-        return start + (end - start) * (np.tanh(t) + 1) / 2
+        return self.apply_curve(CurveType.TANH, length, start, end)
+
+
+def _evaluate_shape(
+    curve_type: CurveType, length: int, offset: int, count: int, dtype=np.float64
+) -> np.ndarray:
+    """
+    Evaluates samples [offset, offset + count) of a normalized curve of the given length.
+    """
+    x = np.arange(offset, offset + count, dtype=dtype)
+    if length > 1:
+        x /= length - 1
+    else:
+        x[:] = 0.0
+    return _SHAPES[curve_type](x)
+
+
+def _sigmoid_shape(x: np.ndarray) -> np.ndarray:
+    return 1 / (1 + np.exp(-(12 * x - 6)))
+
+
+def _tanh_shape(x: np.ndarray) -> np.ndarray:
+    return (np.tanh(6 * x - 3) + 1) / 2
+
+
+# Normalized curve shapes, mapping positions in [0, 1] onto the 0 -> 1 range.
+_SHAPES = {
+    CurveType.LINEAR: lambda x: x,
+    CurveType.EXPONENTIAL: lambda x: (np.exp(x) - 1) / (np.e - 1),
+    CurveType.LOGARITHMIC: lambda x: np.log(1 + (np.e - 1) * x),
+    CurveType.SINE: lambda x: (np.sin(np.pi * x - np.pi / 2) + 1) / 2,
+    CurveType.QUADRATIC: lambda x: x**2,
+    CurveType.CUBIC: lambda x: x**3,
+    CurveType.SIGMOID: _sigmoid_shape,
+    CurveType.INVERSE_EXPONENTIAL: lambda x: 1 - np.exp(-5 * x),
+    CurveType.TANH: _tanh_shape,
+}
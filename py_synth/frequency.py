@@ -1,11 +1,18 @@
-class BaseFrequency:
+from .value_object import ValueObject
+
+
+class BaseFrequency(ValueObject):
     """
     A base class to encapsulate frequency options.
 
+    Frequencies are immutable and compare by type and value.
+
     Attributes:
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: float):
         """
         Initializes the BaseFrequency object.
@@ -13,7 +20,7 @@ class BaseFrequency:
         Args:
             value (float): The frequency value in Hz.
         """
-        self.value = value
+        self._set("value", value)
 
 
 class CommonFrequency(BaseFrequency):
@@ -24,6 +31,8 @@ class CommonFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the CommonFrequency object.
@@ -44,6 +53,8 @@ class FullRangeFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the FullRangeFrequency object.
@@ -64,6 +75,8 @@ class SubsonicFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the SubsonicFrequency object.
@@ -84,6 +97,8 @@ class UltrasonicFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the UltrasonicFrequency object.
@@ -122,6 +137,8 @@ class BassFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the BassFrequency object.
@@ -142,6 +159,8 @@ class LowFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the LowFrequency object.
@@ -162,6 +181,8 @@ class MidFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the MidFrequency object.
@@ -182,6 +203,8 @@ class HighFrequency(BaseFrequency):
         value (float): The frequency value in Hz.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: float):
         """
         Initializes the HighFrequency object.
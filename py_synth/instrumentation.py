@@ -0,0 +1,353 @@
+import threading
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+
+# The stages of a render, in the order they run for each block. "curve" is the curve
+# shaping inside the envelope, and "envelope" is the rest of it.
+STAGES = ("oscillator", "envelope", "curve", "mix", "output")
+
+# The stats of the renders whose allocations are being traced, on any thread. tracemalloc
+# has a single process-wide peak, so before a render resets it, and when a render finishes,
+# the peak is handed to every other traced render. The lock guards the list, the peak and
+# whether tracing was started here.
+_traced_renders: List["RenderStats"] = []
+_traced_lock = threading.Lock()
+_started_tracing = False
+
+
+class StageStats:
+    """
+    A class to accumulate the time spent in one stage of a render.
+
+    Attributes:
+        name (str): The name of the stage.
+        calls (int): The number of blocks the stage processed.
+        seconds (float): The total wall time spent in the stage.
+        samples (int): The total number of samples the stage processed.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initializes an empty StageStats object.
+
+        Args:
+            name (str): The name of the stage.
+        """
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.samples = 0
+
+    @property
+    def samples_per_second(self) -> float:
+        """
+        Returns the throughput of the stage, or 0.0 if it took no measurable time.
+        """
+        return self.samples / self.seconds if self.seconds > 0 else 0.0
+
+
+class BlockEvent:
+    """
+    A class to describe one finished block.
+
+    Attributes:
+        index (int): The index of the block in the render.
+        samples (int): The number of samples in the block.
+        latency (float): The wall time from requesting the block until it was delivered, in seconds.
+    """
+
+    def __init__(self, index: int, samples: int, latency: float):
+        """
+        Initializes the BlockEvent object.
+
+        Args:
+            index (int): The index of the block in the render.
+            samples (int): The number of samples in the block.
+            latency (float): The wall time from requesting the block until it was delivered, in seconds.
+        """
+        self.index = index
+        self.samples = samples
+        self.latency = latency
+
+
+class RenderStats:
+    """
+    A class to hold the measurements of one render.
+
+    Attributes:
+        operation (str): The Synthesizer method that rendered, e.g. 'render' or 'save_sound'.
+        sample_rate (int): The sample rate in Hz.
+        samples (int): The number of samples rendered.
+        seconds (float): The wall time of the whole render.
+        stages (Dict[str, StageStats]): The time spent in each stage.
+        block_samples (array): The size of each block.
+        block_latencies (array): The latency of each block in seconds.
+        allocated_bytes (int): The peak memory allocated during the render, or None when
+            allocations are not traced.
+    """
+
+    def __init__(self, operation: str, sample_rate: int):
+        """
+        Initializes an empty RenderStats object.
+
+        Args:
+            operation (str): The Synthesizer method that renders.
+            sample_rate (int): The sample rate in Hz.
+        """
+        self.operation = operation
+        self.sample_rate = sample_rate
+        self.samples = 0
+        self.seconds = 0.0
+        self.stages: Dict[str, StageStats] = {name: StageStats(name) for name in STAGES}
+        self.block_samples = array("q")
+        self.block_latencies = array("d")
+        self.allocated_bytes: Optional[int] = None
+
+        self._started = 0.0
+        self._traced_start = 0
+        self._traced_peak = 0
+
+    def add(self, stage: str, seconds: float, samples: int):
+        """
+        Records the time one stage spent on a block.
+
+        Args:
+            stage (str): The name of the stage.
+            seconds (float): The wall time spent.
+            samples (int): The number of samples processed.
+        """
+        stats = self.stages[stage]
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.samples += samples
+
+    @property
+    def audio_seconds(self) -> float:
+        """
+        Returns the duration of the rendered audio in seconds.
+        """
+        return self.samples / self.sample_rate
+
+    @property
+    def samples_per_second(self) -> float:
+        """
+        Returns the number of samples rendered per second of wall time.
+        """
+        return self.samples / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def real_time_factor(self) -> float:
+        """
+        Returns the wall time divided by the audio duration. Below 1.0 is faster than real time.
+        """
+        return self.seconds / self.audio_seconds if self.samples else 0.0
+
+    @property
+    def max_block_latency(self) -> float:
+        """
+        Returns the latency of the slowest block in seconds.
+        """
+        return max(self.block_latencies, default=0.0)
+
+    def breakdown(self) -> str:
+        """
+        Formats the measurements as a table with one row per stage.
+
+        Returns:
+            str: The table.
+        """
+        lines = [
+            f"{self.operation}: {self.samples} samples ({self.audio_seconds:.3f} s of audio) "
+            f"in {self.seconds * 1e3:.2f} ms, real-time factor {self.real_time_factor:.4f}",
+            f"{'Stage':<12} {'Blocks':>7} {'Time [ms]':>10} {'Share':>6} {'Msamples/s':>11}",
+        ]
+        for stage in self.stages.values():
+            share = stage.seconds / self.seconds if self.seconds > 0 else 0.0
+            lines.append(
+                f"{stage.name:<12} {stage.calls:>7} {stage.seconds * 1e3:>10.2f} {share:>6.1%} "
+                f"{stage.samples_per_second / 1e6:>11.2f}"
+            )
+        # Setup, caching and opening or closing the output are not part of any stage.
+        other = max(self.seconds - sum(stage.seconds for stage in self.stages.values()), 0.0)
+        share = other / self.seconds if self.seconds > 0 else 0.0
+        lines.append(f"{'other':<12} {'':>7} {other * 1e3:>10.2f} {share:>6.1%}")
+
+        if self.block_latencies:
+            latencies = np.frombuffer(self.block_latencies, dtype=np.float64) * 1e3
+            lines.append(
+                f"Blocks: {len(latencies)} of up to {max(self.block_samples)} samples, latency "
+                f"mean {latencies.mean():.3f} ms, p99 {np.percentile(latencies, 99):.3f} ms, "
+                f"max {latencies.max():.3f} ms"
+            )
+        if self.allocated_bytes is not None:
+            lines.append(f"Allocated: {self.allocated_bytes / 1024:.1f} KiB peak")
+        return "\n".join(lines)
+
+
+class StatsSink:
+    """
+    The interface for receivers of render measurements, e.g. to export them to a metrics system.
+    """
+
+    def block(self, stats: RenderStats, event: BlockEvent):
+        """
+        Called after each block has been delivered.
+
+        Args:
+            stats (RenderStats): The measurements of the render so far.
+            event (BlockEvent): The finished block.
+        """
+
+    def render(self, stats: RenderStats):
+        """
+        Called once when a render has finished.
+
+        Args:
+            stats (RenderStats): The measurements of the render.
+        """
+
+
+class CallbackSink(StatsSink):
+    """
+    Passes render measurements to plain functions.
+    """
+
+    def __init__(
+        self,
+        on_render: Callable[[RenderStats], None] = None,
+        on_block: Callable[[RenderStats, BlockEvent], None] = None,
+    ):
+        """
+        Initializes the CallbackSink object.
+
+        Args:
+            on_render (Callable[[RenderStats], None]): Called with the stats of each finished render.
+            on_block (Callable[[RenderStats, BlockEvent], None]): Called after each block.
+        """
+        self.on_render = on_render
+        self.on_block = on_block
+
+    def block(self, stats: RenderStats, event: BlockEvent):
+        if self.on_block is not None:
+            self.on_block(stats, event)
+
+    def render(self, stats: RenderStats):
+        if self.on_render is not None:
+            self.on_render(stats)
+
+
+class Instrumentation:
+    """
+    A class to measure renders of a Synthesizer.
+
+    A Synthesizer without instrumentation skips all measurements, so it costs one check per
+    block. With it, each stage of each block is timed with ``time.perf_counter``.
+
+    Attributes:
+        sinks (List[StatsSink]): The receivers of the measurements.
+        trace_allocations (bool): Whether the peak allocated memory of each render is traced
+            with tracemalloc, which slows rendering down considerably. The peak is process-wide,
+            so renders traced at the same time on other threads are included in each other's peak.
+        history (deque): The stats of the most recent renders.
+    """
+
+    def __init__(
+        self,
+        sinks: List[StatsSink] = None,
+        trace_allocations: bool = False,
+        history: int = 100,
+    ):
+        """
+        Initializes the Instrumentation object.
+
+        Args:
+            sinks (List[StatsSink]): The receivers of the measurements.
+            trace_allocations (bool): Whether to trace the peak allocated memory of each render.
+            history (int): The number of recent renders to keep stats of.
+        """
+        self.sinks = list(sinks or [])
+        self.trace_allocations = trace_allocations
+        self.history = deque(maxlen=history)
+
+    @property
+    def last(self) -> Optional[RenderStats]:
+        """
+        Returns the stats of the most recent render, or None before the first one.
+        """
+        return self.history[-1] if self.history else None
+
+    def begin(self, operation: str, sample_rate: int) -> RenderStats:
+        """
+        Starts measuring a render.
+
+        Args:
+            operation (str): The Synthesizer method that renders.
+            sample_rate (int): The sample rate in Hz.
+
+        Returns:
+            RenderStats: The stats to record the render's stages and blocks in.
+        """
+        global _started_tracing
+        stats = RenderStats(operation, sample_rate)
+        if self.trace_allocations:
+            with _traced_lock:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _started_tracing = True
+                current, peak = tracemalloc.get_traced_memory()
+                # Save the peak of the renders in progress before it is reset.
+                for other in _traced_renders:
+                    other._traced_peak = max(other._traced_peak, peak)
+                stats._traced_start = current
+                tracemalloc.reset_peak()
+                _traced_renders.append(stats)
+        stats._started = time.perf_counter()
+        return stats
+
+    def block(self, stats: RenderStats, samples: int, latency: float):
+        """
+        Records a delivered block and passes it to the sinks.
+
+        Args:
+            stats (RenderStats): The stats of the render.
+            samples (int): The number of samples in the block.
+            latency (float): The wall time from requesting the block until it was delivered.
+        """
+        stats.samples += samples
+        stats.block_samples.append(samples)
+        stats.block_latencies.append(latency)
+        if self.sinks:
+            event = BlockEvent(len(stats.block_latencies) - 1, samples, latency)
+            for sink in self.sinks:
+                sink.block(stats, event)
+
+    def finish(self, stats: RenderStats):
+        """
+        Finishes measuring a render, keeps its stats and passes them to the sinks.
+
+        Args:
+            stats (RenderStats): The stats of the render.
+        """
+        global _started_tracing
+        stats.seconds = time.perf_counter() - stats._started
+        if self.trace_allocations:
+            with _traced_lock:
+                peak = tracemalloc.get_traced_memory()[1]
+                stats.allocated_bytes = max(max(stats._traced_peak, peak) - stats._traced_start, 0)
+                if stats in _traced_renders:
+                    _traced_renders.remove(stats)
+                for other in _traced_renders:
+                    other._traced_peak = max(other._traced_peak, peak)
+                if not _traced_renders and _started_tracing:
+                    tracemalloc.stop()
+                    _started_tracing = False
+
+        self.history.append(stats)
+        for sink in self.sinks:
+            sink.render(stats)
@@ -0,0 +1,260 @@
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Union
+import numpy as np
+
+from .pitch import midi_to_frequency
+
+
+class MidiNotes:
+    """
+    A class to hold the notes of a Standard MIDI File in arrays, sorted by start time.
+
+    Attributes:
+        starts (np.ndarray): The start times in seconds.
+        durations (np.ndarray): The durations in seconds.
+        notes (np.ndarray): The MIDI note numbers (60 is C4, 69 is A4).
+        velocities (np.ndarray): The velocities (1 to 127).
+        channels (np.ndarray): The MIDI channels (0 to 15).
+    """
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        durations: np.ndarray,
+        notes: np.ndarray,
+        velocities: np.ndarray,
+        channels: np.ndarray,
+    ):
+        """
+        Initializes the MidiNotes object.
+
+        Args:
+            starts (np.ndarray): The start times in seconds.
+            durations (np.ndarray): The durations in seconds.
+            notes (np.ndarray): The MIDI note numbers.
+            velocities (np.ndarray): The velocities (1 to 127).
+            channels (np.ndarray): The MIDI channels (0 to 15).
+        """
+        self.starts = starts
+        self.durations = durations
+        self.notes = notes
+        self.velocities = velocities
+        self.channels = channels
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """
+        Returns the frequencies of the notes in Hz, with A4 (note 69) at 440 Hz.
+        """
+        return midi_to_frequency(self.notes)
+
+
+def read_midi(file: Union[str, Path, BinaryIO]) -> MidiNotes:
+    """
+    Reads the notes of a Standard MIDI File (format 0 or 1).
+
+    Tracks are read and parsed one chunk at a time, and notes are collected in compact
+    arrays of ticks, so no Python object is created per event. Tick times are converted
+    to seconds with the tempo map at the end.
+
+    Args:
+        file (Union[str, Path, BinaryIO]): The path or binary file object to read.
+
+    Returns:
+        MidiNotes: The notes of all tracks, sorted by start time.
+
+    Raises:
+        ValueError: If the file is not a Standard MIDI File, is truncated, or is in format 2,
+            whose tracks are independent sequences rather than parts played together.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, "rb") as opened:
+            return read_midi(opened)
+
+    name = getattr(file, "name", "<stream>")
+    chunk = _read_chunk(file, name)
+    if chunk is None or chunk[0] != b"MThd" or len(chunk[1]) < 6:
+        raise ValueError(f"{name} is not a Standard MIDI File.")
+    header = chunk[1]
+    if int.from_bytes(header[0:2], "big") == 2:
+        raise ValueError(f"{name} is a format 2 MIDI file, which is not supported.")
+    num_tracks = int.from_bytes(header[2:4], "big")
+    division = int.from_bytes(header[4:6], "big")
+
+    notes = _Notes()
+    tempo_changes = {}
+    tracks_read = 0
+    while tracks_read < num_tracks:
+        chunk = _read_chunk(file, name)
+        if chunk is None:
+            break
+        chunk_type, data = chunk
+        # Chunks of unknown types are skipped and do not count as tracks.
+        if chunk_type == b"MTrk":
+            tracks_read += 1
+            try:
+                _parse_track(data, notes, tempo_changes, name)
+            except IndexError:
+                # The parser reads without bounds checks; running off the end means the
+                # last event of the track is cut short.
+                raise ValueError(f"Truncated MIDI track in {name}.") from None
+
+    starts = np.frombuffer(notes.starts, dtype=np.int64)
+    ends = np.frombuffer(notes.ends, dtype=np.int64)
+    start_seconds = _ticks_to_seconds(starts, division, tempo_changes)
+    durations = _ticks_to_seconds(ends, division, tempo_changes) - start_seconds
+
+    order = np.argsort(start_seconds, kind="stable")
+    return MidiNotes(
+        start_seconds[order],
+        durations[order],
+        np.frombuffer(notes.keys, dtype=np.uint8)[order],
+        np.frombuffer(notes.velocities, dtype=np.uint8)[order],
+        np.frombuffer(notes.channels, dtype=np.uint8)[order],
+    )
+
+
+class _Notes:
+    """
+    The notes found so far, as compact arrays of ticks.
+    """
+
+    def __init__(self):
+        self.starts = array("q")
+        self.ends = array("q")
+        self.keys = array("B")
+        self.velocities = array("B")
+        self.channels = array("B")
+
+
+def _read_chunk(file: BinaryIO, name: str):
+    """
+    Reads the next chunk, returning its type and data, or None at the end of the file.
+    """
+    header = file.read(8)
+    if len(header) < 8:
+        return None
+    length = int.from_bytes(header[4:8], "big")
+    data = file.read(length)
+    if len(data) < length:
+        raise ValueError(f"Truncated MIDI chunk in {name}.")
+    return header[:4], data
+
+
+# The number of data bytes following each channel message status (high nibble).
+_DATA_LENGTHS = {0x8: 2, 0x9: 2, 0xA: 2, 0xB: 2, 0xC: 1, 0xD: 1, 0xE: 2}
+
+
+def _parse_track(data: bytes, notes: _Notes, tempo_changes: dict, name: str):
+    """
+    Parses one track chunk, appending its notes and recording its tempo changes.
+    """
+    # Local names keep the per-event loop fast.
+    starts_append = notes.starts.append
+    ends_append = notes.ends.append
+    keys_append = notes.keys.append
+    velocities_append = notes.velocities.append
+    channels_append = notes.channels.append
+    data_lengths = _DATA_LENGTHS
+
+    # The start tick and velocity of the held note for each channel and key, or -1.
+    held_ticks = [-1] * 2048
+    held_velocities = [0] * 2048
+
+    size = len(data)
+    position = 0
+    tick = 0
+    status = 0
+    while position < size:
+        # Delta time as a variable-length quantity.
+        byte = data[position]
+        position += 1
+        delta = byte & 0x7F
+        while byte & 0x80:
+            byte = data[position]
+            position += 1
+            delta = (delta << 7) | (byte & 0x7F)
+        tick += delta
+
+        byte = data[position]
+        if byte & 0x80:
+            status = byte
+            position += 1
+        elif status >= 0xF0 or status == 0:
+            raise ValueError(f"Invalid running status in MIDI track in {name}.")
+
+        kind = status >> 4
+        if kind == 0x9 or kind == 0x8:
+            key = data[position]
+            velocity = data[position + 1]
+            position += 2
+            slot = ((status & 0x0F) << 7) | key
+            start = held_ticks[slot]
+            if start >= 0:
+                # A note-off, or a repeated note-on that ends the held note.
+                starts_append(start)
+                ends_append(tick)
+                keys_append(key)
+                velocities_append(held_velocities[slot])
+                channels_append(status & 0x0F)
+                held_ticks[slot] = -1
+            if kind == 0x9 and velocity:
+                held_ticks[slot] = tick
+                held_velocities[slot] = velocity
+        elif kind != 0xF:
+            position += data_lengths[kind]
+        else:
+            if status == 0xFF:
+                meta_type = data[position]
+                position += 1
+            length = 0
+            byte = 0x80
+            while byte & 0x80:
+                byte = data[position]
+                position += 1
+                length = (length << 7) | (byte & 0x7F)
+            if position + length > size:
+                raise IndexError(position + length)
+            if status == 0xFF and meta_type == 0x51 and length == 3:
+                tempo_changes[tick] = int.from_bytes(data[position:position + 3], "big")
+            elif status == 0xFF and meta_type == 0x2F:
+                break
+            position += length
+            status = 0
+
+    # Notes still held at the end of the track end there.
+    for slot, start in enumerate(held_ticks):
+        if start >= 0:
+            starts_append(start)
+            ends_append(tick)
+            keys_append(slot & 0x7F)
+            velocities_append(held_velocities[slot])
+            channels_append(slot >> 7)
+
+
+def _ticks_to_seconds(ticks: np.ndarray, division: int, tempo_changes: dict) -> np.ndarray:
+    """
+    Converts tick times to seconds using the tempo map.
+    """
+    if division & 0x8000:
+        # SMPTE time: frames per second and ticks per frame.
+        frames_per_second = 256 - (division >> 8)
+        return ticks / float(frames_per_second * (division & 0xFF))
+
+    # Tempo in microseconds per quarter note, 120 BPM until the first change.
+    change_ticks = np.array([0] + sorted(tick for tick in tempo_changes if tick > 0))
+    tempos = np.array(
+        [tempo_changes.get(0, 500000)] + [tempo_changes[tick] for tick in change_ticks[1:]],
+        dtype=np.float64,
+    )
+    seconds_per_tick = tempos / (1e6 * division)
+    change_seconds = np.concatenate(
+        ([0.0], np.cumsum(np.diff(change_ticks) * seconds_per_tick[:-1]))
+    )
+
+    index = np.searchsorted(change_ticks, ticks, side="right") - 1
+    return change_seconds[index] + (ticks - change_ticks[index]) * seconds_per_tick[index]
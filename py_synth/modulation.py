@@ -0,0 +1,251 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Callable, Sequence
+import numpy as np
+
+from .adsr_parameter import ADSREnvelope
+from .curve import Curve, CurveType
+from .value_object import ValueObject
+from .waveform import WaveformType, _shape
+
+
+class Modulator(ValueObject, ABC):
+    """
+    A base class for control signals that change a parameter over the duration of a sound.
+
+    Modulators are immutable and compare by their parameters, so sounds that use them can
+    still be used as cache keys. Subclasses implement ``evaluate``.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def evaluate(self, times: np.ndarray) -> np.ndarray:
+        """
+        Evaluates the control signal.
+
+        Args:
+            times (np.ndarray): The times since the start of the sound in seconds, in ascending order.
+
+        Returns:
+            np.ndarray: The control value at each time.
+        """
+
+    def generate_block(
+        self,
+        sample_rate: int,
+        offset: int,
+        num_samples: int,
+        control_interval: int = 1,
+        out: np.ndarray = None,
+        transform: Callable[[np.ndarray], np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Generates a block of the control signal, one value per sample.
+
+        With a control interval above 1, the signal is evaluated only at every multiple of
+        control_interval samples from the start of the sound and linearly interpolated in
+        between. The points do not depend on the block boundaries, so blocks of any size
+        join into the same signal.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            offset (int): The index of the first sample of the block.
+            num_samples (int): The number of samples in the block.
+            control_interval (int): The number of samples between evaluations. Should be positive.
+            out (np.ndarray): A buffer of num_samples samples to write the block into.
+            transform (Callable[[np.ndarray], np.ndarray]): Maps the evaluated values, e.g.
+                semitones to Hz, before they are interpolated, so it also runs at control rate.
+
+        Returns:
+            np.ndarray: The control values of the block.
+        """
+        if control_interval <= 0:
+            raise ValueError("Control interval must be positive.")
+        if out is None:
+            out = np.empty(num_samples)
+        if not num_samples:
+            return out
+
+        if control_interval == 1:
+            times = np.arange(offset, offset + num_samples) / sample_rate
+            values = self.evaluate(times)
+            out[...] = values if transform is None else transform(values)
+            return out
+
+        first = offset // control_interval
+        last = (offset + num_samples - 1) // control_interval + 1
+        points = np.arange(first, last + 1) * control_interval
+        values = self.evaluate(points / sample_rate)
+        if transform is not None:
+            values = transform(values)
+
+        # Each row ramps from one control point towards the next.
+        fractions = np.arange(control_interval) / control_interval
+        ramps = np.multiply.outer(np.diff(values), fractions)
+        ramps += values[:-1, np.newaxis]
+        start = offset - points[0]
+        out[...] = ramps.ravel()[start:start + num_samples]
+        return out
+
+    def cache_key(self) -> tuple:
+        """
+        Returns a hashable key of plain values describing the modulator.
+
+        Returns:
+            tuple: The class name and parameters, with enums replaced by their names.
+        """
+        return (type(self).__name__,) + tuple(_plain(value) for value in self._values())
+
+
+class LFO(Modulator):
+    """
+    A low-frequency oscillator, e.g. for vibrato or tremolo.
+
+    Attributes:
+        rate (float): The frequency of the oscillator in Hz.
+        depth (float): The amplitude of the control signal.
+        waveform_type (WaveformType): The shape of the oscillator.
+        center (float): The value the signal oscillates around.
+        phase (float): The starting phase in cycles (0.0 to 1.0).
+    """
+
+    __slots__ = ("rate", "depth", "waveform_type", "center", "phase")
+
+    def __init__(
+        self,
+        rate: float,
+        depth: float,
+        waveform_type: WaveformType = WaveformType.SINE,
+        center: float = 0.0,
+        phase: float = 0.0,
+    ):
+        """
+        Initializes the LFO object.
+
+        Args:
+            rate (float): The frequency of the oscillator in Hz. Should not be negative.
+            depth (float): The amplitude of the control signal.
+            waveform_type (WaveformType): The shape of the oscillator. NOISE is not supported.
+            center (float): The value the signal oscillates around.
+            phase (float): The starting phase in cycles (0.0 to 1.0).
+        """
+        if rate < 0:
+            raise ValueError("LFO rate must not be negative.")
+        if waveform_type == WaveformType.NOISE:
+            raise ValueError("LFO waveform cannot be NOISE.")
+
+        self._set("rate", rate)
+        self._set("depth", depth)
+        self._set("waveform_type", waveform_type)
+        self._set("center", center)
+        self._set("phase", phase % 1.0)
+
+    def evaluate(self, times: np.ndarray) -> np.ndarray:
+        cycles = np.multiply(times, self.rate)
+        cycles += self.phase
+        values = _shape(self.waveform_type, cycles)
+        values *= self.depth
+        values += self.center
+        return values
+
+
+class Ramp(Modulator):
+    """
+    A control signal through breakpoints, joined by curves, e.g. for pitch drops and sweeps.
+
+    The signal holds the first value before the first breakpoint and the last value after
+    the last one. Two breakpoints at the same time make a step.
+
+    Attributes:
+        breakpoints (Tuple[Tuple[float, float, CurveType], ...]): The time in seconds, the
+            value, and the curve leading to the value of each breakpoint.
+    """
+
+    __slots__ = ("breakpoints",)
+
+    def __init__(self, breakpoints: Sequence[tuple]):
+        """
+        Initializes the Ramp object.
+
+        Args:
+            breakpoints (Sequence[tuple]): ``(time, value)`` or ``(time, value, curve_type)``
+                tuples in ascending time order. The curve shapes the segment that ends at the
+                breakpoint and defaults to CurveType.LINEAR.
+        """
+        points = tuple(
+            (float(point[0]), float(point[1]), point[2] if len(point) > 2 else CurveType.LINEAR)
+            for point in breakpoints
+        )
+        if not points:
+            raise ValueError("A ramp needs at least one breakpoint.")
+        if points[0][0] < 0:
+            raise ValueError("Breakpoint times must not be negative.")
+        if any(later[0] < earlier[0] for earlier, later in zip(points, points[1:])):
+            raise ValueError("Breakpoints must be in ascending time order.")
+
+        self._set("breakpoints", points)
+
+    @classmethod
+    def from_envelope(
+        cls, envelope: ADSREnvelope, duration: float, start: float = 0.0, peak: float = 1.0
+    ) -> "Ramp":
+        """
+        Creates a ramp that follows the shape of an ADSR envelope, with the envelope's curves.
+
+        Like the envelope, the ramp holds the sustain level for the sustain time only and
+        returns to start until the release begins.
+
+        Args:
+            envelope (ADSREnvelope): The envelope to follow.
+            duration (float): The duration of the sound in seconds.
+            start (float): The value at envelope level 0, at the start and after the release.
+            peak (float): The value at envelope level 1, at the end of the attack.
+
+        Returns:
+            Ramp: The ramp.
+        """
+        attack = envelope.attack.get_value(duration)
+        decay = attack + envelope.decay.get_value(duration)
+        hold = decay + envelope.sustain.get_value(duration)
+        release = max(duration - envelope.release.get_value(duration), decay)
+        sustain = start + (peak - start) * envelope.sustain_level.get_value(duration)
+
+        points = [
+            (0.0, start),
+            (attack, peak, envelope.attack.curve),
+            (decay, sustain, envelope.decay.curve),
+        ]
+        if hold < release:
+            # Silent between the end of the sustain and the release.
+            points += [(hold, sustain), (hold, start), (release, start), (release, sustain)]
+        else:
+            points.append((release, sustain))
+        points.append((max(duration, release), start, envelope.release.curve))
+        return cls(points)
+
+    def evaluate(self, times: np.ndarray) -> np.ndarray:
+        times = np.asarray(times, dtype=np.float64)
+        values = np.full(times.shape, self.breakpoints[0][1])
+        for (start_time, start, _), (end_time, end, curve_type) in zip(
+            self.breakpoints, self.breakpoints[1:]
+        ):
+            first, last = np.searchsorted(times, (start_time, end_time))
+            if first < last:
+                x = (times[first:last] - start_time) / (end_time - start_time)
+                values[first:last] = start + (end - start) * Curve.shape(curve_type, x)
+
+        end_time, end, _ = self.breakpoints[-1]
+        values[np.searchsorted(times, end_time):] = end
+        return values
+
+
+def _plain(value):
+    """
+    Replaces enums by their names, also inside tuples, for stable cache keys.
+    """
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, tuple):
+        return tuple(_plain(item) for item in value)
+    return value
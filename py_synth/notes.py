@@ -1,103 +1,141 @@
+import math
 from enum import Enum
 
+from .pitch import TuningSystem, midi_to_frequency
+
+
+def _frequency(note: int) -> float:
+    return float(midi_to_frequency(note))
+
+
 class Notes(Enum):
     """
     Enum for storing frequency values for standard musical notes.
+
+    The values are exact equal-tempered frequencies with A4 at 440 Hz, from C0 (MIDI note 12)
+    to C8 (MIDI note 108). Use midi_to_frequency to convert many note numbers at once.
     """
-    C0 = 16.35
-    C0_SHARP = 17.32
-    D0 = 18.35
-    D0_SHARP = 19.45
-    E0 = 20.60
-    F0 = 21.83
-    F0_SHARP = 23.12
-    G0 = 24.50
-    G0_SHARP = 25.96
-    A0 = 27.50
-    A0_SHARP = 29.14
-    B0 = 30.87
-    C1 = 32.70
-    C1_SHARP = 34.65
-    D1 = 36.71
-    D1_SHARP = 38.89
-    E1 = 41.20
-    F1 = 43.65
-    F1_SHARP = 46.25
-    G1 = 49.00
-    G1_SHARP = 51.91
-    A1 = 55.00
-    A1_SHARP = 58.27
-    B1 = 61.74
-    C2 = 65.41
-    C2_SHARP = 69.30
-    D2 = 73.42
-    D2_SHARP = 77.78
-    E2 = 82.41
-    F2 = 87.31
-    F2_SHARP = 92.50
-    G2 = 98.00
-    G2_SHARP = 103.83
-    A2 = 110.00
-    A2_SHARP = 116.54
-    B2 = 123.47
-    C3 = 130.81
-    C3_SHARP = 138.59
-    D3 = 146.83
-    D3_SHARP = 155.56
-    E3 = 164.81
-    F3 = 174.61
-    F3_SHARP = 185.00
-    G3 = 196.00
-    G3_SHARP = 207.65
-    A3 = 220.00
-    A3_SHARP = 233.08
-    B3 = 246.94
-    C4 = 261.63
-    C4_SHARP = 277.18
-    D4 = 293.66
-    D4_SHARP = 311.13
-    E4 = 329.63
-    F4 = 349.23
-    F4_SHARP = 369.99
-    G4 = 392.00
-    G4_SHARP = 415.30
-    A4 = 440.00
-    A4_SHARP = 466.16
-    B4 = 493.88
-    C5 = 523.25
-    C5_SHARP = 554.37
-    D5 = 587.33
-    D5_SHARP = 622.25
-    E5 = 659.25
-    F5 = 698.46
-    F5_SHARP = 739.99
-    G5 = 783.99
-    G5_SHARP = 830.61
-    A5 = 880.00
-    A5_SHARP = 932.33
-    B5 = 987.77
-    C6 = 1046.50
-    C6_SHARP = 1108.73
-    D6 = 1174.66
-    D6_SHARP = 1244.51
-    E6 = 1318.51
-    F6 = 1396.91
-    F6_SHARP = 1479.98
-    G6 = 1567.98
-    G6_SHARP = 1661.22
-    A6 = 1760.00
-    A6_SHARP = 1864.66
-    B6 = 1975.53
-    C7 = 2093.00
-    C7_SHARP = 2217.46
-    D7 = 2349.32
-    D7_SHARP = 2489.02
-    E7 = 2637.02
-    F7 = 2793.83
-    F7_SHARP = 2959.96
-    G7 = 3135.96
-    G7_SHARP = 3322.44
-    A7 = 3520.00
-    A7_SHARP = 3729.31
-    B7 = 3951.07
-    C8 = 4186.01
+
+    C0 = _frequency(12)
+    C0_SHARP = _frequency(13)
+    D0 = _frequency(14)
+    D0_SHARP = _frequency(15)
+    E0 = _frequency(16)
+    F0 = _frequency(17)
+    F0_SHARP = _frequency(18)
+    G0 = _frequency(19)
+    G0_SHARP = _frequency(20)
+    A0 = _frequency(21)
+    A0_SHARP = _frequency(22)
+    B0 = _frequency(23)
+    C1 = _frequency(24)
+    C1_SHARP = _frequency(25)
+    D1 = _frequency(26)
+    D1_SHARP = _frequency(27)
+    E1 = _frequency(28)
+    F1 = _frequency(29)
+    F1_SHARP = _frequency(30)
+    G1 = _frequency(31)
+    G1_SHARP = _frequency(32)
+    A1 = _frequency(33)
+    A1_SHARP = _frequency(34)
+    B1 = _frequency(35)
+    C2 = _frequency(36)
+    C2_SHARP = _frequency(37)
+    D2 = _frequency(38)
+    D2_SHARP = _frequency(39)
+    E2 = _frequency(40)
+    F2 = _frequency(41)
+    F2_SHARP = _frequency(42)
+    G2 = _frequency(43)
+    G2_SHARP = _frequency(44)
+    A2 = _frequency(45)
+    A2_SHARP = _frequency(46)
+    B2 = _frequency(47)
+    C3 = _frequency(48)
+    C3_SHARP = _frequency(49)
+    D3 = _frequency(50)
+    D3_SHARP = _frequency(51)
+    E3 = _frequency(52)
+    F3 = _frequency(53)
+    F3_SHARP = _frequency(54)
+    G3 = _frequency(55)
+    G3_SHARP = _frequency(56)
+    A3 = _frequency(57)
+    A3_SHARP = _frequency(58)
+    B3 = _frequency(59)
+    C4 = _frequency(60)
+    C4_SHARP = _frequency(61)
+    D4 = _frequency(62)
+    D4_SHARP = _frequency(63)
+    E4 = _frequency(64)
+    F4 = _frequency(65)
+    F4_SHARP = _frequency(66)
+    G4 = _frequency(67)
+    G4_SHARP = _frequency(68)
+    A4 = _frequency(69)
+    A4_SHARP = _frequency(70)
+    B4 = _frequency(71)
+    C5 = _frequency(72)
+    C5_SHARP = _frequency(73)
+    D5 = _frequency(74)
+    D5_SHARP = _frequency(75)
+    E5 = _frequency(76)
+    F5 = _frequency(77)
+    F5_SHARP = _frequency(78)
+    G5 = _frequency(79)
+    G5_SHARP = _frequency(80)
+    A5 = _frequency(81)
+    A5_SHARP = _frequency(82)
+    B5 = _frequency(83)
+    C6 = _frequency(84)
+    C6_SHARP = _frequency(85)
+    D6 = _frequency(86)
+    D6_SHARP = _frequency(87)
+    E6 = _frequency(88)
+    F6 = _frequency(89)
+    F6_SHARP = _frequency(90)
+    G6 = _frequency(91)
+    G6_SHARP = _frequency(92)
+    A6 = _frequency(93)
+    A6_SHARP = _frequency(94)
+    B6 = _frequency(95)
+    C7 = _frequency(96)
+    C7_SHARP = _frequency(97)
+    D7 = _frequency(98)
+    D7_SHARP = _frequency(99)
+    E7 = _frequency(100)
+    F7 = _frequency(101)
+    F7_SHARP = _frequency(102)
+    G7 = _frequency(103)
+    G7_SHARP = _frequency(104)
+    A7 = _frequency(105)
+    A7_SHARP = _frequency(106)
+    B7 = _frequency(107)
+    C8 = _frequency(108)
+
+    @property
+    def midi_number(self) -> int:
+        """
+        Returns the MIDI note number of the note (60 is C4, 69 is A4).
+        """
+        return round(69 + 12 * math.log2(self.value / 440.0))
+
+    def frequency(
+        self,
+        a4: float = 440.0,
+        tuning: TuningSystem = TuningSystem.EQUAL_TEMPERAMENT,
+        tonic: int = 0,
+    ) -> float:
+        """
+        Returns the frequency of the note with another reference or tuning system.
+
+        Args:
+            a4 (float): The frequency of A4 in Hz.
+            tuning (TuningSystem): The tuning system.
+            tonic (int): The pitch class the tuning is built on (0 is C, 9 is A).
+
+        Returns:
+            float: The frequency in Hz.
+        """
+        return float(midi_to_frequency(self.midi_number, a4, tuning, tonic))
@@ -0,0 +1,289 @@
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Sequence, Tuple, Union
+import numpy as np
+
+
+# The default bin sizes of the overview levels, in samples.
+LEVELS = (256, 4096, 65536)
+
+# The version of the sidecar file layout.
+FORMAT_VERSION = 1
+
+
+class Overview:
+    """
+    A class to hold the minimum, maximum and RMS of a sound at several resolutions.
+
+    Each level summarizes bins of a fixed number of samples, so a waveform, meter or peak
+    check can be drawn at any zoom level by reading a number of bins proportional to the
+    number of pixels instead of every sample.
+
+    Attributes:
+        sample_rate (int): The sample rate of the sound in Hz.
+        num_samples (int): The length of the sound.
+        levels (Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]): The minimum, maximum
+            and RMS of each bin, by bin size.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        num_samples: int,
+        levels: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    ):
+        """
+        Initializes the Overview object.
+
+        Args:
+            sample_rate (int): The sample rate of the sound in Hz.
+            num_samples (int): The length of the sound.
+            levels (Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]): The minimum, maximum
+                and RMS of each bin, by bin size.
+        """
+        self.sample_rate = sample_rate
+        self.num_samples = num_samples
+        self.levels = dict(sorted(levels.items()))
+
+    @classmethod
+    def from_audio(
+        cls, audio: np.ndarray, sample_rate: int, levels: Sequence[int] = LEVELS
+    ) -> "Overview":
+        """
+        Builds the overview of a rendered sound.
+
+        Args:
+            audio (np.ndarray): The samples of the sound.
+            sample_rate (int): The sample rate in Hz.
+            levels (Sequence[int]): The bin sizes of the levels.
+
+        Returns:
+            Overview: The overview.
+        """
+        builder = OverviewBuilder(sample_rate, levels)
+        builder.add(audio)
+        return builder.overview()
+
+    @property
+    def peak(self) -> float:
+        """
+        Returns the largest absolute sample value.
+        """
+        if not self.num_samples:
+            return 0.0
+        mins, maxs, _ = next(iter(self.levels.values()))
+        return float(max(-mins.min(), maxs.max()))
+
+    @property
+    def rms(self) -> float:
+        """
+        Returns the RMS of the whole sound.
+        """
+        if not self.num_samples:
+            return 0.0
+        bin_size, (_, _, rms) = next(iter(self.levels.items()))
+        squares = rms.astype(np.float64) ** 2 * _bin_counts(self.num_samples, bin_size)
+        return float(np.sqrt(squares.sum() / self.num_samples))
+
+    def view(
+        self, start: int = 0, stop: int = None, width: int = 1000
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the minimum, maximum and RMS of a range of samples, one column per pixel.
+
+        The coarsest level whose bins are no longer than a column is used, so the cost is
+        proportional to the width and not to the length of the range. When a column is
+        shorter than the finest bin, there are fewer columns than the width.
+
+        Args:
+            start (int): The first sample of the range.
+            stop (int): The sample after the range. Defaults to the end of the sound.
+            width (int): The number of columns, e.g. the width of the plot in pixels.
+
+        Returns:
+            tuple: The start time in seconds, minimum, maximum and RMS of each column.
+        """
+        stop = self.num_samples if stop is None else min(stop, self.num_samples)
+        if width <= 0:
+            raise ValueError("Width must be positive.")
+        if not 0 <= start < stop:
+            empty = np.zeros(0)
+            return empty, empty, empty, empty
+
+        samples_per_column = (stop - start) / width
+        bin_size = next(iter(self.levels))
+        for size in self.levels:
+            if size <= samples_per_column:
+                bin_size = size
+        mins, maxs, rms = self.levels[bin_size]
+
+        first = start // bin_size
+        last = -(-stop // bin_size)
+        edges = np.unique(np.linspace(first, last, width + 1)[:-1].astype(np.int64))
+        columns = edges - first
+        counts = np.diff(np.append(edges, last))
+        squares = rms[first:last].astype(np.float64) ** 2
+        return (
+            edges * (bin_size / self.sample_rate),
+            np.minimum.reduceat(mins[first:last], columns),
+            np.maximum.reduceat(maxs[first:last], columns),
+            np.sqrt(np.add.reduceat(squares, columns) / counts),
+        )
+
+    def save(self, file: Union[str, Path, BinaryIO]):
+        """
+        Saves the overview as an uncompressed .npz file.
+
+        Args:
+            file (Union[str, Path, BinaryIO]): The path or binary file object to write.
+        """
+        arrays = {
+            "version": np.array(FORMAT_VERSION),
+            "sample_rate": np.array(self.sample_rate),
+            "num_samples": np.array(self.num_samples),
+            "bin_sizes": np.array(list(self.levels), dtype=np.int64),
+        }
+        for bin_size, (mins, maxs, rms) in self.levels.items():
+            arrays[f"min_{bin_size}"] = mins
+            arrays[f"max_{bin_size}"] = maxs
+            arrays[f"rms_{bin_size}"] = rms
+        np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, file: Union[str, Path, BinaryIO]) -> "Overview":
+        """
+        Loads an overview saved with save.
+
+        Args:
+            file (Union[str, Path, BinaryIO]): The path or binary file object to read.
+
+        Returns:
+            Overview: The overview.
+        """
+        with np.load(file) as data:
+            if int(data["version"]) != FORMAT_VERSION:
+                raise ValueError(f"Unsupported overview version: {int(data['version'])}")
+            levels = {
+                int(bin_size): (
+                    data[f"min_{bin_size}"],
+                    data[f"max_{bin_size}"],
+                    data[f"rms_{bin_size}"],
+                )
+                for bin_size in data["bin_sizes"]
+            }
+            return cls(int(data["sample_rate"]), int(data["num_samples"]), levels)
+
+
+class OverviewBuilder:
+    """
+    A class to build an Overview block by block as a sound is rendered.
+
+    Only the finest level is computed from the samples; the coarser levels are combined
+    from it when the overview is taken.
+
+    Attributes:
+        sample_rate (int): The sample rate in Hz.
+        bin_sizes (List[int]): The bin sizes of the levels, finest first.
+        num_samples (int): The number of samples added so far.
+    """
+
+    def __init__(self, sample_rate: int, levels: Sequence[int] = LEVELS):
+        """
+        Initializes the OverviewBuilder object.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            levels (Sequence[int]): The bin sizes of the levels. Each should be a multiple of the smallest.
+        """
+        self.bin_sizes: List[int] = sorted(levels)
+        if not self.bin_sizes or self.bin_sizes[0] <= 0:
+            raise ValueError("Bin sizes must be positive.")
+        if any(size % self.bin_sizes[0] for size in self.bin_sizes):
+            raise ValueError("Bin sizes must be multiples of the smallest bin size.")
+
+        self.sample_rate = sample_rate
+        self.num_samples = 0
+
+        finest = self.bin_sizes[0]
+        self._mins: List[np.ndarray] = []
+        self._maxs: List[np.ndarray] = []
+        self._squares: List[np.ndarray] = []
+        self._pending = np.empty(finest)
+        self._num_pending = 0
+
+    def add(self, block: np.ndarray):
+        """
+        Adds the next block of the sound.
+
+        Args:
+            block (np.ndarray): The samples of the block.
+        """
+        finest = self.bin_sizes[0]
+        self.num_samples += len(block)
+
+        # Complete the bin left over from the previous block.
+        if self._num_pending:
+            count = min(finest - self._num_pending, len(block))
+            self._pending[self._num_pending:self._num_pending + count] = block[:count]
+            self._num_pending += count
+            block = block[count:]
+            if self._num_pending < finest:
+                return
+            self._add_bins(self._pending.reshape(1, finest))
+            self._num_pending = 0
+
+        whole = len(block) - len(block) % finest
+        if whole:
+            self._add_bins(block[:whole].reshape(-1, finest))
+        self._num_pending = len(block) - whole
+        self._pending[:self._num_pending] = block[whole:]
+
+    def overview(self) -> Overview:
+        """
+        Returns the overview of the samples added so far.
+
+        Returns:
+            Overview: The overview, including the partial last bin.
+        """
+        finest = self.bin_sizes[0]
+        mins, maxs, squares = (
+            np.concatenate(chunks) if chunks else np.zeros(0)
+            for chunks in (self._mins, self._maxs, self._squares)
+        )
+        if self._num_pending:
+            pending = self._pending[:self._num_pending]
+            mins = np.append(mins, pending.min())
+            maxs = np.append(maxs, pending.max())
+            squares = np.append(squares, np.dot(pending, pending))
+
+        levels = {}
+        for bin_size in self.bin_sizes:
+            starts = np.arange(0, len(mins), bin_size // finest)
+            if len(mins):
+                level_squares = np.add.reduceat(squares, starts)
+                levels[bin_size] = (
+                    np.minimum.reduceat(mins, starts).astype(np.float32),
+                    np.maximum.reduceat(maxs, starts).astype(np.float32),
+                    np.sqrt(level_squares / _bin_counts(self.num_samples, bin_size)).astype(np.float32),
+                )
+            else:
+                empty = np.zeros(0, dtype=np.float32)
+                levels[bin_size] = (empty, empty, empty)
+        return Overview(self.sample_rate, self.num_samples, levels)
+
+    def _add_bins(self, bins: np.ndarray):
+        """
+        Adds the minimum, maximum and sum of squares of whole bins, one bin per row.
+        """
+        self._mins.append(bins.min(axis=1))
+        self._maxs.append(bins.max(axis=1))
+        self._squares.append(np.einsum("ij,ij->i", bins, bins, dtype=np.float64))
+
+
+def _bin_counts(num_samples: int, bin_size: int) -> np.ndarray:
+    """
+    Returns the number of samples in each bin; only the last bin may be partial.
+    """
+    counts = np.full(-(-num_samples // bin_size), bin_size, dtype=np.float64)
+    if len(counts):
+        counts[-1] = num_samples - (len(counts) - 1) * bin_size
+    return counts
@@ -0,0 +1,73 @@
+from enum import Enum
+import numpy as np
+
+
+class TuningSystem(Enum):
+    """
+    Enum for tuning systems, as the frequency ratios of the twelve notes above the tonic.
+    """
+
+    EQUAL_TEMPERAMENT = tuple(2.0 ** (step / 12) for step in range(12))
+    JUST_INTONATION = (1, 16 / 15, 9 / 8, 6 / 5, 5 / 4, 4 / 3, 45 / 32, 3 / 2, 8 / 5, 5 / 3, 9 / 5, 15 / 8)
+    PYTHAGOREAN = (
+        1, 256 / 243, 9 / 8, 32 / 27, 81 / 64, 4 / 3, 729 / 512, 3 / 2, 128 / 81, 27 / 16, 16 / 9, 243 / 128
+    )
+
+    @property
+    def deviations(self) -> np.ndarray:
+        """
+        Returns the deviation of each note above the tonic from equal temperament, in semitones.
+        """
+        return np.log2(np.array(self.value)) * 12 - np.arange(12)
+
+
+def midi_to_frequency(
+    note,
+    a4: float = 440.0,
+    tuning: TuningSystem = TuningSystem.EQUAL_TEMPERAMENT,
+    tonic: int = 0,
+):
+    """
+    Converts MIDI note numbers to frequencies.
+
+    Note 69 is A4 and note 12 is C0, matching Notes. A whole array of note numbers is
+    converted in one vectorized operation.
+
+    Args:
+        note: A note number or an array of note numbers. Fractional numbers are allowed with equal temperament.
+        a4 (float): The frequency of A4 (note 69) in Hz, in every tuning system.
+        tuning (TuningSystem): The tuning system.
+        tonic (int): The pitch class the tuning is built on (0 is C, 9 is A). The ratios are
+            counted from the tonic and scaled so that A4 stays at a4.
+
+    Returns:
+        The frequency or frequencies in Hz.
+    """
+    if a4 <= 0:
+        raise ValueError("A4 frequency must be positive.")
+    if not 0 <= tonic < 12:
+        raise ValueError("Tonic must be a pitch class between 0 and 11.")
+
+    semitones = np.asarray(note, dtype=np.float64) - 69
+    if tuning is not TuningSystem.EQUAL_TEMPERAMENT:
+        pitch_classes = np.mod(np.round(semitones + 69).astype(np.int64) - tonic, 12)
+        deviations = tuning.deviations
+        # Shift the whole scale so that A4 lands on a4 whatever the tonic.
+        semitones = semitones + (deviations[pitch_classes] - deviations[(9 - tonic) % 12])
+    return a4 * np.exp2(semitones / 12)
+
+
+def frequency_to_midi(frequency, a4: float = 440.0):
+    """
+    Converts frequencies to fractional MIDI note numbers in equal temperament.
+
+    Args:
+        frequency: A frequency or an array of frequencies in Hz. Should be positive.
+        a4 (float): The frequency of A4 (note 69) in Hz.
+
+    Returns:
+        The note number or numbers. Round them to get the nearest note.
+    """
+    if a4 <= 0:
+        raise ValueError("A4 frequency must be positive.")
+    return 69 + 12 * np.log2(np.asarray(frequency, dtype=np.float64) / a4)
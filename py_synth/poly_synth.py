@@ -0,0 +1,358 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Hashable, List
+import numpy as np
+
+from .curve import Curve
+from .sound import SampleRate, Sound
+from .synthesizer import Synthesizer
+from .waveform import Oscillator, WaveformType, check_dtype
+
+
+class Voice:
+    """
+    A class to hold the playback state of one note in a PolySynth.
+
+    The oscillator and scratch buffers are created once and reused for every note, so
+    starting and rendering a note does not allocate new audio buffers.
+
+    Attributes:
+        sample_rate (int): The sample rate in Hz.
+        oscillator (Oscillator): The oscillator of the voice.
+        sound (Sound): The sound being played, or None when the voice is idle.
+        note (Hashable): The key used to release the note.
+        velocity (float): The gain applied to the note (0.0 to 1.0).
+        position (int): The number of samples rendered since the note started.
+        order (int): The note-on counter value when the note started, used for voice stealing.
+        dtype (np.dtype): The floating point type of the rendered samples.
+        control_interval (int): The number of samples between evaluations of modulators.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        band_limited: bool = False,
+        dtype=np.float64,
+        block_size: int = Synthesizer.BLOCK_SIZE,
+        control_interval: int = 1,
+    ):
+        """
+        Initializes an idle Voice object.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            band_limited (bool): Whether the oscillator generates band-limited waveforms.
+            dtype (np.dtype): The floating point type of the rendered samples.
+            block_size (int): The maximum number of samples rendered per call.
+            control_interval (int): The number of samples between evaluations of modulators.
+        """
+        self.sample_rate = sample_rate
+        self.dtype = check_dtype(dtype)
+        self.control_interval = control_interval
+        self.oscillator = Oscillator(
+            WaveformType.SINE, 0.0, sample_rate, band_limited=band_limited, dtype=dtype
+        )
+        self.sound = None
+        self.note = None
+        self.velocity = 1.0
+        self.position = 0
+        self.order = 0
+
+        self._curve = Curve(sample_rate, dtype)
+        self._num_samples = 0
+        self._end = 0
+        self._release_position = None
+        self._release_samples = 0
+        self._release_level = 0.0
+        self._waveform = np.empty(block_size, dtype=self.dtype)
+        self._envelope = np.empty(block_size, dtype=self.dtype)
+        self._frequency = np.empty(block_size)
+
+    @property
+    def active(self) -> bool:
+        """
+        Returns whether the voice is playing a note.
+        """
+        return self.sound is not None
+
+    @property
+    def releasing(self) -> bool:
+        """
+        Returns whether the voice has received a note-off.
+        """
+        return self._release_position is not None
+
+    def start(self, sound: Sound, note: Hashable, velocity: float, order: int):
+        """
+        Starts playing a sound, replacing any note the voice was playing.
+
+        Args:
+            sound (Sound): The sound to play.
+            note (Hashable): The key used to release the note.
+            velocity (float): The gain applied to the note (0.0 to 1.0).
+            order (int): The note-on counter value.
+        """
+        self.oscillator.waveform_type = sound.waveform_type
+        self.oscillator.frequency = sound.frequency.value
+        self.oscillator.reset(seed=sound.seed)
+
+        self.sound = sound
+        self.note = note
+        self.velocity = velocity
+        self.position = 0
+        self.order = order
+
+        self._num_samples = int(self.sample_rate * sound.duration)
+        self._end = self._num_samples
+        self._release_position = None
+
+    def release(self):
+        """
+        Moves the voice into its release phase from the current envelope level.
+
+        Voices that are already in the release segment of their envelope are left unchanged.
+        """
+        if not self.active or self.releasing:
+            return
+
+        envelope = self.sound.envelope
+        release_samples = int(
+            envelope.release.get_value(self.sound.duration) * self.sample_rate
+        )
+        if self.position >= self._num_samples - release_samples:
+            return
+
+        self._release_level = envelope.generate_block(
+            self.sample_rate, self.sound.duration, self.position, 1
+        )[0]
+        self._release_position = self.position
+        self._release_samples = release_samples
+        self._end = self.position + release_samples
+        if release_samples == 0:
+            self.stop()
+
+    def stop(self):
+        """
+        Silences the voice immediately.
+        """
+        self.sound = None
+        self.note = None
+
+    def render(self, out: np.ndarray):
+        """
+        Adds the next samples of the voice to an output buffer.
+
+        Args:
+            out (np.ndarray): The buffer to mix into. Its length is the number of samples rendered
+                and should not exceed the block size.
+        """
+        count = min(len(out), self._end - self.position)
+        if count <= 0:
+            self.stop()
+            return
+
+        frequency = self.sound.frequency_block(
+            self.sample_rate, self.position, count, self.control_interval, self._frequency[:count]
+        )
+        waveform = self.oscillator.generate(count, out=self._waveform[:count], frequency=frequency)
+        envelope = self._envelope[:count]
+        if self.releasing:
+            self._curve.apply_curve_segment(
+                self.sound.envelope.release.curve,
+                self._release_samples,
+                self.position - self._release_position,
+                count,
+                start=self._release_level,
+                end=0,
+                out=envelope,
+            )
+        else:
+            self.sound.envelope.generate_block(
+                self.sample_rate, self.sound.duration, self.position, count, out=envelope
+            )
+
+        np.multiply(waveform, envelope, out=waveform)
+        waveform *= 0.5 * self.velocity
+        out[:count] += waveform
+
+        self.position += count
+        if self.position >= self._end:
+            self.stop()
+
+
+class PolySynth:
+    """
+    A class to play overlapping sounds on a fixed pool of voices.
+
+    With more than one thread, voices are split into groups that render into separate
+    buffers on a thread pool and are summed at the end. NumPy releases the GIL inside its
+    ufuncs, so the groups run in parallel. Blocks with too little work to pay for the
+    threading overhead are rendered on the calling thread.
+
+    Attributes:
+        sample_rate (int): The sample rate in Hz.
+        block_size (int): The maximum number of samples rendered per block.
+        dtype (np.dtype): The floating point type of the rendered samples.
+        threads (int): The number of threads voices are rendered on.
+        voices (List[Voice]): The voice pool.
+        steals (int): The number of notes that interrupted a playing voice.
+    """
+
+    # The minimum number of voice samples per thread for a block to be rendered in parallel.
+    MIN_SAMPLES_PER_THREAD = 16384
+
+    def __init__(
+        self,
+        sample_rate: SampleRate = SampleRate.CD_QUALITY,
+        num_voices: int = 16,
+        block_size: int = Synthesizer.BLOCK_SIZE,
+        band_limited: bool = False,
+        dtype=np.float64,
+        threads: int = 1,
+        control_interval: int = 1,
+    ):
+        """
+        Initializes the PolySynth object and preallocates its voices and output buffer.
+
+        Args:
+            sample_rate (SampleRate): The sample rate in Hz.
+            num_voices (int): The number of voices in the pool. Should be positive.
+            block_size (int): The maximum number of samples rendered per block. Should be positive.
+            band_limited (bool): Whether voices generate band-limited SQUARE, SAWTOOTH and PULSE waves.
+            dtype (np.dtype): The floating point type of the rendered samples (float32 or float64).
+            threads (int): The number of threads to render voices on. 1 renders on the calling thread.
+            control_interval (int): Evaluate modulators every this many samples and interpolate
+                linearly in between. Should be positive.
+        """
+        if num_voices <= 0:
+            raise ValueError("Number of voices must be positive.")
+        if block_size <= 0:
+            raise ValueError("Block size must be positive.")
+        if threads <= 0:
+            raise ValueError("Number of threads must be positive.")
+        if control_interval <= 0:
+            raise ValueError("Control interval must be positive.")
+
+        self.sample_rate = sample_rate.value
+        self.block_size = block_size
+        self.dtype = check_dtype(dtype)
+        self.threads = threads
+        self.voices = [
+            Voice(self.sample_rate, band_limited, self.dtype, block_size, control_interval)
+            for _ in range(num_voices)
+        ]
+        self.steals = 0
+
+        self._output = np.zeros(block_size, dtype=self.dtype)
+        self._note_count = 0
+        self._executor = None
+        self._mixes = None
+        if threads > 1:
+            self._executor = ThreadPoolExecutor(threads, thread_name_prefix="PolySynth")
+            self._mixes = np.zeros((threads, block_size), dtype=self.dtype)
+
+    @property
+    def active_voices(self) -> List[Voice]:
+        """
+        Returns the voices that are currently playing.
+        """
+        return [voice for voice in self.voices if voice.active]
+
+    def note_on(
+        self, sound: Sound, note: Hashable = None, velocity: float = 1.0
+    ) -> Voice:
+        """
+        Starts a sound on a free voice, stealing one if the pool is exhausted.
+
+        Released voices are stolen before held ones, and older notes before newer ones.
+
+        Args:
+            sound (Sound): The sound to play.
+            note (Hashable): The key used to release the note. Defaults to the sound frequency.
+            velocity (float): The gain applied to the note (0.0 to 1.0).
+
+        Returns:
+            Voice: The voice playing the sound.
+        """
+        if not 0.0 <= velocity <= 1.0:
+            raise ValueError("Velocity must be between 0.0 and 1.0.")
+
+        voice = next((voice for voice in self.voices if not voice.active), None)
+        if voice is None:
+            voice = min(self.voices, key=lambda voice: (not voice.releasing, voice.order))
+            self.steals += 1
+
+        self._note_count += 1
+        voice.start(
+            sound,
+            sound.frequency.value if note is None else note,
+            velocity,
+            self._note_count,
+        )
+        return voice
+
+    def note_off(self, note: Hashable):
+        """
+        Releases every held voice playing the given note.
+
+        Args:
+            note (Hashable): The key passed to note_on.
+        """
+        for voice in self.voices:
+            if voice.active and voice.note == note:
+                voice.release()
+
+    def render_block(self, num_samples: int = None) -> np.ndarray:
+        """
+        Mixes the next block of all active voices into the preallocated output buffer.
+
+        Args:
+            num_samples (int): The number of samples to render. Defaults to the block size.
+
+        Returns:
+            np.ndarray: A view of the output buffer, valid until the next call.
+        """
+        num_samples = self.block_size if num_samples is None else num_samples
+        if not 0 <= num_samples <= self.block_size:
+            raise ValueError("Number of samples must be between 0 and the block size.")
+
+        output = self._output[:num_samples]
+        active_voices = self.active_voices
+        num_groups = min(
+            self.threads,
+            len(active_voices),
+            num_samples * len(active_voices) // self.MIN_SAMPLES_PER_THREAD,
+        )
+
+        if num_groups <= 1:
+            output.fill(0.0)
+            for voice in active_voices:
+                voice.render(output)
+            return output
+
+        mixes = self._mixes[:num_groups, :num_samples]
+        groups = [active_voices[index::num_groups] for index in range(num_groups)]
+        for future in [
+            self._executor.submit(_render_voices, group, mix)
+            for group, mix in zip(groups, mixes)
+        ]:
+            future.result()
+
+        return np.sum(mixes, axis=0, out=output)
+
+    def close(self):
+        """
+        Shuts down the render threads. The PolySynth renders on the calling thread afterwards.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self.threads = 1
+
+
+def _render_voices(voices: List[Voice], out: np.ndarray):
+    """
+    Renders a group of voices into a cleared buffer.
+    """
+    out.fill(0.0)
+    for voice in voices:
+        voice.render(out)
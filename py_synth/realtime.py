@@ -0,0 +1,252 @@
+import threading
+import time
+from typing import Iterator, Union
+import numpy as np
+
+
+class RealtimePlayer:
+    """
+    A class to play rendered blocks through a callback-driven output stream.
+
+    The stream pulls audio on demand, so playback starts as soon as the first block is
+    rendered. The backend is any object providing ``OutputStream`` and ``CallbackStop``
+    like the ``sounddevice`` module, which is used by default.
+
+    Attributes:
+        sample_rate (int): The sample rate in Hz.
+        block_size (int): The number of frames requested per callback.
+        latency (Union[str, float]): The stream latency in seconds, or 'low' / 'high'.
+        callbacks (int): The number of callbacks served.
+        frames_played (int): The number of frames of audio delivered to the stream.
+        underruns (int): The number of callbacks in which the backend reported an output underflow.
+        late_callbacks (int): The number of callbacks that took longer than the audio they produced.
+    """
+
+    def __init__(
+        self,
+        blocks: Iterator[np.ndarray],
+        sample_rate: int,
+        block_size: int = 256,
+        latency: Union[str, float] = "low",
+        backend=None,
+    ):
+        """
+        Initializes the RealtimePlayer object.
+
+        Args:
+            blocks (Iterator[np.ndarray]): The audio blocks to play, e.g. from Synthesizer.render_blocks.
+            sample_rate (int): The sample rate in Hz.
+            block_size (int): The number of frames requested per callback. Should be positive.
+            latency (Union[str, float]): The stream latency in seconds, or 'low' / 'high'.
+            backend: The stream backend. Defaults to the sounddevice module.
+        """
+        if block_size <= 0:
+            raise ValueError("Block size must be positive.")
+
+        if backend is None:
+            import sounddevice as backend
+
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self.latency = latency
+        self.backend = backend
+        self.callbacks = 0
+        self.frames_played = 0
+        self.underruns = 0
+        self.late_callbacks = 0
+
+        self._blocks = iter(blocks)
+        self._pending = np.zeros(0)
+        self._finished = threading.Event()
+
+    def play(self):
+        """
+        Plays all blocks and waits until the stream has finished.
+        """
+        self._finished.clear()
+        stream = self.backend.OutputStream(
+            samplerate=self.sample_rate,
+            blocksize=self.block_size,
+            channels=1,
+            dtype="float32",
+            latency=self.latency,
+            callback=self.callback,
+            finished_callback=self._finished.set,
+        )
+        with stream:
+            self._finished.wait()
+
+    def callback(self, outdata: np.ndarray, frames: int, time_info, status):
+        """
+        Fills the output buffer with the next frames of audio.
+
+        Args:
+            outdata (np.ndarray): The output buffer of shape (frames, channels).
+            frames (int): The number of frames requested.
+            time_info: The stream timing information.
+            status: The stream status flags.
+        """
+        started = time.perf_counter()
+        self.callbacks += 1
+        if status and status.output_underflow:
+            self.underruns += 1
+
+        filled = 0
+        while filled < frames:
+            if len(self._pending) == 0:
+                self._pending = next(self._blocks, None)
+                if self._pending is None:
+                    self._pending = np.zeros(0)
+                    break
+
+            count = min(frames - filled, len(self._pending))
+            outdata[filled:filled + count, 0] = self._pending[:count]
+            self._pending = self._pending[count:]
+            filled += count
+
+        outdata[filled:] = 0
+        self.frames_played += filled
+
+        if time.perf_counter() - started > frames / self.sample_rate:
+            self.late_callbacks += 1
+
+        if filled < frames:
+            raise self.backend.CallbackStop
+
+
+class FakeStreamBackend:
+    """
+    An offline stand-in for the sounddevice module that records what the callback produced.
+
+    Streams run their callback synchronously until it stops, so real-time code can be
+    exercised without an audio device.
+
+    Attributes:
+        streams (list): The streams opened through this backend.
+        underflow_callbacks (set): The callback indices that report an output underflow.
+    """
+
+    class CallbackStop(Exception):
+        """
+        Raised by a callback to stop the stream after the current buffer.
+        """
+
+    def __init__(self, underflow_callbacks=()):
+        """
+        Initializes the FakeStreamBackend object.
+
+        Args:
+            underflow_callbacks (Iterable[int]): The callback indices that report an output underflow.
+        """
+        self.streams = []
+        self.underflow_callbacks = set(underflow_callbacks)
+
+    def OutputStream(self, **kwargs) -> "FakeOutputStream":
+        """
+        Opens a fake output stream.
+
+        Args:
+            **kwargs: The keyword arguments accepted by sounddevice.OutputStream.
+
+        Returns:
+            FakeOutputStream: The opened stream.
+        """
+        stream = FakeOutputStream(self, **kwargs)
+        self.streams.append(stream)
+        return stream
+
+
+class FakeOutputStream:
+    """
+    A fake output stream that calls its callback in a loop and records each buffer.
+
+    Attributes:
+        samplerate (int): The sample rate in Hz.
+        blocksize (int): The number of frames per callback.
+        channels (int): The number of output channels.
+        dtype (str): The sample format of the output buffers.
+        latency (Union[str, float]): The requested latency.
+        blocks (list): Copies of the buffers produced by the callback.
+    """
+
+    def __init__(
+        self,
+        backend: FakeStreamBackend,
+        samplerate: int,
+        blocksize: int,
+        channels: int,
+        dtype: str,
+        callback,
+        latency: Union[str, float] = "high",
+        finished_callback=None,
+        max_callbacks: int = 1_000_000,
+    ):
+        """
+        Initializes the FakeOutputStream object.
+
+        Args:
+            backend (FakeStreamBackend): The backend that opened the stream.
+            samplerate (int): The sample rate in Hz.
+            blocksize (int): The number of frames per callback.
+            channels (int): The number of output channels.
+            dtype (str): The sample format of the output buffers.
+            callback: The stream callback.
+            latency (Union[str, float]): The requested latency.
+            finished_callback: Called once the stream has stopped.
+            max_callbacks (int): A safety limit on the number of callbacks.
+        """
+        self.backend = backend
+        self.samplerate = samplerate
+        self.blocksize = blocksize
+        self.channels = channels
+        self.dtype = dtype
+        self.latency = latency
+        self.callback = callback
+        self.finished_callback = finished_callback
+        self.max_callbacks = max_callbacks
+        self.blocks = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    @property
+    def output(self) -> np.ndarray:
+        """
+        Returns all recorded buffers as one array of shape (frames, channels).
+        """
+        if not self.blocks:
+            return np.zeros((0, self.channels), dtype=self.dtype)
+        return np.concatenate(self.blocks)
+
+    def start(self):
+        """
+        Runs the callback until it raises CallbackStop, then calls the finished callback.
+        """
+        for index in range(self.max_callbacks):
+            outdata = np.zeros((self.blocksize, self.channels), dtype=self.dtype)
+            status = _FakeCallbackFlags(index in self.backend.underflow_callbacks)
+            try:
+                self.callback(outdata, self.blocksize, None, status)
+            except self.backend.CallbackStop:
+                self.blocks.append(outdata)
+                break
+            self.blocks.append(outdata)
+
+        if self.finished_callback is not None:
+            self.finished_callback()
+
+
+class _FakeCallbackFlags:
+    """
+    The subset of sounddevice.CallbackFlags used by RealtimePlayer.
+    """
+
+    def __init__(self, output_underflow: bool = False):
+        self.output_underflow = output_underflow
+
+    def __bool__(self):
+        return self.output_underflow
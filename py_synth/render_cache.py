@@ -0,0 +1,202 @@
+import hashlib
+import os
+from pathlib import Path
+import threading
+from typing import Hashable, Iterable, Optional, Union
+import numpy as np
+
+from .version import __version__
+
+
+class RenderCache:
+    """
+    A persistent, content-addressed cache of rendered sounds stored as ``.npy`` files.
+
+    Entries are named by a hash of their key and the library version, and are returned
+    memory-mapped and read-only. The least recently used files are deleted to stay within
+    the size cap; a file's modification time records when it was last used.
+
+    Attributes:
+        directory (Path): The directory holding the cached renders.
+        max_bytes (int): The maximum total size of the cached files in bytes.
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that found no entry.
+        evictions (int): The number of files deleted to stay within the size cap.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = 1024 * 1024 * 1024):
+        """
+        Initializes the RenderCache object.
+
+        Args:
+            directory (Union[str, Path]): The cache directory. It is created when the first render is stored.
+            max_bytes (int): The maximum total size of the cached files in bytes. Should not be negative.
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache size must not be negative.")
+
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.path(key).exists()
+
+    def __getstate__(self) -> dict:
+        return {"directory": self.directory, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state["directory"], state["max_bytes"])
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes,
+        }
+
+    @staticmethod
+    def digest(key: Hashable) -> str:
+        """
+        Returns the stable hash of a key, including the library version.
+
+        Args:
+            key (Hashable): A tuple of strings, numbers and None describing a render.
+
+        Returns:
+            str: The hexadecimal SHA-256 digest.
+        """
+        return hashlib.sha256(repr((__version__, key)).encode()).hexdigest()
+
+    def path(self, key: Hashable) -> Path:
+        """
+        Returns the file that holds the render for a key.
+        """
+        return self.directory / f"{self.digest(key)}.npy"
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Looks up a render and marks it as most recently used.
+
+        Args:
+            key (Hashable): The render key.
+
+        Returns:
+            Optional[np.ndarray]: The read-only memory-mapped render, or None if the key is not cached.
+        """
+        path = self.path(key)
+        try:
+            audio = np.load(path, mmap_mode="r")
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return audio
+
+    def put(
+        self,
+        key: Hashable,
+        blocks: Iterable[np.ndarray],
+        num_samples: int,
+        dtype=np.float64,
+    ) -> np.ndarray:
+        """
+        Writes a render block by block and evicts old renders to stay within the size cap.
+
+        The blocks are written straight into a memory-mapped file, so the render is never
+        held in memory as a whole. Renders larger than the whole cap are not stored.
+
+        Args:
+            key (Hashable): The render key.
+            blocks (Iterable[np.ndarray]): The blocks of the render.
+            num_samples (int): The total number of samples in the blocks.
+            dtype (np.dtype): The sample type of the render.
+
+        Returns:
+            np.ndarray: The read-only render, memory-mapped if it was stored.
+        """
+        if num_samples * np.dtype(dtype).itemsize > self.max_bytes:
+            audio = np.empty(num_samples, dtype=dtype)
+            _fill(audio, blocks)
+            audio.setflags(write=False)
+            return audio
+
+        path = self.path(key)
+        self.directory.mkdir(exist_ok=True, parents=True)
+        # Written under a temporary name, so concurrent readers never see a partial file.
+        temporary = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        audio = np.lib.format.open_memmap(
+            temporary, mode="w+", dtype=dtype, shape=(num_samples,)
+        )
+        try:
+            _fill(audio, blocks)
+            audio.flush()
+            del audio
+            os.replace(temporary, path)
+        finally:
+            if temporary.exists():
+                temporary.unlink()
+
+        self.evict(keep=path)
+        return np.load(path, mmap_mode="r")
+
+    def evict(self, keep: Path = None):
+        """
+        Deletes the least recently used renders until the cache fits its size cap.
+
+        Args:
+            keep (Path): A file that is not deleted, e.g. the render that was just stored.
+        """
+        with self._lock:
+            entries = []
+            for path in self.directory.glob("*.npy"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Deletes all cached renders and resets the statistics.
+        """
+        with self._lock:
+            for path in self.directory.glob("*.npy"):
+                path.unlink(missing_ok=True)
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+def _fill(audio: np.ndarray, blocks: Iterable[np.ndarray]):
+    """
+    Copies consecutive blocks into an array.
+    """
+    offset = 0
+    for block in blocks:
+        audio[offset:offset + len(block)] = block
+        offset += len(block)
@@ -0,0 +1,114 @@
+import math
+import os
+from typing import Callable, List
+
+from .sound import Sound
+
+
+class RenderJob:
+    """
+    A class to describe one file rendered by Synthesizer.render_many.
+
+    Jobs only hold the sound parameters, so sending them to a worker process is cheap.
+
+    Attributes:
+        sound (Sound): The sound to render.
+        filename (str): The name of the file, without extension.
+        file_format (str): The file format (e.g., 'wav', 'flac', 'ogg').
+        subtype (str): The sample encoding, or None for the format's default.
+    """
+
+    def __init__(
+        self, sound: Sound, filename: str, file_format: str = "wav", subtype: str = None
+    ):
+        """
+        Initializes the RenderJob object.
+
+        Args:
+            sound (Sound): The sound to render.
+            filename (str): The name of the file, without extension.
+            file_format (str): The file format (e.g., 'wav', 'flac', 'ogg').
+            subtype (str): The sample encoding, or None for the format's default.
+        """
+        self.sound = sound
+        self.filename = filename
+        self.file_format = file_format
+        self.subtype = subtype
+
+
+def render_many(
+    config: dict,
+    jobs: List[RenderJob],
+    workers: int = None,
+    progress: Callable[[int, int], None] = None,
+    chunksize: int = None,
+) -> List[int]:
+    """
+    Renders jobs on a pool of worker processes that each write their files to disk.
+
+    Args:
+        config (dict): The keyword arguments used to create the Synthesizer in each worker.
+        jobs (List[RenderJob]): The files to render.
+        workers (int): The number of worker processes. Defaults to the number of CPUs.
+        progress (Callable[[int, int], None]): Called with the number of finished and total jobs.
+        chunksize (int): The number of jobs sent to a worker at a time.
+
+    Returns:
+        List[int]: The number of samples written for each job, in job order.
+    """
+    jobs = list(jobs)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("Number of workers must be positive.")
+    if not jobs:
+        return []
+
+    # Imported here: loading multiprocessing would slow down `import py_synth`.
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    chunksize = chunksize or math.ceil(len(jobs) / (workers * 4))
+    chunks = [
+        (start, jobs[start:start + chunksize]) for start in range(0, len(jobs), chunksize)
+    ]
+    results = [None] * len(jobs)
+    done = 0
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(config,)
+    ) as executor:
+        futures = {
+            executor.submit(_render_chunk, chunk): start for start, chunk in chunks
+        }
+        for future in as_completed(futures):
+            counts = future.result()
+            start = futures[future]
+            results[start:start + len(counts)] = counts
+            done += len(counts)
+            if progress is not None:
+                progress(done, len(jobs))
+
+    return results
+
+
+_synthesizer = None
+
+
+def _init_worker(config: dict):
+    """
+    Creates the Synthesizer used by a worker process.
+    """
+    from .synthesizer import Synthesizer
+
+    global _synthesizer
+    _synthesizer = Synthesizer(**config)
+
+
+def _render_chunk(jobs: List[RenderJob]) -> List[int]:
+    """
+    Renders a chunk of jobs in a worker process.
+    """
+    return [
+        _synthesizer.save_sound(job.sound, job.filename, job.file_format, job.subtype)
+        for job in jobs
+    ]
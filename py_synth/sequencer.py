@@ -0,0 +1,430 @@
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Union
+import numpy as np
+
+from .adsr_parameter import ADSREnvelope
+from .frequency import BaseFrequency
+from .midi import read_midi
+from .modulation import Modulator
+from .notes import Notes
+from .pitch import TuningSystem, midi_to_frequency
+from .poly_synth import PolySynth
+from .sound import SampleRate, Sound
+from .value_object import ValueObject
+from .waveform import WaveformType
+
+
+class Instrument(ValueObject):
+    """
+    A class to describe how the notes of a score are played.
+
+    Attributes:
+        waveform_type (WaveformType): The type of waveform to generate.
+        envelope (ADSREnvelope): The ADSR envelope applied to every note.
+        frequency_modulation (Modulator): The pitch modulation of every note in semitones, or None.
+    """
+
+    __slots__ = ("waveform_type", "envelope", "frequency_modulation")
+
+    def __init__(
+        self,
+        waveform_type: WaveformType,
+        envelope: ADSREnvelope,
+        frequency_modulation: Modulator = None,
+    ):
+        """
+        Initializes the Instrument object.
+
+        Args:
+            waveform_type (WaveformType): The type of waveform to generate.
+            envelope (ADSREnvelope): The ADSR envelope applied to every note.
+            frequency_modulation (Modulator): The pitch modulation of every note in semitones,
+                restarted at each note, e.g. an LFO for vibrato.
+        """
+        self._set("waveform_type", waveform_type)
+        self._set("envelope", envelope)
+        self._set("frequency_modulation", frequency_modulation)
+
+    def sound(self, frequency: float, duration: float) -> Sound:
+        """
+        Returns the sound of one note played on the instrument.
+
+        Args:
+            frequency (float): The frequency of the note in Hz.
+            duration (float): The duration of the note in seconds, including its release.
+
+        Returns:
+            Sound: The sound of the note.
+        """
+        return Sound(
+            self.waveform_type,
+            BaseFrequency(frequency),
+            duration,
+            self.envelope,
+            frequency_modulation=self.frequency_modulation,
+        )
+
+
+class Score:
+    """
+    A class to hold timed note events in sorted arrays.
+
+    Events are appended in any order and sorted by start sample when they are first read.
+
+    Attributes:
+        sample_rate (int): The sample rate the event times are quantized to, in Hz.
+        instruments (List[Instrument]): The distinct instruments used by the events.
+    """
+
+    def __init__(self, sample_rate: SampleRate = SampleRate.CD_QUALITY):
+        """
+        Initializes an empty Score object.
+
+        Args:
+            sample_rate (SampleRate): The sample rate the event times are quantized to.
+        """
+        self.sample_rate = sample_rate.value
+        self.instruments: List[Instrument] = []
+
+        self._instrument_indices = {}
+        self._pending = ([], [], [], [], [])
+        self._pending_arrays = []
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._frequencies = np.zeros(0)
+        self._durations = np.zeros(0)
+        self._velocities = np.zeros(0)
+        self._instrument_ids = np.zeros(0, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return (
+            len(self._starts)
+            + len(self._pending[0])
+            + sum(len(arrays[0]) for arrays in self._pending_arrays)
+        )
+
+    @classmethod
+    def from_midi(
+        cls,
+        file: Union[str, Path, BinaryIO],
+        instrument: Union[Instrument, Dict[int, Instrument]],
+        sample_rate: SampleRate = SampleRate.CD_QUALITY,
+        a4: float = 440.0,
+        tuning: TuningSystem = TuningSystem.EQUAL_TEMPERAMENT,
+    ) -> "Score":
+        """
+        Creates a score from the notes of a Standard MIDI File.
+
+        Args:
+            file (Union[str, Path, BinaryIO]): The path or binary file object to read.
+            instrument (Union[Instrument, Dict[int, Instrument]]): The instrument for all notes, or
+                the instrument for each MIDI channel (0 to 15). Notes on other channels are skipped.
+            sample_rate (SampleRate): The sample rate the event times are quantized to.
+            a4 (float): The frequency of A4 (note 69) in Hz.
+            tuning (TuningSystem): The tuning system the note numbers are converted with.
+
+        Returns:
+            Score: The score.
+        """
+        midi = read_midi(file)
+        if isinstance(instrument, Instrument):
+            instrument = {channel: instrument for channel in range(16)}
+
+        frequencies = midi_to_frequency(midi.notes, a4, tuning)
+        score = cls(sample_rate)
+        for channel, channel_instrument in instrument.items():
+            # Notes that end on the tick they start are inaudible.
+            selected = (midi.channels == channel) & (midi.durations > 0)
+            if selected.any():
+                score.add_many(
+                    midi.starts[selected],
+                    frequencies[selected],
+                    midi.durations[selected],
+                    channel_instrument,
+                    midi.velocities[selected] / 127.0,
+                )
+        return score
+
+    def add(
+        self,
+        start: float,
+        note: Union[Notes, float],
+        duration: float,
+        instrument: Instrument,
+        velocity: float = 1.0,
+    ):
+        """
+        Adds a note event.
+
+        Args:
+            start (float): The start time in seconds. Should not be negative.
+            note (Union[Notes, float]): The pitch, as a note or a frequency in Hz.
+            duration (float): The duration of the note in seconds, including its release. Should be positive.
+            instrument (Instrument): The instrument that plays the note.
+            velocity (float): The gain applied to the note (0.0 to 1.0).
+        """
+        if start < 0:
+            raise ValueError("Start time must not be negative.")
+        if duration <= 0:
+            raise ValueError("Duration must be positive.")
+        if not 0.0 <= velocity <= 1.0:
+            raise ValueError("Velocity must be between 0.0 and 1.0.")
+
+        if instrument not in self._instrument_indices:
+            self._instrument_indices[instrument] = len(self.instruments)
+            self.instruments.append(instrument)
+
+        starts, frequencies, durations, velocities, instrument_ids = self._pending
+        starts.append(round(start * self.sample_rate))
+        frequencies.append(note.value if isinstance(note, Notes) else note)
+        durations.append(duration)
+        velocities.append(velocity)
+        instrument_ids.append(self._instrument_indices[instrument])
+
+    def add_many(
+        self,
+        starts: np.ndarray,
+        frequencies: np.ndarray,
+        durations: np.ndarray,
+        instrument: Instrument,
+        velocities: Union[np.ndarray, float] = 1.0,
+    ):
+        """
+        Adds many note events played by one instrument at once.
+
+        Args:
+            starts (np.ndarray): The start times in seconds. Should not be negative.
+            frequencies (np.ndarray): The frequencies in Hz.
+            durations (np.ndarray): The durations in seconds, including the release. Should be positive.
+            instrument (Instrument): The instrument that plays the notes.
+            velocities (Union[np.ndarray, float]): The gains applied to the notes (0.0 to 1.0).
+        """
+        starts = np.asarray(starts, dtype=np.float64)
+        frequencies, durations, velocities = (
+            np.broadcast_to(np.asarray(values, dtype=np.float64), starts.shape)
+            for values in (frequencies, durations, velocities)
+        )
+        if np.any(starts < 0):
+            raise ValueError("Start time must not be negative.")
+        if np.any(durations <= 0):
+            raise ValueError("Duration must be positive.")
+        if np.any((velocities < 0.0) | (velocities > 1.0)):
+            raise ValueError("Velocity must be between 0.0 and 1.0.")
+
+        if instrument not in self._instrument_indices:
+            self._instrument_indices[instrument] = len(self.instruments)
+            self.instruments.append(instrument)
+
+        self._pending_arrays.append(
+            (
+                np.round(starts * self.sample_rate).astype(np.int64),
+                frequencies,
+                durations,
+                velocities,
+                np.full(len(starts), self._instrument_indices[instrument], dtype=np.int32),
+            )
+        )
+
+    @property
+    def starts(self) -> np.ndarray:
+        """
+        Returns the sorted start samples of all events.
+        """
+        self._sort()
+        return self._starts
+
+    @property
+    def num_samples(self) -> int:
+        """
+        Returns the number of samples until the last note has finished.
+        """
+        self._sort()
+        if not len(self._starts):
+            return 0
+        ends = self._starts + (self._durations * self.sample_rate).astype(np.int64)
+        return int(ends.max())
+
+    def events_between(self, start: int, stop: int) -> range:
+        """
+        Finds the events starting in a range of samples with a binary search.
+
+        Args:
+            start (int): The first sample of the range.
+            stop (int): The sample after the range.
+
+        Returns:
+            range: The indices of the events, in start order.
+        """
+        starts = self.starts
+        return range(
+            int(np.searchsorted(starts, start, side="left")),
+            int(np.searchsorted(starts, stop, side="left")),
+        )
+
+    def sound(self, index: int) -> Sound:
+        """
+        Returns the sound of an event.
+
+        Args:
+            index (int): The index of the event in start order.
+
+        Returns:
+            Sound: The sound played by the event.
+        """
+        self._sort()
+        instrument = self.instruments[self._instrument_ids[index]]
+        return instrument.sound(
+            float(self._frequencies[index]), float(self._durations[index])
+        )
+
+    def velocity(self, index: int) -> float:
+        """
+        Returns the velocity of an event.
+
+        Args:
+            index (int): The index of the event in start order.
+        """
+        self._sort()
+        return float(self._velocities[index])
+
+    def _sort(self):
+        """
+        Merges the pending events into the sorted arrays.
+        """
+        if not self._pending[0] and not self._pending_arrays:
+            return
+
+        starts, frequencies, durations, velocities, instrument_ids = self._pending
+        chunks = [
+            (
+                self._starts,
+                self._frequencies,
+                self._durations,
+                self._velocities,
+                self._instrument_ids,
+            ),
+            *self._pending_arrays,
+            (
+                np.array(starts, dtype=np.int64),
+                np.array(frequencies, dtype=np.float64),
+                np.array(durations, dtype=np.float64),
+                np.array(velocities, dtype=np.float64),
+                np.array(instrument_ids, dtype=np.int32),
+            ),
+        ]
+        (
+            self._starts,
+            self._frequencies,
+            self._durations,
+            self._velocities,
+            self._instrument_ids,
+        ) = (np.concatenate(columns) for columns in zip(*chunks))
+        self._pending = ([], [], [], [], [])
+        self._pending_arrays = []
+
+        # A stable sort keeps events that start together in the order they were added.
+        order = np.argsort(self._starts, kind="stable")
+        self._starts = self._starts[order]
+        self._frequencies = self._frequencies[order]
+        self._durations = self._durations[order]
+        self._velocities = self._velocities[order]
+        self._instrument_ids = self._instrument_ids[order]
+
+
+class Sequencer:
+    """
+    A class to play a Score on a PolySynth block by block.
+
+    The events starting in each block are found with a binary search and their notes are
+    started at their exact sample by splitting the block, so the cost of a block depends
+    on the voices playing in it and not on the size of the score.
+
+    Attributes:
+        score (Score): The score to play.
+        poly_synth (PolySynth): The synthesizer that plays the notes.
+        position (int): The next sample to render.
+    """
+
+    def __init__(self, score: Score, poly_synth: PolySynth):
+        """
+        Initializes the Sequencer object at the start of the score.
+
+        Args:
+            score (Score): The score to play.
+            poly_synth (PolySynth): The synthesizer that plays the notes. Should use the score's sample rate.
+        """
+        if score.sample_rate != poly_synth.sample_rate:
+            raise ValueError("Score and PolySynth sample rates must match.")
+
+        self.score = score
+        self.poly_synth = poly_synth
+        self.position = 0
+
+        self._output = np.zeros(poly_synth.block_size, dtype=poly_synth.dtype)
+
+    def seek(self, position: int):
+        """
+        Moves to a sample and silences all voices. Notes starting before it are not played.
+
+        Args:
+            position (int): The next sample to render.
+        """
+        for voice in self.poly_synth.voices:
+            voice.stop()
+        self.position = position
+
+    def render_block(self, num_samples: int = None) -> np.ndarray:
+        """
+        Renders the next block of the score.
+
+        Args:
+            num_samples (int): The number of samples to render. Defaults to the PolySynth block size.
+
+        Returns:
+            np.ndarray: A view of the output buffer, valid until the next call.
+        """
+        num_samples = self.poly_synth.block_size if num_samples is None else num_samples
+        if not 0 <= num_samples <= self.poly_synth.block_size:
+            raise ValueError("Number of samples must be between 0 and the block size.")
+
+        output = self._output[:num_samples]
+        starts = self.score.starts
+        rendered = 0
+        for index in self.score.events_between(self.position, self.position + num_samples):
+            offset = int(starts[index]) - self.position
+            if offset > rendered:
+                output[rendered:offset] = self.poly_synth.render_block(offset - rendered)
+                rendered = offset
+            self.poly_synth.note_on(
+                self.score.sound(index), index, self.score.velocity(index)
+            )
+
+        if rendered < num_samples:
+            output[rendered:] = self.poly_synth.render_block(num_samples - rendered)
+
+        self.position += num_samples
+        return output
+
+    def render_blocks(self) -> Iterator[np.ndarray]:
+        """
+        Renders the rest of the score block by block.
+
+        Yields:
+            np.ndarray: The next block, a view of the output buffer. The last block may be shorter.
+        """
+        end = self.score.num_samples
+        while self.position < end:
+            yield self.render_block(min(self.poly_synth.block_size, end - self.position))
+
+    def render(self) -> np.ndarray:
+        """
+        Renders the rest of the score into one array.
+
+        Returns:
+            np.ndarray: The rendered audio.
+        """
+        audio = np.empty(max(self.score.num_samples - self.position, 0), self.poly_synth.dtype)
+        offset = 0
+        for block in self.render_blocks():
+            audio[offset:offset + len(block)] = block
+            offset += len(block)
+        return audio
@@ -1,8 +1,12 @@
 from enum import Enum
+from typing import Optional
+import numpy as np
 
 from .waveform import WaveformType
 from .frequency import BaseFrequency
 from .adsr_parameter import ADSREnvelope
+from .modulation import Modulator
+from .value_object import ValueObject
 
 
 class SampleRate(Enum):
@@ -17,23 +21,39 @@ class SampleRate(Enum):
     HIGH_RESOLUTION = 192000
 
 
-class Sound:
+class Sound(ValueObject):
     """
     A class to encapsulate all options to modify the sound.
 
+    Sounds are immutable and compare by their parameters, so they can be used as cache keys.
+
     Attributes:
         waveform_type (WaveformType): The type of waveform to generate.
         frequency (BaseFrequency): The frequency of the waveform.
         duration (float): The duration of the sound in seconds.
         envelope (ADSREnvelope): The ADSR envelope options.
+        seed (int): The seed of the NOISE generator, or None for a different noise on every render.
+        frequency_modulation (Modulator): The pitch offset from frequency in semitones over
+            time, or None for a constant frequency.
     """
 
+    __slots__ = (
+        "waveform_type",
+        "frequency",
+        "duration",
+        "envelope",
+        "seed",
+        "frequency_modulation",
+    )
+
     def __init__(
         self,
         waveform_type: WaveformType,
         frequency: BaseFrequency,
         duration: float,
         envelope: ADSREnvelope,
+        seed: int = None,
+        frequency_modulation: Modulator = None,
     ):
         """
         Initializes the Sound object with the specified parameters.
@@ -43,11 +63,81 @@ class Sound:
             frequency (BaseFrequency): The frequency of the waveform.
             duration (float): The duration of the sound in seconds. Should be positive.
             envelope (ADSREnvelope): The ADSR envelope options.
+            seed (int): The seed of the NOISE generator. Seeded noise renders identically every time.
+            frequency_modulation (Modulator): Modulates the pitch in semitones, e.g. an LFO for
+                vibrato or a Ramp for a pitch drop. 12 doubles the frequency.
         """
         if duration <= 0:
             raise ValueError("Duration must be positive.")
 
-        self.waveform_type = waveform_type
-        self.frequency = frequency
-        self.duration = duration
-        self.envelope = envelope
+        self._set("waveform_type", waveform_type)
+        self._set("frequency", frequency)
+        self._set("duration", duration)
+        self._set("envelope", envelope)
+        self._set("seed", seed)
+        self._set("frequency_modulation", frequency_modulation)
+
+    @property
+    def deterministic(self) -> bool:
+        """
+        Returns whether every render of the sound produces the same samples.
+        """
+        return self.waveform_type != WaveformType.NOISE or self.seed is not None
+
+    def cache_key(self) -> tuple:
+        """
+        Returns a hashable key describing the sound parameters.
+
+        Returns:
+            tuple: The waveform type, frequency, duration, envelope key, seed and modulation key.
+        """
+        return (
+            self.waveform_type.name,
+            self.frequency.value,
+            self.duration,
+            tuple(
+                (name, value, None if curve is None else curve.name)
+                for name, value, curve in self.envelope.cache_key()
+            ),
+            self.seed,
+            None if self.frequency_modulation is None else self.frequency_modulation.cache_key(),
+        )
+
+    def frequency_block(
+        self,
+        sample_rate: int,
+        offset: int,
+        num_samples: int,
+        control_interval: int = 1,
+        out: np.ndarray = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Generates the frequency of each sample of a block.
+
+        The modulation is converted from semitones to Hz before it is interpolated, so with
+        a control interval above 1 the conversion also runs at control rate.
+
+        Args:
+            sample_rate (int): The sample rate in Hz.
+            offset (int): The index of the first sample of the block.
+            num_samples (int): The number of samples in the block.
+            control_interval (int): The number of samples between evaluations of the modulator.
+            out (np.ndarray): A float64 buffer of num_samples samples to write the block into.
+
+        Returns:
+            Optional[np.ndarray]: The frequencies in Hz, or None if the frequency is not modulated.
+        """
+        if self.frequency_modulation is None:
+            return None
+        return self.frequency_modulation.generate_block(
+            sample_rate, offset, num_samples, control_interval, out, self._semitones_to_frequency
+        )
+
+    def _semitones_to_frequency(self, semitones: np.ndarray) -> np.ndarray:
+        """
+        Converts pitch offsets in semitones to frequencies in Hz, in place.
+        """
+        semitones /= 12
+        np.exp2(semitones, out=semitones)
+        semitones *= self.frequency.value
+        return semitones
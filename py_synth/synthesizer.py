@@ -1,10 +1,17 @@
-from pathlib import Path
+import time
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 import numpy as np
-import sounddevice as sd
-import soundfile as sf
 
+from .audio_backend import AudioBackend, SoundDeviceBackend, SoundFileBackend
+from .cache import LRUCache
+from .instrumentation import Instrumentation, RenderStats
+from .overview import OverviewBuilder
 from .sound import SampleRate, Sound
-from .waveform import Waveform
+from .waveform import Waveform, WaveformType, check_dtype
+from .wavetable import Interpolation, Wavetable, WavetableOscillator
+from .realtime import RealtimePlayer
+from .render_cache import RenderCache
+from .render_farm import RenderJob, render_many
 from .synthesizer_debugger import SynthesizerDebugger
 
 
@@ -15,29 +22,98 @@ class Synthesizer:
     Attributes:
         sample_rate (int): The sample rate in Hz.
         waveform (Waveform): The waveform generator object.
-        debugger (Debugger): The debugger object for plotting and printing samples.
+        show (bool): Whether play_sound plots the waveform, envelope and audio.
+        debug (bool): Whether play_sound prints samples of the waveform, envelope and audio.
+        plot_file (str): The PNG or SVG file that plots are saved to, or None to show them in a window.
+        overview (bool): Whether save_sound and save_score store an Overview next to each file.
+        debugger (SynthesizerDebugger): The debugger of the last sound played with show or debug.
+        block_size (int): The number of samples rendered per block.
+        envelope_cache (LRUCache): The cache of generated envelopes, or None to disable caching.
+        band_limited (bool): Whether SQUARE, SAWTOOTH and PULSE are rendered with PolyBLEP anti-aliasing.
+        wavetable_size (int): The size of the shared wavetables used for oscillators, or None to compute waveforms directly.
+        interpolation (Interpolation): The interpolation used when reading wavetables.
+        control_interval (int): The number of samples between evaluations of modulators.
+        dtype (np.dtype): The floating point type used through the whole render path.
+        playback_backend (AudioBackend): The destination of play_sound.
+        file_backend (AudioBackend): The destination of save_sound.
+        render_cache (RenderCache): The persistent cache of rendered sounds, or None to disable it.
+        instrumentation (Instrumentation): The measurements of renders, or None to disable them.
     """
 
-    _DIR = Path(__file__).resolve().parent
-    _FILES_DIR = _DIR.parent / "files"
+    BLOCK_SIZE = 4096
 
     def __init__(
-        self, sample_rate: SampleRate = SampleRate.CD_QUALITY, show=True, debug=False
+        self,
+        sample_rate: SampleRate = SampleRate.CD_QUALITY,
+        show=False,
+        debug=False,
+        block_size: int = BLOCK_SIZE,
+        envelope_cache: LRUCache = None,
+        band_limited: bool = False,
+        wavetable_size: int = None,
+        interpolation: Interpolation = Interpolation.LINEAR,
+        dtype=np.float64,
+        playback_backend: AudioBackend = None,
+        file_backend: AudioBackend = None,
+        render_cache: RenderCache = None,
+        instrumentation: Instrumentation = None,
+        plot_file: str = None,
+        overview: bool = False,
+        control_interval: int = 1,
     ):
         """
         Initializes the Synthesizer object with a sample rate.
 
         Args:
             sample_rate (SampleRate): The sample rate in Hz.
+            show (bool): Whether play_sound plots a decimated outline of the waveform, envelope and audio.
+            debug (bool): Whether play_sound prints samples of the waveform, envelope and audio.
+            block_size (int): The number of samples rendered per block. Should be positive.
+            envelope_cache (LRUCache): A cache for envelopes that are rendered repeatedly.
+            band_limited (bool): Whether to render band-limited SQUARE, SAWTOOTH and PULSE waves.
+            wavetable_size (int): Render oscillators from shared wavetables of this power-of-two size.
+            interpolation (Interpolation): The interpolation used when reading wavetables.
+            dtype (np.dtype): The sample type to render in. float32 halves memory and bandwidth.
+            playback_backend (AudioBackend): Where play_sound sends audio. Defaults to the sound device.
+            file_backend (AudioBackend): Where save_sound writes files. Defaults to the files directory next to the package.
+            render_cache (RenderCache): A persistent cache that render and save_sound serve repeated sounds from.
+            instrumentation (Instrumentation): Records the time of each render stage, the block
+                latencies and the real-time factor of render, render_blocks, save_sound,
+                save_score and play_sound.
+            plot_file (str): Save plots to this PNG or SVG file with a non-interactive backend
+                instead of showing them in a window.
+            overview (bool): Build a min/max/RMS overview of each saved file while it is written
+                and store it next to the file through the file backend.
+            control_interval (int): Evaluate modulators every this many samples and interpolate
+                linearly in between. 1 evaluates them at every sample; 32 to 64 is usually
+                inaudible for vibrato and pitch sweeps and much cheaper.
         """
+        if block_size <= 0:
+            raise ValueError("Block size must be positive.")
+        if control_interval <= 0:
+            raise ValueError("Control interval must be positive.")
+
         self.show = show
         self.debug = debug
+        self.plot_file = plot_file
+        self.overview = overview
         self.sample_rate = sample_rate.value
-        self.waveform = Waveform(self.sample_rate)
+        self.block_size = block_size
+        self.envelope_cache = envelope_cache
+        self.band_limited = band_limited
+        self.wavetable_size = wavetable_size
+        self.interpolation = interpolation
+        self.control_interval = control_interval
+        self.dtype = check_dtype(dtype)
+        self.waveform = Waveform(
+            self.sample_rate, band_limited=band_limited, dtype=self.dtype
+        )
+        self.playback_backend = playback_backend or SoundDeviceBackend()
+        self.file_backend = file_backend or SoundFileBackend()
+        self.render_cache = render_cache
+        self.instrumentation = instrumentation
         self.debugger = None
 
-        self._FILES_DIR.mkdir(exist_ok=True, parents=True)
-
     def set_debugger(self, sound: Sound):
         """
         Sets the debugger object for plotting and printing samples based on the sound duration.
@@ -45,56 +121,560 @@ class Synthesizer:
         Args:
             sound (Sound): The sound object containing the duration.
         """
-        t = np.linspace(
-            0, sound.duration, int(self.sample_rate * sound.duration), endpoint=False
+        self.debugger = SynthesizerDebugger(
+            self.sample_rate, int(self.sample_rate * sound.duration)
+        )
+
+    def render_blocks(
+        self, sound: Sound, block_size: int = None, out: np.ndarray = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Renders a sound block by block.
+
+        The oscillator phase and envelope position are carried across blocks, so the
+        concatenated blocks form one continuous sound while only one block is held in memory.
+
+        Args:
+            sound (Sound): The sound parameters encapsulated in a Sound object.
+            block_size (int): The number of samples per block. Defaults to the synthesizer block size.
+            out (np.ndarray): A buffer of at least block_size samples that every block is rendered
+                into. Without it each block is a new array.
+
+        Yields:
+            np.ndarray: The next block of audio. The last block may be shorter. When ``out`` is
+            given, the block is a view of it that is overwritten by the next block.
+        """
+        stats = self._begin("render_blocks")
+        blocks = self._audio_blocks(sound, block_size, out, stats)
+        try:
+            for block in self._measured(blocks, stats):
+                yield block if out is not None else block.copy()
+        finally:
+            self._finish(stats)
+
+    def render(self, sound: Sound) -> np.ndarray:
+        """
+        Renders a whole sound into one array.
+
+        With a render cache, repeated sounds are loaded memory-mapped without copying and new
+        ones are written straight into the cache. NOISE is only cached when it is seeded.
+
+        Args:
+            sound (Sound): The sound parameters encapsulated in a Sound object.
+
+        Returns:
+            np.ndarray: The rendered sound. Cached renders are read-only.
+        """
+        num_samples = int(self.sample_rate * sound.duration)
+        buffer = np.empty(self.block_size, dtype=self.dtype)
+        stats = self._begin("render")
+        started = time.perf_counter()
+        blocks = self._measured(self._audio_blocks(sound, None, buffer, stats), stats)
+        key = self._render_key(sound)
+        if key is None:
+            audio = np.empty(num_samples, dtype=self.dtype)
+            offset = 0
+            for block in blocks:
+                audio[offset:offset + len(block)] = block
+                offset += len(block)
+        else:
+            audio = self.render_cache.get(key)
+            if audio is None:
+                audio = self.render_cache.put(key, blocks, num_samples, self.dtype)
+            elif stats is not None:
+                self.instrumentation.block(stats, len(audio), time.perf_counter() - started)
+
+        self._finish(stats)
+        return audio
+
+    def _render_key(self, sound: Sound) -> Optional[tuple]:
+        """
+        Returns the render cache key of a sound, or None if it cannot be cached.
+
+        The key holds every setting that changes the rendered samples.
+        """
+        if self.render_cache is None or not sound.deterministic:
+            return None
+
+        return (
+            sound.cache_key(),
+            self.sample_rate,
+            self.dtype.name,
+            self.band_limited,
+            self.wavetable_size,
+            None if self.wavetable_size is None else self.interpolation.name,
+            None if sound.frequency_modulation is None else self.control_interval,
+        )
+
+    def render_batch(self, sounds: List[Sound]) -> List[np.ndarray]:
+        """
+        Renders many sounds at once, vectorizing over sounds that share a waveform type and length.
+
+        Each group is rendered as one (sounds x samples) array. Envelopes are generated once
+        per envelope object and duration within a group and broadcast over its rows. Sounds
+        that render needs to treat individually, because they use wavetables, NOISE or
+        frequency modulation, are rendered one by one with render, so every sound matches
+        render up to rounding.
+
+        The per-sample waveform math is the same as in render, so the gain over a loop is
+        bounded by the Python overhead per block that it removes: about 1.3x to 1.6x for
+        short one-shots (see benchmarks/bench_batch.py).
+
+        Args:
+            sounds (List[Sound]): The sounds to render.
+
+        Returns:
+            List[np.ndarray]: The rendered sounds in input order. Batched sounds are views into
+            the group arrays.
+        """
+        groups = {}
+        rendered = [None] * len(sounds)
+        for index, sound in enumerate(sounds):
+            if not self._batchable(sound):
+                rendered[index] = self.render(sound)
+                continue
+            num_samples = int(self.sample_rate * sound.duration)
+            envelope_key = (sound.envelope, sound.duration)
+            group = groups.setdefault((sound.waveform_type, num_samples), {})
+            group.setdefault(envelope_key, []).append(index)
+
+        for (waveform_type, num_samples), envelope_groups in groups.items():
+            # Rows sharing an envelope are contiguous, so each envelope broadcasts over a slice.
+            indices = [index for group in envelope_groups.values() for index in group]
+            audio = self.waveform.generate_batch(
+                waveform_type,
+                [sounds[index].frequency.value for index in indices],
+                num_samples,
+            )
+
+            row = 0
+            for group in envelope_groups.values():
+                sound = sounds[group[0]]
+                envelope = sound.envelope.generate(
+                    self.sample_rate, sound.duration, self.envelope_cache, self.dtype
+                )
+                # Scaling the envelope instead of the audio saves a pass over the group.
+                audio[row:row + len(group)] *= envelope * self.dtype.type(0.5)
+                row += len(group)
+
+            for row, index in enumerate(indices):
+                rendered[index] = audio[row]
+
+        return rendered
+
+    def _batchable(self, sound: Sound) -> bool:
+        """
+        Returns whether render_batch can render a sound in a group with Waveform.generate_batch.
+        """
+        return (
+            self.wavetable_size is None
+            and sound.waveform_type != WaveformType.NOISE
+            and sound.frequency_modulation is None
+        )
+
+    def _render_stages(
+        self,
+        sound: Sound,
+        block_size: int = None,
+        out: np.ndarray = None,
+        stats: RenderStats = None,
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Renders a sound block by block, keeping the intermediate stages.
+
+        The stages are written into buffers allocated once per sound, so the yielded
+        arrays are views that are overwritten by the next block.
+
+        Args:
+            sound (Sound): The sound parameters encapsulated in a Sound object.
+            block_size (int): The number of samples per block. Defaults to the synthesizer block size.
+            out (np.ndarray): A buffer of at least block_size samples for the audio.
+            stats (RenderStats): The stats that the time of each stage is added to, or None.
+
+        Yields:
+            tuple: The waveform, envelope and audio of the next block.
+        """
+        block_size = block_size or self.block_size
+        if block_size <= 0:
+            raise ValueError("Block size must be positive.")
+        if out is None:
+            out = np.empty(block_size, dtype=self.dtype)
+        elif len(out) < block_size:
+            raise ValueError("Output buffer must hold at least one block.")
+
+        num_samples = int(self.sample_rate * sound.duration)
+        oscillator = self.oscillator(sound)
+
+        cached_envelope = None
+        if (
+            self.envelope_cache is not None
+            and num_samples * self.dtype.itemsize <= self.envelope_cache.max_bytes
+        ):
+            cached_envelope = sound.envelope.generate(
+                self.sample_rate, sound.duration, self.envelope_cache, self.dtype
+            )
+
+        waveform_buffer = np.empty(block_size, dtype=self.dtype)
+        envelope_buffer = np.empty(block_size, dtype=self.dtype)
+        # The frequency stays float64 so that integrating it keeps the phase precise.
+        frequency_buffer = None if sound.frequency_modulation is None else np.empty(block_size)
+        for offset in range(0, num_samples, block_size):
+            count = min(block_size, num_samples - offset)
+            if stats is not None:
+                started = time.perf_counter()
+            frequency = None
+            if frequency_buffer is not None:
+                frequency = sound.frequency_block(
+                    self.sample_rate, offset, count, self.control_interval, frequency_buffer[:count]
+                )
+            waveform = oscillator.generate(count, out=waveform_buffer[:count], frequency=frequency)
+            if stats is not None:
+                generated = time.perf_counter()
+                stats.add("oscillator", generated - started, count)
+            if cached_envelope is not None:
+                envelope = cached_envelope[offset:offset + count]
+            else:
+                if stats is not None:
+                    curve_seconds = stats.stages["curve"].seconds
+                envelope = sound.envelope.generate_block(
+                    self.sample_rate,
+                    sound.duration,
+                    offset,
+                    count,
+                    out=envelope_buffer[:count],
+                    stats=stats,
+                )
+            if stats is not None:
+                enveloped = time.perf_counter()
+                seconds = enveloped - generated
+                if cached_envelope is None:
+                    # The curves inside the envelope are their own stage.
+                    seconds -= stats.stages["curve"].seconds - curve_seconds
+                stats.add("envelope", seconds, count)
+
+            audio = np.multiply(waveform, envelope, out=out[:count])
+            audio *= 0.5
+            if stats is not None:
+                stats.add("mix", time.perf_counter() - enveloped, count)
+            yield waveform, envelope, audio
+
+    def _audio_blocks(
+        self,
+        sound: Sound,
+        block_size: int = None,
+        out: np.ndarray = None,
+        stats: RenderStats = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Renders a sound block by block into views of a buffer, recording the stages in stats.
+        """
+        for _, _, audio in self._render_stages(sound, block_size, out, stats):
+            yield audio
+
+    def _begin(self, operation: str) -> Optional[RenderStats]:
+        """
+        Starts measuring an operation, or returns None without instrumentation.
+        """
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.begin(operation, self.sample_rate)
+
+    def _finish(self, stats: Optional[RenderStats]):
+        """
+        Finishes measuring an operation started with _begin.
+        """
+        if stats is not None:
+            self.instrumentation.finish(stats)
+
+    def _measured(
+        self, blocks: Iterator[np.ndarray], stats: Optional[RenderStats]
+    ) -> Iterator[np.ndarray]:
+        """
+        Passes blocks through, recording the latency of each block in stats.
+
+        A block's latency runs from requesting it until the consumer asks for the next one,
+        so it includes rendering and writing the block.
+        """
+        if stats is None:
+            return blocks
+        return self._measure_blocks(blocks, stats)
+
+    def _measure_blocks(
+        self, blocks: Iterator[np.ndarray], stats: RenderStats
+    ) -> Iterator[np.ndarray]:
+        """
+        The generator behind _measured.
+        """
+        requested = time.perf_counter()
+        for block in blocks:
+            yield block
+            delivered = time.perf_counter()
+            self.instrumentation.block(stats, len(block), delivered - requested)
+            requested = delivered
+
+    def _save_blocks(
+        self,
+        blocks: Iterator[np.ndarray],
+        filename: str,
+        file_format: str,
+        subtype: str,
+        stats: Optional[RenderStats],
+    ):
+        """
+        Writes blocks to a file through the file backend, building its overview if enabled.
+        """
+        builder = OverviewBuilder(self.sample_rate) if self.overview else None
+        with self.file_backend.open(
+            self.sample_rate, filename, file_format, subtype
+        ) as file:
+            for block in self._measured(blocks, stats):
+                self._write(file, block, stats)
+                if builder is not None:
+                    builder.add(block)
+
+        if builder is not None:
+            self.file_backend.save_overview(builder.overview(), filename, file_format)
+
+    def _write(self, stream, block: np.ndarray, stats: Optional[RenderStats]):
+        """
+        Writes a block to a stream, recording the time as the output stage.
+        """
+        if stats is None:
+            stream.write(block)
+            return
+        started = time.perf_counter()
+        stream.write(block)
+        stats.add("output", time.perf_counter() - started, len(block))
+
+    def oscillator(self, sound: Sound):
+        """
+        Creates the oscillator used to render a sound.
+
+        Args:
+            sound (Sound): The sound parameters encapsulated in a Sound object.
+
+        Returns:
+            The oscillator, a WavetableOscillator if wavetables are enabled and an Oscillator otherwise.
+        """
+        if self.wavetable_size is None or sound.waveform_type == WaveformType.NOISE:
+            return self.waveform.oscillator(
+                sound.waveform_type, sound.frequency.value, seed=sound.seed
+            )
+
+        return WavetableOscillator(
+            Wavetable.from_waveform(sound.waveform_type, self.wavetable_size),
+            sound.frequency.value,
+            self.sample_rate,
+            interpolation=self.interpolation,
+            dtype=self.dtype,
         )
-        self.debugger = SynthesizerDebugger(t)
 
     def play_sound(self, sound: Sound):
         """
         Generates and plays a sound using the specified parameters.
 
+        Blocks are written to the playback backend as they are rendered. When debugging or
+        plotting, each block is also added to the debugger, which only keeps a decimated outline.
+
         Args:
             sound (Sound): The sound parameters encapsulated in a Sound object.
         """
-        if self.debug or self.show:
+        keep_stages = self.debug or self.show
+        if keep_stages:
             self.set_debugger(sound)
 
-        num_samples = int(self.sample_rate * sound.duration)
-        waveform = self.waveform.generate(
-            sound.waveform_type, sound.frequency.value, num_samples
-        )
-        envelope = sound.envelope.generate(self.sample_rate, sound.duration)
-        audio = 0.5 * waveform * envelope
+        stats = self._begin("play_sound")
+        requested = time.perf_counter()
+        with self.playback_backend.open(self.sample_rate) as stream:
+            for waveform, envelope, audio in self._render_stages(sound, stats=stats):
+                self._write(stream, audio, stats)
 
-        if self.debug:
-            self.debugger.print_samples(waveform, envelope, audio, sample_rate=100)
+                if keep_stages:
+                    self.debugger.add(waveform, envelope, audio)
+                if stats is not None:
+                    delivered = time.perf_counter()
+                    self.instrumentation.block(stats, len(audio), delivered - requested)
+                    requested = delivered
+        self._finish(stats)
 
-        sd.play(audio, self.sample_rate)
-        sd.wait()
+        if self.debug:
+            self.debugger.print_samples()
 
         if self.show:
-            self.debugger.plot_waveform(waveform, envelope, audio)
+            self.debugger.plot_waveform(filename=self.plot_file)
 
-    def save_sound(self, sound: Sound, filename: str, file_format: str):
+    def play_realtime(
+        self,
+        sound: Sound,
+        block_size: int = 256,
+        latency: Union[str, float] = "low",
+        backend=None,
+    ) -> RealtimePlayer:
+        """
+        Plays a sound through a callback stream that renders blocks on demand.
+
+        Playback starts after the first block instead of after the full render.
+
+        Args:
+            sound (Sound): The sound parameters encapsulated in a Sound object.
+            block_size (int): The number of frames rendered per callback.
+            latency (Union[str, float]): The stream latency in seconds, or 'low' / 'high'.
+            backend: The stream backend, e.g. a FakeStreamBackend. Defaults to sounddevice.
+
+        Returns:
+            RealtimePlayer: The finished player, holding the callback and underrun counters.
+        """
+        buffer = np.empty(block_size, dtype=self.dtype)
+        player = RealtimePlayer(
+            self.render_blocks(sound, block_size, buffer),
+            self.sample_rate,
+            block_size=block_size,
+            latency=latency,
+            backend=backend,
+        )
+        player.play()
+        return player
+
+    def save_sound(
+        self,
+        sound: Sound,
+        filename: str,
+        file_format: str,
+        subtype: str = None,
+        block_size: int = None,
+    ) -> int:
         """
         Generates and saves a sound to a file in the specified format.
 
+        The file is written block by block through the file backend as the blocks are
+        rendered, so memory use does not grow with the duration. With a render cache, the
+        blocks are read from the memory-mapped cached render instead.
+
         Args:
             sound (Sound): The sound parameters encapsulated in a Sound object.
             filename (str): The name of the file to save the sound.
             file_format (str): The format to save the sound file in (e.g., 'wav', 'flac', 'ogg').
+            subtype (str): The sample encoding (e.g., 'PCM_16', 'PCM_24', 'FLOAT'). Defaults to the format's default.
+            block_size (int): The number of samples rendered and written at a time. Defaults to the synthesizer block size.
+
+        Returns:
+            int: The number of samples written.
         """
-        num_samples = int(self.sample_rate * sound.duration)
-        waveform = self.waveform.generate(
-            sound.waveform_type, sound.frequency.value, num_samples
-        )
-        envelope = sound.envelope.generate(self.sample_rate, sound.duration)
-        audio = 0.5 * waveform * envelope
+        block_size = block_size or self.block_size
+        stats = self._begin("save_sound")
+        if self._render_key(sound) is not None:
+            audio = self.render(sound)
+            blocks = (
+                audio[offset:offset + block_size]
+                for offset in range(0, len(audio), block_size)
+            )
+        else:
+            blocks = self._audio_blocks(
+                sound, block_size, np.empty(block_size, dtype=self.dtype), stats
+            )
 
-        sf.write(
-            self._FILES_DIR / f"{filename}.{file_format}",
-            audio,
-            self.sample_rate,
-            format=file_format.upper(),
+        self._save_blocks(blocks, filename, file_format, subtype, stats)
+        self._finish(stats)
+        return int(self.sample_rate * sound.duration)
+
+    def save_score(
+        self,
+        score,
+        filename: str,
+        file_format: str,
+        subtype: str = None,
+        num_voices: int = 32,
+    ) -> int:
+        """
+        Renders a score on a PolySynth and saves it block by block.
+
+        The PolySynth uses this synthesizer's sample rate, block size, band-limiting and
+        sample type, so a score of any length is written with constant memory.
+
+        Args:
+            score (Score): The score to render. Its sample rate should match the synthesizer's.
+            filename (str): The name of the file to save the score.
+            file_format (str): The format to save the file in (e.g., 'wav', 'flac', 'ogg').
+            subtype (str): The sample encoding (e.g., 'PCM_16', 'PCM_24', 'FLOAT'). Defaults to the format's default.
+            num_voices (int): The number of notes that can play at the same time.
+
+        Returns:
+            int: The number of samples written.
+        """
+        # Imported here: PolySynth, which the sequencer builds on, imports this module.
+        from .poly_synth import PolySynth
+        from .sequencer import Sequencer
+
+        poly_synth = PolySynth(
+            SampleRate(self.sample_rate),
+            num_voices,
+            self.block_size,
+            self.band_limited,
+            self.dtype,
+            control_interval=self.control_interval,
         )
+        sequencer = Sequencer(score, poly_synth)
+        stats = self._begin("save_score")
+        self._save_blocks(sequencer.render_blocks(), filename, file_format, subtype, stats)
+        self._finish(stats)
+        return sequencer.position
+
+    def render_many(
+        self,
+        jobs: List[RenderJob],
+        workers: int = None,
+        progress: Callable[[int, int], None] = None,
+        chunksize: int = None,
+    ) -> List[int]:
+        """
+        Renders many sounds to files in parallel, e.g. a whole sample pack.
+
+        Each worker process creates its own Synthesizer with this synthesizer's settings and
+        writes its files through the file backend, so only the job parameters and sample
+        counts cross process boundaries. With one worker, or a file backend that keeps its
+        output in the process such as MemoryBackend or NullBackend, jobs are rendered in
+        this process.
+
+        Args:
+            jobs (List[RenderJob]): The files to render.
+            workers (int): The number of worker processes. Defaults to the number of CPUs.
+                Should be positive.
+            progress (Callable[[int, int], None]): Called with the number of finished and total jobs.
+            chunksize (int): The number of jobs sent to a worker at a time.
+
+        Returns:
+            List[int]: The number of samples written for each job, in job order.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("Number of workers must be positive.")
+        if workers != 1 and self.file_backend.shared_across_processes:
+            return render_many(self._worker_config(), jobs, workers, progress, chunksize)
+
+        jobs = list(jobs)
+        results = []
+        for job in jobs:
+            results.append(
+                self.save_sound(job.sound, job.filename, job.file_format, job.subtype)
+            )
+            if progress is not None:
+                progress(len(results), len(jobs))
+        return results
+
+    def _worker_config(self) -> dict:
+        """
+        Returns the keyword arguments that create an equivalent Synthesizer in a worker process.
+        """
+        return {
+            "sample_rate": SampleRate(self.sample_rate),
+            "show": False,
+            "block_size": self.block_size,
+            "envelope_cache": self.envelope_cache,
+            "band_limited": self.band_limited,
+            "wavetable_size": self.wavetable_size,
+            "interpolation": self.interpolation,
+            "dtype": self.dtype,
+            "file_backend": self.file_backend,
+            "render_cache": self.render_cache,
+            "overview": self.overview,
+            "control_interval": self.control_interval,
+        }
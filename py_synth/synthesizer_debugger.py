@@ -1,83 +1,337 @@
-from matplotlib import pyplot as plt
+import warnings
+from typing import Tuple
 import numpy as np
 
+from .overview import Overview
+
+
+class MinMaxDecimator:
+    """
+    A class to reduce a signal to the minimum and maximum of fixed-size bins as it is rendered.
+
+    Plotting the minimum and maximum of each bin draws the same outline as plotting every
+    sample, with a number of points that does not depend on the length of the signal.
+
+    Attributes:
+        bin_size (int): The number of samples per bin.
+        mins (np.ndarray): The minimum of each bin.
+        maxs (np.ndarray): The maximum of each bin.
+    """
+
+    def __init__(self, num_samples: int, num_bins: int):
+        """
+        Initializes the MinMaxDecimator object.
+
+        Args:
+            num_samples (int): The length of the signal.
+            num_bins (int): The maximum number of bins. Should be positive.
+        """
+        if num_bins <= 0:
+            raise ValueError("Number of bins must be positive.")
+
+        self.bin_size = max(-(-num_samples // num_bins), 1)
+        count = -(-num_samples // self.bin_size)
+        self.mins = np.full(count, np.inf)
+        self.maxs = np.full(count, -np.inf)
+
+    def add(self, block: np.ndarray, offset: int):
+        """
+        Adds the next block of the signal.
+
+        Args:
+            block (np.ndarray): The samples of the block.
+            offset (int): The index of the first sample of the block in the signal.
+        """
+        if not len(block):
+            return
+        first = offset // self.bin_size
+        last = (offset + len(block) - 1) // self.bin_size
+        starts = np.arange(first, last + 1) * self.bin_size - offset
+        starts[0] = 0
+
+        # A bin may continue from the previous block, so combine with what it holds.
+        bins = slice(first, last + 1)
+        np.minimum(self.mins[bins], np.minimum.reduceat(block, starts), out=self.mins[bins])
+        np.maximum(self.maxs[bins], np.maximum.reduceat(block, starts), out=self.maxs[bins])
+
+    def points(self, sample_rate: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the outline to plot: the minimum and maximum of each bin in turn.
+
+        Args:
+            sample_rate (int): The sample rate in Hz, to place the points in time.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The times in seconds and the values of the points.
+        """
+        times = np.repeat(np.arange(len(self.mins)) * (self.bin_size / sample_rate), 2)
+        values = np.empty(2 * len(self.mins))
+        values[0::2] = self.mins
+        values[1::2] = self.maxs
+        return times, values
+
 
 class SynthesizerDebugger:
     """
     A class to handle debugging by plotting and printing samples.
 
+    The stages of a sound are added block by block and only a decimated outline and a
+    fixed number of samples are kept, so debugging costs the same for any duration.
+    Whole stages can also be passed to plot_waveform and print_samples, with the times
+    given as a time array.
+
     Attributes:
-        t (np.ndarray): The time array for the duration of the waveform.
+        t (np.ndarray): The time of each sample in seconds, or None to use the sample rate.
+        sample_rate (int): The sample rate in Hz, or None with a time array.
+        num_samples (int): The length of the sound.
+        max_points (int): The maximum number of points plotted per stage.
+        num_printed (int): The number of samples printed by print_samples.
     """
 
-    def __init__(self, t: np.ndarray):
+    STAGES = ("Waveform", "ADSR Envelope", "Output Audio")
+
+    def __init__(
+        self,
+        sample_rate: int = None,
+        num_samples: int = None,
+        max_points: int = 4000,
+        num_printed: int = 100,
+        *,
+        t: np.ndarray = None,
+    ):
         """
-        Initializes the Debugger object with a time array.
+        Initializes the Debugger object for a sound.
 
         Args:
-            t (np.ndarray): The time array for the duration of the waveform.
+            sample_rate (int): The sample rate in Hz. Not needed with a time array.
+            num_samples (int): The length of the sound. Defaults to the length of the time array.
+            max_points (int): The maximum number of points plotted per stage.
+            num_printed (int): The number of samples printed by print_samples.
+            t (np.ndarray): The time of each sample in seconds, used instead of the sample rate.
         """
+        if isinstance(sample_rate, np.ndarray):
+            warnings.warn(
+                "Passing the time array as the first argument is deprecated; use t=.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            sample_rate, t = None, sample_rate
+        if t is None:
+            if sample_rate is None or num_samples is None:
+                raise ValueError("A sample rate and number of samples, or a time array, are required.")
+        elif num_samples is None:
+            num_samples = len(t)
+        elif num_samples > len(t):
+            raise ValueError("The time array is shorter than the sound.")
+
         self.t = t
+        self.sample_rate = sample_rate
+        self.num_samples = num_samples
+        self.max_points = max_points
+        self.num_printed = num_printed
+
+        self._decimators = [MinMaxDecimator(num_samples, max(max_points // 2, 1)) for _ in self.STAGES]
+        self._print_step = max(num_samples // num_printed, 1)
+        self._printed_indices = np.arange(0, num_samples, self._print_step)
+        self._printed = np.zeros((len(self.STAGES), len(self._printed_indices)))
+        self._offset = 0
+
+    def add(self, waveform: np.ndarray, envelope: np.ndarray, audio: np.ndarray):
+        """
+        Adds the next block of each stage.
+
+        Args:
+            waveform (np.ndarray): The generated waveform.
+            envelope (np.ndarray): The ADSR envelope applied to the waveform.
+            audio (np.ndarray): The final audio signal.
+        """
+        count = len(audio)
+        first = -(-self._offset // self._print_step)
+        last = -(-(self._offset + count) // self._print_step)
+        indices = np.arange(first, min(last, len(self._printed_indices)))
+        for row, (decimator, block) in enumerate(zip(self._decimators, (waveform, envelope, audio))):
+            decimator.add(block, self._offset)
+            self._printed[row, indices] = block[indices * self._print_step - self._offset]
+        self._offset += count
 
     def plot_waveform(
-        self, waveform: np.ndarray, envelope: np.ndarray, audio: np.ndarray
+        self,
+        waveform: np.ndarray = None,
+        envelope: np.ndarray = None,
+        audio: np.ndarray = None,
+        filename: str = None,
     ):
         """
-        Plots the waveform, ADSR envelope, and output audio.
+        Plots the outline of the waveform, ADSR envelope, and output audio.
+
+        The stages added so far are plotted, or the given whole stages instead.
+
+        With a filename, the figure is rendered with the non-interactive Agg backend and
+        saved, in a format chosen by the extension (e.g. '.png' or '.svg'). Without one it
+        is shown in a pyplot window, which blocks until the window is closed.
 
         Args:
             waveform (np.ndarray): The generated waveform.
             envelope (np.ndarray): The ADSR envelope applied to the waveform.
             audio (np.ndarray): The final audio signal.
+            filename (str): The file to save the plot to.
         """
-        plt.figure(figsize=(15, 5))
-
-        plt.subplot(3, 1, 1)
-        plt.plot(self.t, waveform, label="Waveform")
-        plt.title("Waveform")
-        plt.xlabel("Time [s]")
-        plt.ylabel("Amplitude")
-        plt.legend()
-
-        plt.subplot(3, 1, 2)
-        plt.plot(self.t, envelope, label="ADSR Envelope", color="orange")
-        plt.title("ADSR Envelope")
-        plt.xlabel("Time [s]")
-        plt.ylabel("Amplitude")
-        plt.legend()
-
-        plt.subplot(3, 1, 3)
-        plt.plot(self.t, audio, label="Output Audio", color="green")
-        plt.title("Output Audio")
-        plt.xlabel("Time [s]")
-        plt.ylabel("Amplitude")
-        plt.legend()
-
-        plt.tight_layout()
-        plt.show()
+        if waveform is not None:
+            self._with_stages(waveform, envelope, audio, self.num_printed).plot_waveform(filename=filename)
+            return
+
+        figure = _create_figure(filename, (15, 5))
+        for index, (title, color) in enumerate(zip(self.STAGES, (None, "orange", "green"))):
+            axes = figure.add_subplot(3, 1, index + 1)
+            axes.plot(*self._points(index), label=title, color=color, linewidth=0.8)
+            axes.set_title(title)
+            axes.set_xlabel("Time [s]")
+            axes.set_ylabel("Amplitude")
+            axes.legend()
+        _finish_figure(figure, filename)
+
+    @staticmethod
+    def plot_overview(
+        overview: Overview,
+        filename: str = None,
+        start: float = 0.0,
+        stop: float = None,
+        width: int = 1500,
+    ):
+        """
+        Plots the min/max outline and RMS of a saved sound from its overview.
+
+        Only about width columns are read from the overview, so any range of a long render
+        is plotted in the same time.
+
+        Args:
+            overview (Overview): The overview of the sound, e.g. loaded from a sidecar file.
+            filename (str): The PNG or SVG file to save the plot to. Shows a window if None.
+            start (float): The start of the range to plot, in seconds.
+            stop (float): The end of the range to plot, in seconds. Defaults to the end of the sound.
+            width (int): The number of columns to plot.
+        """
+        times, mins, maxs, rms = overview.view(
+            int(start * overview.sample_rate),
+            None if stop is None else int(stop * overview.sample_rate),
+            width,
+        )
+
+        figure = _create_figure(filename, (15, 3))
+        axes = figure.add_subplot(1, 1, 1)
+        axes.fill_between(times, mins, maxs, step="post", color="green", alpha=0.5, label="Min/Max")
+        axes.fill_between(times, -rms, rms, step="post", color="green", label="RMS")
+        axes.set_title("Output Audio")
+        axes.set_xlabel("Time [s]")
+        axes.set_ylabel("Amplitude")
+        axes.legend()
+        _finish_figure(figure, filename)
 
     def print_samples(
         self,
-        waveform: np.ndarray,
-        envelope: np.ndarray,
-        audio: np.ndarray,
-        sample_rate: int = 100,
+        waveform: np.ndarray = None,
+        envelope: np.ndarray = None,
+        audio: np.ndarray = None,
+        sample_rate: int = None,
+        num_printed: int = None,
     ):
         """
         Prints samples of the waveform, envelope, and audio at regular intervals.
 
+        The stages added so far are printed, or the given whole stages instead.
+
         Args:
             waveform (np.ndarray): The generated waveform.
             envelope (np.ndarray): The ADSR envelope applied to the waveform.
             audio (np.ndarray): The final audio signal.
-            sample_rate (int): The rate at which samples are printed.
+            sample_rate (int): Deprecated, use num_printed.
+            num_printed (int): The number of samples printed from the given stages. Defaults
+                to the num_printed attribute.
         """
-        sample_indices = np.arange(0, len(self.t), int(len(self.t) / sample_rate))
+        if sample_rate is not None:
+            warnings.warn(
+                "The sample_rate argument of print_samples is deprecated; use num_printed.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            if num_printed is None:
+                num_printed = sample_rate
+        if waveform is not None:
+            self._with_stages(waveform, envelope, audio, num_printed or self.num_printed).print_samples()
+            return
+        if num_printed is not None and num_printed != self.num_printed:
+            raise ValueError("The number of printed samples is set when the debugger is created.")
+
         print("Samples at regular intervals:")
         print(
             f"{'Index':>6} {'Time':>10} {'Waveform':>10} {'Envelope':>10} {'Audio':>10}"
         )
-        for i in sample_indices:
+        for column, i in enumerate(self._printed_indices[: -(-self._offset // self._print_step)]):
+            waveform, envelope, audio = self._printed[:, column]
             print(
-                f"{i:>6} {self.t[i]:>10.4f} {waveform[i]:>10.4f} {envelope[i]:>10.4f} {audio[i]:>10.4f}"
+                f"{i:>6} {self._time(i):>10.4f} {waveform:>10.4f} {envelope:>10.4f} {audio:>10.4f}"
             )
+
+    def _with_stages(
+        self, waveform: np.ndarray, envelope: np.ndarray, audio: np.ndarray, num_printed: int
+    ) -> "SynthesizerDebugger":
+        """
+        Returns a debugger like this one that holds the given whole stages.
+        """
+        debugger = SynthesizerDebugger(
+            self.sample_rate, len(audio), self.max_points, num_printed, t=self.t
+        )
+        debugger.add(waveform, envelope, audio)
+        return debugger
+
+    def _time(self, index):
+        """
+        Returns the time of a sample index, or of an array of them, in seconds.
+        """
+        if self.t is not None:
+            return self.t[index]
+        return index / self.sample_rate
+
+    def _points(self, stage: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the points to plot for a stage: every sample of short sounds, else the outline.
+        """
+        decimator = self._decimators[stage]
+        # At a rate of 1 Hz the times of the points are their sample indices.
+        indices, values = decimator.points(1)
+        reached = 2 * -(-self._offset // decimator.bin_size)
+        times, values = self._time(indices[:reached].astype(np.int64)), values[:reached]
+        if decimator.bin_size == 1:
+            # Each bin holds one sample, so its minimum and maximum are the same point.
+            return times[0::2], values[0::2]
+        return times, values
+
+
+def _create_figure(filename: str, size: Tuple[float, float]):
+    """
+    Creates a pyplot figure to show, or an Agg figure to save to filename without a window.
+    """
+    if filename is None:
+        from matplotlib import pyplot as plt
+
+        return plt.figure(figsize=size)
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=size)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _finish_figure(figure, filename: str):
+    """
+    Lays the figure out and shows it, or saves it to filename.
+    """
+    figure.tight_layout()
+    if filename is None:
+        from matplotlib import pyplot as plt
+
+        plt.show()
+    else:
+        figure.savefig(filename)
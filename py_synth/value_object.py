@@ -0,0 +1,67 @@
+from typing import Tuple
+
+
+class ValueObject:
+    """
+    A base class for immutable parameter objects.
+
+    Subclasses declare their fields in ``__slots__`` and assign them with ``_set`` in
+    ``__init__``. Objects have no ``__dict__``, cannot be changed after construction, and
+    compare and hash by their type and field values, so they can be used as cache keys.
+    """
+
+    __slots__ = ()
+
+    def _set(self, name: str, value):
+        """
+        Assigns a field during initialization.
+        """
+        object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable.")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} objects are immutable.")
+
+    @classmethod
+    def _fields(cls) -> Tuple[str, ...]:
+        """
+        Returns the names of the fields declared by the class and its bases.
+        """
+        fields = cls.__dict__.get("_field_names")
+        if fields is None:
+            fields = tuple(
+                name
+                for klass in reversed(cls.__mro__)
+                for name in klass.__dict__.get("__slots__", ())
+            )
+            type.__setattr__(cls, "_field_names", fields)
+        return fields
+
+    def _values(self) -> tuple:
+        """
+        Returns the field values in declaration order.
+        """
+        return tuple(getattr(self, name) for name in self._fields())
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in zip(self._fields(), self._values())
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __getstate__(self) -> dict:
+        return dict(zip(self._fields(), self._values()))
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            self._set(name, value)
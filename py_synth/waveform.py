@@ -23,46 +23,126 @@ class Waveform:
         sample_rate (int): The sample rate in Hz.
         duration (float): The duration of the waveform in seconds.
         t (np.ndarray): The time array for the duration of the waveform.
+        band_limited (bool): Whether SQUARE, SAWTOOTH and PULSE are generated with PolyBLEP anti-aliasing.
+        dtype (np.dtype): The floating point type of the generated samples.
     """
 
-    def __init__(self, sample_rate=44100, duration=2.0):
+    def __init__(
+        self, sample_rate=44100, duration=2.0, band_limited=False, dtype=np.float64
+    ):
         """
         Initializes the Waveform object with a sample rate and duration.
 
         Args:
             sample_rate (int): The sample rate in Hz.
             duration (float): The duration of the waveform in seconds.
+            band_limited (bool): Whether to generate band-limited SQUARE, SAWTOOTH and PULSE waves.
+            dtype (np.dtype): The floating point type of the generated samples (float32 or float64).
         """
         self.sample_rate = sample_rate
         self.duration = duration
+        self.band_limited = band_limited
+        self.dtype = check_dtype(dtype)
         self.t = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
 
-    def generate(self, waveform_type: WaveformType, frequency: float, num_samples: int) -> np.ndarray:
+    def generate(
+        self,
+        waveform_type: WaveformType,
+        frequency,
+        num_samples: int,
+        offset: int = 0,
+        out: np.ndarray = None,
+    ) -> np.ndarray:
         """
         Generates the specified waveform.
 
         Args:
             waveform_type (WaveformType): The type of waveform to generate.
-            frequency (float): The frequency of the waveform in Hz.
+            frequency: The frequency of the waveform in Hz, or an array with the frequency of
+                each sample, which is integrated into the phase starting at phase 0.
+            num_samples (int): The number of samples to generate.
+            offset (int): The index of the first sample, used to continue a waveform across blocks.
+                Only supported for a constant frequency; use an Oscillator to continue a
+                modulated waveform.
+            out (np.ndarray): A buffer of num_samples samples to write the waveform into.
 
         Returns:
             np.ndarray: The generated waveform.
         """
-        t = np.linspace(0, num_samples / self.sample_rate, num_samples, endpoint=False)
-        if waveform_type == WaveformType.SINE:
-            return np.sin(2 * np.pi * frequency * t)
-        elif waveform_type == WaveformType.SQUARE:
-            return np.sign(np.sin(2 * np.pi * frequency * t))
-        elif waveform_type == WaveformType.SAWTOOTH:
-            return 2 * (t * frequency - np.floor(0.5 + t * frequency))
-        elif waveform_type == WaveformType.TRIANGLE:
-            return 2 * np.abs(2 * (t * frequency - np.floor(t * frequency + 0.5))) - 1
-        elif waveform_type == WaveformType.PULSE:
-            return np.where(np.mod(t * frequency, 1) < 0.5, 1.0, -1.0)
-        elif waveform_type == WaveformType.NOISE:
-            return np.random.uniform(-1.0, 1.0, len(t))
-        else:
-            raise ValueError("Unknown waveform type")
+        if np.ndim(frequency):
+            if offset:
+                raise ValueError("A waveform with a frequency array cannot start at an offset.")
+            increment = np.empty(num_samples)
+            cycles = np.empty(num_samples)
+            _integrate_phase(frequency, self.sample_rate, 0.0, increment, cycles)
+            return _shape(
+                waveform_type, cycles, increment if self.band_limited else None, self.dtype, out
+            )
+
+        cycles = np.arange(offset, offset + num_samples) / self.sample_rate
+        cycles *= frequency
+        return _shape(
+            waveform_type, cycles, self._increment(frequency), self.dtype, out
+        )
+
+    def generate_batch(
+        self, waveform_type: WaveformType, frequencies: np.ndarray, num_samples: int
+    ) -> np.ndarray:
+        """
+        Generates one waveform per frequency in a single vectorized pass.
+
+        Args:
+            waveform_type (WaveformType): The type of waveform to generate.
+            frequencies (np.ndarray): The frequencies of the waveforms in Hz.
+            num_samples (int): The number of samples per waveform.
+
+        Returns:
+            np.ndarray: The generated waveforms, of shape (len(frequencies), num_samples).
+        """
+        # The same phase steps as Oscillator.generate, so rows match oscillator renders.
+        increments = np.asarray(frequencies, dtype=np.float64) / self.sample_rate
+        cycles = np.multiply.outer(increments, np.arange(num_samples, dtype=np.float64))
+        return _shape(
+            waveform_type,
+            cycles,
+            increments[:, np.newaxis] if self.band_limited else None,
+            self.dtype,
+        )
+
+    def oscillator(
+        self,
+        waveform_type: WaveformType,
+        frequency: float,
+        phase: float = 0.0,
+        seed: int = None,
+    ) -> "Oscillator":
+        """
+        Creates a stateful oscillator for incremental generation.
+
+        Args:
+            waveform_type (WaveformType): The type of waveform to generate.
+            frequency (float): The frequency of the waveform in Hz.
+            phase (float): The starting phase in cycles (0.0 to 1.0).
+            seed (int): The seed of the NOISE generator, or None for fresh OS entropy.
+
+        Returns:
+            Oscillator: The oscillator, running at this waveform's sample rate.
+        """
+        return Oscillator(
+            waveform_type,
+            frequency,
+            self.sample_rate,
+            phase,
+            self.band_limited,
+            self.dtype,
+            seed,
+        )
+
+    def _increment(self, frequency):
+        """
+        Returns the phase increment per sample used for band-limiting, or None if disabled.
+        """
+        return frequency / self.sample_rate if self.band_limited else None
 
     def sine_wave(self, frequency: float) -> np.ndarray:
         """
@@ -136,3 +216,273 @@ class Waveform:
             np.ndarray: The generated white noise.
         """
         return np.random.uniform(-1.0, 1.0, len(self.t))
+
+
+class Oscillator:
+    """
+    A stateful oscillator that continues its waveform across consecutive calls.
+
+    The phase is kept as an accumulator in cycles and wrapped to [0, 1) after every call,
+    so buffers join without clicks and precision does not degrade over long renders.
+
+    Attributes:
+        waveform_type (WaveformType): The type of waveform to generate.
+        frequency (float): The frequency of the waveform in Hz.
+        sample_rate (int): The sample rate in Hz.
+        phase (float): The phase of the next sample in cycles (0.0 to 1.0).
+        band_limited (bool): Whether SQUARE, SAWTOOTH and PULSE are generated with PolyBLEP anti-aliasing.
+        dtype (np.dtype): The floating point type of the generated samples.
+    """
+
+    def __init__(
+        self,
+        waveform_type: WaveformType,
+        frequency: float,
+        sample_rate: int = 44100,
+        phase: float = 0.0,
+        band_limited: bool = False,
+        dtype=np.float64,
+        seed: int = None,
+    ):
+        """
+        Initializes the Oscillator object.
+
+        Args:
+            waveform_type (WaveformType): The type of waveform to generate.
+            frequency (float): The frequency of the waveform in Hz.
+            sample_rate (int): The sample rate in Hz.
+            phase (float): The starting phase in cycles (0.0 to 1.0).
+            band_limited (bool): Whether to generate band-limited SQUARE, SAWTOOTH and PULSE waves.
+            dtype (np.dtype): The floating point type of the generated samples (float32 or float64).
+            seed (int): The seed of the NOISE generator, or None for fresh OS entropy.
+        """
+        self.waveform_type = waveform_type
+        self.frequency = frequency
+        self.sample_rate = sample_rate
+        self.phase = phase % 1.0
+        self.band_limited = band_limited
+        self.dtype = check_dtype(dtype)
+        self._ramp = np.arange(0, dtype=np.float64)
+        self._cycles = np.empty(0)
+        self._increments = np.empty(0)
+        self._rng = None if seed is None else np.random.default_rng(seed)
+
+    def generate(
+        self, num_samples: int, out: np.ndarray = None, frequency: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Generates the next samples of the waveform and advances the phase.
+
+        Scratch space is kept between calls, so passing ``out`` avoids allocating
+        arrays once the oscillator has seen the largest block size.
+
+        Args:
+            num_samples (int): The number of samples to generate.
+            out (np.ndarray): A buffer of num_samples samples to write the waveform into.
+            frequency (np.ndarray): The frequency of each sample in Hz, e.g. from a modulator.
+                The phase integrates it, so sweeps stay continuous within and across blocks.
+                Defaults to the constant ``frequency`` attribute.
+
+        Returns:
+            np.ndarray: The generated waveform.
+        """
+        if len(self._ramp) < num_samples:
+            self._ramp = np.arange(num_samples, dtype=np.float64)
+            self._cycles = np.empty(num_samples)
+            self._increments = np.empty(num_samples)
+
+        if self.waveform_type == WaveformType.NOISE and self._rng is None:
+            # Unseeded: one generator from fresh OS entropy, kept for the following blocks.
+            self._rng = np.random.default_rng()
+
+        cycles = self._cycles[:num_samples]
+        if frequency is None:
+            increment = self.frequency / self.sample_rate
+            np.multiply(self._ramp[:num_samples], increment, out=cycles)
+            cycles += self.phase
+            self.phase = (self.phase + increment * num_samples) % 1.0
+        else:
+            increment = self._increments[:num_samples]
+            self.phase = _integrate_phase(
+                frequency, self.sample_rate, self.phase, increment, cycles
+            )
+        return _shape(
+            self.waveform_type,
+            cycles,
+            increment if self.band_limited else None,
+            self.dtype,
+            out,
+            self._rng,
+        )
+
+    def reset(self, phase: float = 0.0, seed: int = None):
+        """
+        Resets the oscillator to the given phase.
+
+        Args:
+            phase (float): The phase in cycles (0.0 to 1.0).
+            seed (int): A new seed for the NOISE generator. None keeps the current generator.
+        """
+        self.phase = phase % 1.0
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+
+
+def check_dtype(dtype) -> np.dtype:
+    """
+    Validates a sample type for rendering.
+
+    Args:
+        dtype: The requested floating point type.
+
+    Returns:
+        np.dtype: The sample type, float32 or float64.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("Sample type must be float32 or float64.")
+    return dtype
+
+
+def _integrate_phase(
+    frequency, sample_rate: int, phase: float, increment: np.ndarray, cycles: np.ndarray
+) -> float:
+    """
+    Integrates per-sample frequencies into positions in cycles, starting at phase.
+
+    Writes the phase increment of each sample into ``increment`` and the position of each
+    sample into ``cycles``, and returns the phase after the last sample, wrapped to [0, 1).
+    """
+    if not len(cycles):
+        return phase
+    np.divide(frequency, sample_rate, out=increment)
+    cycles[0] = 0.0
+    np.cumsum(increment[:-1], out=cycles[1:])
+    cycles += phase
+    return float((cycles[-1] + increment[-1]) % 1.0)
+
+
+def _shape(
+    waveform_type: WaveformType,
+    cycles: np.ndarray,
+    increment=None,
+    dtype=np.float64,
+    out: np.ndarray = None,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
+    """
+    Evaluates a waveform at positions given in cycles (frequency times time).
+
+    The computation runs in place in ``out``, and ``cycles`` is used as scratch space.
+    Only band-limited waveforms allocate temporary arrays.
+
+    Args:
+        waveform_type (WaveformType): The type of waveform to generate.
+        cycles (np.ndarray): The positions to evaluate, in cycles, as float64. Overwritten.
+        increment: The phase increment per sample, broadcastable to cycles. When given,
+            SQUARE, SAWTOOTH and PULSE are band-limited with PolyBLEP. TRIANGLE has no
+            discontinuity and its harmonics fall off quickly, so it stays naive.
+        dtype (np.dtype): The floating point type of the result.
+        out (np.ndarray): The buffer to write the waveform into. Allocated if not given.
+        rng (np.random.Generator): The generator for NOISE. Defaults to a new generator seeded
+            from fresh OS entropy.
+
+    Returns:
+        np.ndarray: The generated waveform.
+    """
+    if out is None:
+        out = np.empty(cycles.shape, dtype=dtype)
+
+    band_limited = increment is not None and waveform_type in (
+        WaveformType.SQUARE,
+        WaveformType.SAWTOOTH,
+        WaveformType.PULSE,
+    )
+    if out.dtype != np.float64:
+        # Wrap to one cycle before narrowing, so float32 keeps its precision for the phase.
+        np.mod(cycles, 1.0, out=cycles)
+        if not band_limited:
+            # Continue in the output type. Mixing float64 inputs with a float32 output makes
+            # every ufunc allocate a cast buffer, so the phase is narrowed once, into the
+            # scratch space of cycles, which is free after it has been copied to out.
+            np.copyto(out, cycles, casting="same_kind")
+            if cycles.flags.c_contiguous:
+                narrow = cycles.view(out.dtype)[..., :cycles.shape[-1]]
+                np.copyto(narrow, out)
+                cycles = narrow
+            else:
+                cycles = out.copy()
+
+    if band_limited:
+        out[...] = _band_limited_shape(waveform_type, cycles, increment)
+    elif waveform_type in (WaveformType.SINE, WaveformType.SQUARE):
+        np.multiply(cycles, 2 * np.pi, out=out)
+        np.sin(out, out=out)
+        if waveform_type == WaveformType.SQUARE:
+            np.sign(out, out=out)
+    elif waveform_type in (WaveformType.SAWTOOTH, WaveformType.TRIANGLE):
+        np.add(cycles, 0.5, out=out)
+        np.floor(out, out=out)
+        np.subtract(cycles, out, out=out)
+        out *= 2
+        if waveform_type == WaveformType.TRIANGLE:
+            np.abs(out, out=out)
+            out *= 2
+            out -= 1
+    elif waveform_type == WaveformType.PULSE:
+        np.mod(cycles, 1.0, out=out)
+        if out.dtype != np.float64:
+            # Values just below 1.0 can round up to 1.0 when narrowed.
+            np.mod(out, 1.0, out=out)
+        out *= 2
+        np.floor(out, out=out)
+        out *= -2
+        out += 1
+    elif waveform_type == WaveformType.NOISE:
+        if rng is None:
+            rng = np.random.default_rng()
+        rng.random(dtype=out.dtype, out=out)
+        out *= 2
+        out -= 1
+    else:
+        raise ValueError("Unknown waveform type")
+
+    return out
+
+
+def _band_limited_shape(
+    waveform_type: WaveformType, cycles: np.ndarray, increment
+) -> np.ndarray:
+    """
+    Evaluates SQUARE, SAWTOOTH or PULSE with PolyBLEP corrections at each discontinuity.
+
+    The waveforms match the naive ones in phase and polarity.
+    """
+    phase = np.mod(cycles, 1.0)
+    if waveform_type == WaveformType.SAWTOOTH:
+        # The naive sawtooth wraps from +1 to -1 half a cycle in.
+        shifted = np.mod(phase + 0.5, 1.0)
+        return 2 * shifted - 1 - _poly_blep(shifted, increment)
+
+    # SQUARE and PULSE rise at phase 0 and fall at phase 0.5.
+    waveform = np.where(phase < 0.5, 1.0, -1.0)
+    waveform += _poly_blep(phase, increment)
+    waveform -= _poly_blep(np.mod(phase + 0.5, 1.0), increment)
+    return waveform
+
+
+def _poly_blep(phase: np.ndarray, increment) -> np.ndarray:
+    """
+    Returns the two-sample polynomial band-limited step residual for a unit-height rising edge at phase 0.
+    """
+    increment = np.broadcast_to(increment, phase.shape)
+    residual = np.zeros_like(phase)
+
+    after = phase < increment
+    x = phase[after] / increment[after]
+    residual[after] = 2 * x - x * x - 1
+
+    before = phase > 1 - increment
+    x = (phase[before] - 1) / increment[before]
+    residual[before] = x * x + 2 * x + 1
+    return residual
@@ -0,0 +1,245 @@
+from enum import Enum, auto
+import threading
+import numpy as np
+
+from .waveform import WaveformType, _integrate_phase, _shape, check_dtype
+
+
+class Interpolation(Enum):
+    """
+    Enum for different types of wavetable interpolation.
+    """
+
+    LINEAR = auto()
+    CUBIC = auto()
+
+
+class Wavetable:
+    """
+    A class to hold one cycle of a waveform in a power-of-two table.
+
+    Tables are read-only, so a single table can be shared by any number of oscillators.
+
+    Attributes:
+        size (int): The number of samples in one cycle.
+        table (np.ndarray): The samples of one cycle.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, samples: np.ndarray, size: int = 2048):
+        """
+        Initializes the Wavetable object from one cycle of samples.
+
+        Args:
+            samples (np.ndarray): One cycle of the waveform. It is resampled to the table size.
+            size (int): The number of samples in the table. Should be a power of two.
+        """
+        if size <= 0 or size & (size - 1):
+            raise ValueError("Wavetable size must be a power of two.")
+
+        # A copy, so freezing the table leaves the caller's array writable.
+        samples = np.array(samples, dtype=np.float64)
+        if samples.ndim != 1 or len(samples) == 0:
+            raise ValueError("Wavetable samples must be a non-empty one-dimensional array.")
+
+        if len(samples) != size:
+            positions = np.arange(size) * (len(samples) / size)
+            samples = np.interp(
+                positions, np.arange(len(samples)), samples, period=len(samples)
+            )
+
+        self.size = size
+        self.table = samples
+        self.table.setflags(write=False)
+        self._coefficients = {}
+        self._coefficients_lock = threading.Lock()
+
+    def coefficients(self, interpolation: Interpolation, dtype=np.float64) -> tuple:
+        """
+        Returns the per-index polynomial coefficients used to interpolate the table.
+
+        Between index ``i`` and ``i + 1`` the waveform is a polynomial in the fractional
+        position whose coefficients are the ``i``-th entries of the returned arrays, highest
+        power first. They are computed once per interpolation and sample type, also when
+        oscillators on several threads share the table.
+
+        Args:
+            interpolation (Interpolation): The interpolation between table samples.
+            dtype (np.dtype): The floating point type of the coefficients.
+
+        Returns:
+            tuple: The read-only coefficient arrays, highest power first.
+        """
+        key = (interpolation, np.dtype(dtype))
+        coefficients = self._coefficients.get(key)
+        if coefficients is not None:
+            return coefficients
+
+        with self._coefficients_lock:
+            if key not in self._coefficients:
+                self._coefficients[key] = self._compute_coefficients(interpolation, dtype)
+            return self._coefficients[key]
+
+    def _compute_coefficients(self, interpolation: Interpolation, dtype) -> tuple:
+        """
+        Computes the read-only coefficient arrays of an interpolation, highest power first.
+        """
+        current = self.table
+        after = np.roll(current, -1)
+        if interpolation == Interpolation.LINEAR:
+            coefficients = (after - current, current)
+        elif interpolation == Interpolation.CUBIC:
+            # Catmull-Rom spline through the neighbouring samples.
+            before = np.roll(current, 1)
+            next_after = np.roll(current, -2)
+            coefficients = (
+                -0.5 * before + 1.5 * current - 1.5 * after + 0.5 * next_after,
+                before - 2.5 * current + 2 * after - 0.5 * next_after,
+                0.5 * (after - before),
+                current,
+            )
+        else:
+            raise ValueError("Unknown interpolation type")
+
+        coefficients = tuple(c.astype(dtype) for c in coefficients)
+        for c in coefficients:
+            c.setflags(write=False)
+        return coefficients
+
+    @classmethod
+    def from_waveform(cls, waveform_type: WaveformType, size: int = 2048) -> "Wavetable":
+        """
+        Returns the shared table holding one cycle of a waveform type.
+
+        Args:
+            waveform_type (WaveformType): The type of waveform to sample.
+            size (int): The number of samples in the table. Should be a power of two.
+
+        Returns:
+            Wavetable: The table, created on first use and shared afterwards.
+        """
+        key = (waveform_type, size)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(_shape(waveform_type, np.arange(size) / size), size)
+            return cls._shared[key]
+
+
+class WavetableOscillator:
+    """
+    A stateful oscillator that reads a wavetable with a phase accumulator.
+
+    The cost per sample is a few table lookups and multiply-adds, independent of the waveform.
+
+    Attributes:
+        wavetable (Wavetable): The table to read.
+        frequency (float): The frequency of the waveform in Hz.
+        sample_rate (int): The sample rate in Hz.
+        phase (float): The phase of the next sample in cycles (0.0 to 1.0).
+        interpolation (Interpolation): The interpolation between table samples.
+        dtype (np.dtype): The floating point type of the generated samples.
+    """
+
+    def __init__(
+        self,
+        wavetable: Wavetable,
+        frequency: float,
+        sample_rate: int = 44100,
+        phase: float = 0.0,
+        interpolation: Interpolation = Interpolation.LINEAR,
+        dtype=np.float64,
+    ):
+        """
+        Initializes the WavetableOscillator object.
+
+        Args:
+            wavetable (Wavetable): The table to read.
+            frequency (float): The frequency of the waveform in Hz.
+            sample_rate (int): The sample rate in Hz.
+            phase (float): The starting phase in cycles (0.0 to 1.0).
+            interpolation (Interpolation): The interpolation between table samples.
+            dtype (np.dtype): The floating point type of the generated samples (float32 or float64).
+        """
+        self.wavetable = wavetable
+        self.frequency = frequency
+        self.sample_rate = sample_rate
+        self.phase = phase % 1.0
+        self.interpolation = interpolation
+        self.dtype = check_dtype(dtype)
+        self._ramp = np.arange(0, dtype=np.float64)
+        self._position = np.empty(0)
+        self._increments = np.empty(0)
+        self._index = np.empty(0, dtype=np.int64)
+        self._fraction = np.empty(0, dtype=self.dtype)
+        self._scratch = np.empty(0, dtype=self.dtype)
+
+    def generate(
+        self, num_samples: int, out: np.ndarray = None, frequency: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Generates the next samples of the waveform and advances the phase.
+
+        Scratch space is kept between calls, so passing ``out`` avoids allocating
+        arrays once the oscillator has seen the largest block size.
+
+        Args:
+            num_samples (int): The number of samples to generate.
+            out (np.ndarray): A buffer of num_samples samples to write the waveform into.
+            frequency (np.ndarray): The frequency of each sample in Hz, integrated into the
+                phase. Defaults to the constant ``frequency`` attribute.
+
+        Returns:
+            np.ndarray: The generated waveform.
+        """
+        if len(self._ramp) < num_samples:
+            self._ramp = np.arange(num_samples, dtype=np.float64)
+            self._position = np.empty(num_samples)
+            self._increments = np.empty(num_samples)
+            self._index = np.empty(num_samples, dtype=np.int64)
+            self._fraction = np.empty(num_samples, dtype=self.dtype)
+            self._scratch = np.empty(num_samples, dtype=self.dtype)
+        if out is None:
+            out = np.empty(num_samples, dtype=self.dtype)
+
+        size = self.wavetable.size
+        position = self._position[:num_samples]
+        index = self._index[:num_samples]
+        fraction = self._fraction[:num_samples]
+        scratch = self._scratch[:num_samples]
+
+        if frequency is None:
+            increment = self.frequency / self.sample_rate
+            np.multiply(self._ramp[:num_samples], increment * size, out=position)
+            position += self.phase * size
+            self.phase = (self.phase + increment * num_samples) % 1.0
+        else:
+            self.phase = _integrate_phase(
+                frequency, self.sample_rate, self.phase, self._increments[:num_samples], position
+            )
+            position *= size
+
+        np.mod(position, 1.0, out=fraction)
+        np.floor(position, out=position)
+        index[...] = position
+        np.bitwise_and(index, size - 1, out=index)
+
+        # Horner's rule over the per-index coefficients; mode="clip" lets take write into
+        # out directly instead of through a temporary buffer.
+        coefficients = self.wavetable.coefficients(self.interpolation, self.dtype)
+        np.take(coefficients[0], index, out=out, mode="clip")
+        for coefficient in coefficients[1:]:
+            out *= fraction
+            np.take(coefficient, index, out=scratch, mode="clip")
+            out += scratch
+        return out
+
+    def reset(self, phase: float = 0.0):
+        """
+        Resets the oscillator to the given phase.
+
+        Args:
+            phase (float): The phase in cycles (0.0 to 1.0).
+        """
+        self.phase = phase % 1.0
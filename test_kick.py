@@ -12,11 +12,17 @@ def create_kick():
         release=py_synth.ReleasePercent(20, py_synth.CurveType.SINE),
     )
 
+    # The pitch drops two octaves onto the 60 Hz body within the first 80 ms.
+    pitch_drop = py_synth.Ramp(
+        [(0.0, 24.0), (0.08, 0.0, py_synth.CurveType.INVERSE_EXPONENTIAL)]
+    )
+
     sound = py_synth.Sound(
         waveform_type=py_synth.WaveformType.SINE,
         frequency=py_synth.BaseFrequency(60.0),  # py_synth.Notes.C3
         duration=duration,
         envelope=envelope,
+        frequency_modulation=pitch_drop,
     )
     return sound
 
@@ -0,0 +1,28 @@
+import pytest
+
+import py_synth
+
+
+@pytest.fixture
+def envelope() -> py_synth.ADSREnvelope:
+    return py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(20, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(50),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.LINEAR),
+    )
+
+
+@pytest.fixture
+def sound(envelope) -> py_synth.Sound:
+    return py_synth.Sound(py_synth.WaveformType.SAWTOOTH, py_synth.BaseFrequency(220.0), 0.1, envelope)
+
+
+def create_synthesizer(**kwargs) -> py_synth.Synthesizer:
+    """
+    Returns a Synthesizer that needs no audio device and writes no files.
+    """
+    kwargs.setdefault("playback_backend", py_synth.NullBackend())
+    kwargs.setdefault("file_backend", py_synth.MemoryBackend())
+    return py_synth.Synthesizer(**kwargs)
@@ -0,0 +1,59 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import py_synth
+from conftest import create_synthesizer
+
+
+# Far less than one 4096-sample block (32 KiB); only small Python objects remain.
+MAX_STEADY_STATE_BYTES = 4096
+
+
+def steady_state_bytes(blocks, warmup: int = 4) -> int:
+    """
+    Returns the peak bytes allocated while rendering the remaining blocks after warmup.
+    """
+    blocks = iter(blocks)
+    for _ in range(warmup):
+        next(blocks)
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in blocks:
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+
+@pytest.mark.parametrize("waveform_type", list(py_synth.WaveformType), ids=lambda waveform_type: waveform_type.name)
+@pytest.mark.parametrize("options", [{}, {"wavetable_size": 2048}, {"dtype": np.float32}], ids=["plain", "wavetable", "float32"])
+def test_render_blocks_into_out_allocates_no_arrays(envelope, waveform_type, options):
+    sound = py_synth.Sound(waveform_type, py_synth.BaseFrequency(440.0), 5.0, envelope, seed=1)
+    synth = create_synthesizer(**options)
+    # Render once so the shared curve shapes are cached.
+    for _ in synth.render_blocks(sound):
+        pass
+
+    out = np.empty(synth.block_size, dtype=synth.dtype)
+    allocated = steady_state_bytes(synth.render_blocks(sound, out=out))
+
+    assert allocated < MAX_STEADY_STATE_BYTES
+
+
+def test_poly_synth_render_block_allocates_no_arrays(envelope):
+    sound = py_synth.Sound(py_synth.WaveformType.SAWTOOTH, py_synth.BaseFrequency(220.0), 5.0, envelope)
+    poly_synth = py_synth.PolySynth(num_voices=8)
+
+    def blocks():
+        for note in range(4):
+            poly_synth.note_on(sound, note)
+        for _ in range(48):
+            yield poly_synth.render_block()
+
+    assert steady_state_bytes(blocks()) < MAX_STEADY_STATE_BYTES
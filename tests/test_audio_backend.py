@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+import py_synth
+
+
+def test_incomplete_backend_and_stream_cannot_be_created():
+    class IncompleteBackend(py_synth.AudioBackend):
+        pass
+
+    class IncompleteStream(py_synth.AudioStream):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+    with pytest.raises(TypeError):
+        IncompleteStream()
+
+
+def test_custom_backend_receives_the_blocks(sound):
+    blocks = []
+
+    class ListStream(py_synth.AudioStream):
+        def write(self, block):
+            blocks.append(block.copy())
+
+    class ListBackend(py_synth.AudioBackend):
+        def open(self, sample_rate, name=None, file_format=None, subtype=None):
+            return ListStream()
+
+    synth = py_synth.Synthesizer(playback_backend=ListBackend(), file_backend=py_synth.NullBackend())
+    synth.play_sound(sound)
+
+    np.testing.assert_array_equal(np.concatenate(blocks), synth.render(sound))
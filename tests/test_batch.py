@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+import py_synth
+from conftest import create_synthesizer
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"band_limited": True}, {"wavetable_size": 2048}, {"dtype": np.float32}],
+    ids=["plain", "band_limited", "wavetable", "float32"],
+)
+def test_render_batch_matches_render(envelope, options):
+    frequencies = np.random.default_rng(0).uniform(40.0, 2000.0, 3)
+    sounds = [
+        py_synth.Sound(waveform_type, py_synth.BaseFrequency(float(frequency)), duration, envelope, seed=7)
+        for waveform_type in py_synth.WaveformType
+        for frequency in frequencies
+        for duration in (0.05, 0.2)
+    ]
+    sounds.append(
+        py_synth.Sound(
+            py_synth.WaveformType.SINE,
+            py_synth.BaseFrequency(100.0),
+            0.1,
+            envelope,
+            frequency_modulation=py_synth.LFO(5.0, 1.0),
+        )
+    )
+    synth = create_synthesizer(**options)
+
+    for audio, sound in zip(synth.render_batch(sounds), sounds):
+        np.testing.assert_allclose(audio, synth.render(sound), atol=1e-9)
@@ -0,0 +1,50 @@
+import py_synth
+from py_synth.curve import Curve
+
+from benchmarks import suite
+
+
+def test_cases_run_at_their_own_rate_and_length(monkeypatch, tmp_path):
+    calls = []
+
+    def spy(method, sample_rate, num_samples):
+        def wrapper(self, *args, **kwargs):
+            calls.append((sample_rate(self, args), num_samples(self, args)))
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        py_synth.Waveform,
+        "generate",
+        spy(py_synth.Waveform.generate, lambda self, args: self.sample_rate, lambda self, args: args[2]),
+    )
+    monkeypatch.setattr(
+        Curve, "apply_curve", spy(Curve.apply_curve, lambda self, args: self.sample_rate, lambda self, args: args[1])
+    )
+    monkeypatch.setattr(
+        py_synth.ADSREnvelope,
+        "generate",
+        spy(py_synth.ADSREnvelope.generate, lambda self, args: args[0], lambda self, args: int(args[0] * args[1])),
+    )
+
+    cases = [
+        case
+        for case in suite.create_cases(0.01, str(tmp_path), "null")
+        if not case.name.startswith("synthesizer.")
+    ]
+    assert {case.sample_rate for case in cases} == {sample_rate.value for sample_rate in py_synth.SampleRate}
+    for case in cases:
+        calls.clear()
+        case.run()
+        assert calls[0] == (case.sample_rate, case.num_samples), case.name
+
+
+def test_every_case_is_timed_at_every_duration(tmp_path):
+    names = [case.name for case in suite.create_cases(0.1, str(tmp_path), "null")]
+
+    assert len(names) == len(set(names))
+    for label in ("10ms", "100ms"):
+        assert f"waveform.generate[SINE,CD_QUALITY,{label}]" in names
+        assert f"curve.apply_curve[SINE,CD_QUALITY,{label}]" in names
+        assert f"envelope.generate[CD_QUALITY,{label}]" in names
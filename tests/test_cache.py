@@ -0,0 +1,34 @@
+import numpy as np
+
+import py_synth
+
+
+def test_put_freezes_stored_arrays():
+    cache = py_synth.LRUCache(max_bytes=1024)
+    array = np.zeros(16)
+
+    assert cache.put("key", array) is array
+    assert not array.flags.writeable
+    assert cache.get("key") is array
+
+
+def test_put_leaves_arrays_larger_than_the_budget_writable():
+    cache = py_synth.LRUCache(max_bytes=64)
+    array = np.zeros(16)
+
+    assert cache.put("key", array) is array
+    assert array.flags.writeable
+    assert cache.get("key") is None
+    assert cache.nbytes == 0
+
+
+def test_put_evicts_least_recently_used_entries():
+    cache = py_synth.LRUCache(max_bytes=3 * 128)
+    for key in "abc":
+        cache.put(key, np.zeros(16))
+    cache.get("a")
+    cache.put("d", np.zeros(16))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.evictions == 1
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+import py_synth
+
+
+SAMPLE_RATE = 1000
+
+
+@pytest.fixture
+def stages():
+    t = np.arange(2000) / SAMPLE_RATE
+    waveform = np.sin(2 * np.pi * 5 * t)
+    envelope = np.linspace(0.0, 1.0, len(t))
+    return t, waveform, envelope, waveform * envelope
+
+
+def test_time_array_interface(stages, capsys):
+    t, waveform, envelope, audio = stages
+    debugger = py_synth.SynthesizerDebugger(t=t)
+
+    debugger.print_samples(waveform, envelope, audio, num_printed=10)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len(lines) == 2 + 10
+    index, time, *values = lines[3].split()
+    assert int(index) == 200
+    assert float(time) == pytest.approx(t[200], abs=1e-4)
+    np.testing.assert_allclose([float(value) for value in values], [waveform[200], envelope[200], audio[200]], atol=1e-4)
+
+
+def test_deprecated_time_array_and_sample_rate_arguments(stages, capsys):
+    t, waveform, envelope, audio = stages
+    py_synth.SynthesizerDebugger(t=t).print_samples(waveform, envelope, audio, num_printed=10)
+    expected = capsys.readouterr().out
+
+    with pytest.warns(DeprecationWarning):
+        debugger = py_synth.SynthesizerDebugger(t)
+    with pytest.warns(DeprecationWarning):
+        debugger.print_samples(waveform, envelope, audio, sample_rate=10)
+
+    assert capsys.readouterr().out == expected
+
+
+def test_block_interface_prints_the_same_samples(stages, capsys):
+    t, waveform, envelope, audio = stages
+    py_synth.SynthesizerDebugger(t=t).print_samples(waveform, envelope, audio)
+    whole = capsys.readouterr().out
+
+    debugger = py_synth.SynthesizerDebugger(SAMPLE_RATE, len(t))
+    for start in range(0, len(t), 300):
+        block = slice(start, start + 300)
+        debugger.add(waveform[block], envelope[block], audio[block])
+    debugger.print_samples()
+
+    assert capsys.readouterr().out == whole
+
+
+@pytest.mark.parametrize("old_interface", [False, True])
+def test_plot_waveform_to_file(stages, tmp_path, old_interface):
+    pytest.importorskip("matplotlib")
+    t, waveform, envelope, audio = stages
+    path = tmp_path / "plot.png"
+
+    if old_interface:
+        py_synth.SynthesizerDebugger(t=t).plot_waveform(waveform, envelope, audio, filename=str(path))
+    else:
+        debugger = py_synth.SynthesizerDebugger(SAMPLE_RATE, len(t))
+        debugger.add(waveform, envelope, audio)
+        debugger.plot_waveform(filename=str(path))
+
+    assert path.stat().st_size > 0
+
+
+def test_sample_rate_needs_num_samples():
+    with pytest.raises(ValueError):
+        py_synth.SynthesizerDebugger(SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        py_synth.SynthesizerDebugger(SAMPLE_RATE, 10, t=np.zeros(5))
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import py_synth
+from conftest import create_synthesizer
+
+
+# Renders measure about 1.2e-7, far below 16-bit quantization (3e-5).
+MAX_FLOAT32_ERROR = 1e-6
+
+TONAL_WAVEFORMS = [
+    waveform_type for waveform_type in py_synth.WaveformType if waveform_type != py_synth.WaveformType.NOISE
+]
+
+
+@pytest.mark.parametrize("waveform_type", TONAL_WAVEFORMS, ids=lambda waveform_type: waveform_type.name)
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"band_limited": True}, {"wavetable_size": 2048}],
+    ids=["plain", "band_limited", "wavetable"],
+)
+def test_float32_render_error_is_bounded(envelope, waveform_type, options):
+    sound = py_synth.Sound(waveform_type, py_synth.BaseFrequency(441.3), 2.0, envelope)
+
+    single = create_synthesizer(dtype=np.float32, **options).render(sound)
+    double = create_synthesizer(dtype=np.float64, **options).render(sound)
+
+    assert single.dtype == np.float32
+    assert double.dtype == np.float64
+    assert np.abs(single - double).max() < MAX_FLOAT32_ERROR
+
+
+def test_float32_envelope_error_is_bounded(envelope):
+    single = envelope.generate(44100, 2.0, dtype=np.float32)
+    double = envelope.generate(44100, 2.0, dtype=np.float64)
+
+    assert single.dtype == np.float32
+    assert np.abs(single - double).max() < MAX_FLOAT32_ERROR
+
+
+def test_invalid_dtype_is_rejected():
+    with pytest.raises(ValueError):
+        create_synthesizer(dtype=np.int16)
@@ -0,0 +1,107 @@
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import py_synth
+from conftest import create_synthesizer
+
+
+def test_nested_render_keeps_outer_peak():
+    instrumentation = py_synth.Instrumentation(trace_allocations=True)
+
+    outer = instrumentation.begin("outer", 44100)
+    buffer = np.ones(1_000_000)
+    del buffer
+    inner = instrumentation.begin("inner", 44100)
+    small = np.ones(1000)
+    instrumentation.finish(inner)
+    del small
+    instrumentation.finish(outer)
+
+    assert inner.allocated_bytes < 100_000
+    assert outer.allocated_bytes >= 8_000_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_inner_peak_is_passed_to_outer():
+    instrumentation = py_synth.Instrumentation(trace_allocations=True)
+
+    outer = instrumentation.begin("outer", 44100)
+    inner = instrumentation.begin("inner", 44100)
+    buffer = np.ones(1_000_000)
+    del buffer
+    instrumentation.finish(inner)
+    instrumentation.finish(outer)
+
+    assert inner.allocated_bytes >= 8_000_000
+    assert outer.allocated_bytes >= inner.allocated_bytes
+
+
+def test_render_inside_traced_render(sound):
+    instrumentation = py_synth.Instrumentation(trace_allocations=True)
+    synth = create_synthesizer(instrumentation=instrumentation)
+
+    outer = instrumentation.begin("outer", synth.sample_rate)
+    synth.render(sound)
+    instrumentation.finish(outer)
+
+    assert outer.allocated_bytes >= instrumentation.history[0].allocated_bytes > 0
+
+
+def test_curve_stage_is_timed_apart_from_envelope(sound):
+    instrumentation = py_synth.Instrumentation()
+    synth = create_synthesizer(instrumentation=instrumentation)
+
+    synth.render(sound)
+    stats = instrumentation.last
+
+    num_blocks = -(-len(synth.render(sound)) // synth.block_size)
+    assert list(stats.stages) == ["oscillator", "envelope", "curve", "mix", "output"]
+    assert stats.stages["envelope"].calls == num_blocks
+    assert stats.stages["curve"].calls > 0
+    assert stats.stages["curve"].seconds > 0
+    assert 0 < stats.stages["curve"].samples <= stats.samples
+    assert sum(stage.seconds for stage in stats.stages.values()) <= stats.seconds
+    assert "curve" in stats.breakdown()
+
+
+def test_cached_envelope_has_no_curve_stage(sound):
+    instrumentation = py_synth.Instrumentation()
+    synth = create_synthesizer(instrumentation=instrumentation, envelope_cache=py_synth.LRUCache())
+
+    synth.render(sound)
+
+    assert instrumentation.last.stages["curve"].calls == 0
+
+
+def test_overlapping_renders_keep_each_others_peaks():
+    # Renders on different threads may finish in any order.
+    instrumentation = py_synth.Instrumentation(trace_allocations=True)
+
+    first = instrumentation.begin("first", 44100)
+    second = instrumentation.begin("second", 44100)
+    buffer = np.ones(1_000_000)
+    del buffer
+    instrumentation.finish(first)
+    assert tracemalloc.is_tracing()
+    third = instrumentation.begin("third", 44100)
+    instrumentation.finish(third)
+    instrumentation.finish(second)
+
+    assert first.allocated_bytes >= 8_000_000
+    assert second.allocated_bytes >= 8_000_000
+    assert third.allocated_bytes < 100_000
+    assert not tracemalloc.is_tracing()
+
+
+def test_traced_renders_on_threads(sound):
+    instrumentation = py_synth.Instrumentation(trace_allocations=True)
+    synths = [create_synthesizer(instrumentation=instrumentation) for _ in range(4)]
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda synth: [synth.render(sound) for _ in range(5)], synths))
+
+    assert len(instrumentation.history) == 20
+    assert all(stats.allocated_bytes > 0 for stats in instrumentation.history)
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,64 @@
+import io
+
+import numpy as np
+import pytest
+
+import py_synth
+
+
+def midi_file(tracks, file_format=1, division=480):
+    """
+    Returns the bytes of a Standard MIDI File with the given track data.
+    """
+    header = file_format.to_bytes(2, "big") + len(tracks).to_bytes(2, "big") + division.to_bytes(2, "big")
+    data = b"MThd" + len(header).to_bytes(4, "big") + header
+    for track in tracks:
+        data += b"MTrk" + len(track).to_bytes(4, "big") + track
+    return data
+
+
+# C4 for one beat, then E4 for one beat using running status.
+TRACK = b"\x00\x90\x3c\x64" + b"\x83\x60\x3c\x00" + b"\x00\x40\x50" + b"\x83\x60\x40\x00" + b"\x00\xff\x2f\x00"
+
+
+def test_read_midi():
+    notes = py_synth.read_midi(io.BytesIO(midi_file([TRACK])))
+
+    np.testing.assert_array_equal(notes.notes, [60, 64])
+    np.testing.assert_array_equal(notes.velocities, [100, 80])
+    np.testing.assert_allclose(notes.starts, [0.0, 0.5])
+    np.testing.assert_allclose(notes.durations, [0.5, 0.5])
+
+
+def test_format_2_is_rejected():
+    with pytest.raises(ValueError, match="format 2"):
+        py_synth.read_midi(io.BytesIO(midi_file([TRACK, TRACK], file_format=2)))
+
+
+@pytest.mark.parametrize("track", [TRACK[:5], TRACK[:2], b"\x00\xff\x51\x03\x07"])
+def test_truncated_track_names_the_file(tmp_path, track):
+    path = tmp_path / "truncated.mid"
+    path.write_bytes(midi_file([track]))
+
+    with pytest.raises(ValueError, match="truncated.mid"):
+        py_synth.read_midi(path)
+
+
+def test_unknown_chunks_do_not_count_as_tracks():
+    data = midi_file([TRACK])
+    header, track = data[:14], data[14:]
+    header = header[:10] + (2).to_bytes(2, "big") + header[12:]
+    unknown = b"XFIH" + (3).to_bytes(4, "big") + b"abc"
+    second = b"MTrk" + len(TRACK).to_bytes(4, "big") + TRACK
+
+    notes = py_synth.read_midi(io.BytesIO(header + unknown + track + second))
+
+    assert len(notes) == 4
+
+
+def test_invalid_running_status_names_the_file(tmp_path):
+    path = tmp_path / "status.mid"
+    path.write_bytes(midi_file([b"\x00\x3c\x64" + b"\x00\xff\x2f\x00"]))
+
+    with pytest.raises(ValueError, match="running status.*status.mid"):
+        py_synth.read_midi(path)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import py_synth
+
+
+SAMPLE_RATE = 10000
+
+
+@pytest.mark.parametrize("sustain", [0, 20, 50, 60])
+def test_ramp_from_envelope_follows_the_envelope(sustain):
+    duration = 1.0
+    envelope = py_synth.ADSREnvelope(
+        attack=py_synth.AttackPercent(10, py_synth.CurveType.SINE),
+        decay=py_synth.DecayPercent(20, py_synth.CurveType.EXPONENTIAL),
+        sustain_level=py_synth.SustainLevel(0.7),
+        sustain=py_synth.SustainPercent(sustain),
+        release=py_synth.ReleasePercent(20, py_synth.CurveType.LINEAR),
+    )
+    start, peak = 100.0, 500.0
+    ramp = py_synth.Ramp.from_envelope(envelope, duration, start, peak)
+
+    times = np.arange(int(SAMPLE_RATE * duration)) / SAMPLE_RATE
+    expected = start + (peak - start) * envelope.generate(SAMPLE_RATE, duration)
+    actual = ramp.evaluate(times)
+
+    # The envelope steps between sample-quantized segments, so skip the samples next to each boundary.
+    boundaries = np.array([0.1, 0.3, 0.3 + sustain / 100, 0.8, 1.0]) * SAMPLE_RATE
+    near = (np.abs(np.arange(len(times))[:, np.newaxis] - boundaries) <= 2).any(axis=1)
+    np.testing.assert_allclose(actual[~near], expected[~near], atol=0.01 * (peak - start))
+
+
+def test_modulator_without_evaluate_cannot_be_created():
+    class Incomplete(py_synth.Modulator):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_modulators_are_value_objects():
+    assert py_synth.LFO(5.0, 0.3) == py_synth.LFO(5.0, 0.3)
+    assert hash(py_synth.Ramp([(0.0, 1.0)])) == hash(py_synth.Ramp([(0.0, 1.0)]))
+    with pytest.raises(AttributeError):
+        py_synth.LFO(5.0, 0.3).rate = 1.0
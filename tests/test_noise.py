@@ -0,0 +1,30 @@
+import numpy as np
+
+import py_synth
+
+
+def test_seeded_noise_is_reproducible():
+    first = py_synth.Oscillator(py_synth.WaveformType.NOISE, 0.0, seed=5).generate(1000)
+    second = py_synth.Oscillator(py_synth.WaveformType.NOISE, 0.0, seed=5).generate(1000)
+
+    np.testing.assert_array_equal(first, second)
+
+
+def test_unseeded_noise_differs_between_oscillators():
+    first = py_synth.Oscillator(py_synth.WaveformType.NOISE, 0.0).generate(1000)
+    second = py_synth.Oscillator(py_synth.WaveformType.NOISE, 0.0).generate(1000)
+
+    assert not np.array_equal(first, second)
+    assert -1.0 <= first.min() and first.max() < 1.0
+
+
+def test_unseeded_waveform_noise_ignores_the_global_state():
+    waveform = py_synth.Waveform(44100)
+
+    np.random.seed(0)
+    first = waveform.generate(py_synth.WaveformType.NOISE, 0.0, 1000)
+    np.random.seed(0)
+    second = waveform.generate(py_synth.WaveformType.NOISE, 0.0, 1000)
+
+    assert not np.array_equal(first, second)
+    assert -1.0 <= first.min() and first.max() < 1.0
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+import py_synth
+
+
+@pytest.mark.parametrize("tuning", list(py_synth.TuningSystem))
+@pytest.mark.parametrize("tonic", [0, 7, 9])
+@pytest.mark.parametrize("a4", [440.0, 432.0])
+def test_a4_is_anchored_in_every_tuning(tuning, tonic, a4):
+    assert py_synth.midi_to_frequency(69, a4=a4, tuning=tuning, tonic=tonic) == pytest.approx(a4, rel=1e-12)
+    assert py_synth.Notes.A4.frequency(a4, tuning, tonic) == pytest.approx(a4, rel=1e-12)
+
+
+def test_just_intonation_follows_ratios_from_the_tonic():
+    # C major from C4: A4 is anchored, so C4 is 440 / (5 / 3).
+    numbers = np.array([60, 64, 67, 69, 72])
+    frequencies = py_synth.midi_to_frequency(numbers, tuning=py_synth.TuningSystem.JUST_INTONATION, tonic=0)
+
+    np.testing.assert_allclose(frequencies / frequencies[0], [1, 5 / 4, 3 / 2, 5 / 3, 2])
+    assert frequencies[3] == pytest.approx(440.0)
+
+
+def test_equal_temperament_matches_notes():
+    numbers = np.array([note.midi_number for note in py_synth.Notes])
+    expected = [note.value for note in py_synth.Notes]
+
+    np.testing.assert_allclose(py_synth.midi_to_frequency(numbers), expected)
@@ -0,0 +1,46 @@
+import numpy as np
+
+import py_synth
+from conftest import create_synthesizer
+
+
+def test_play_realtime_emits_the_rendered_sound(sound):
+    synth = create_synthesizer()
+    backend = py_synth.FakeStreamBackend()
+
+    player = synth.play_realtime(sound, block_size=256, backend=backend)
+
+    expected = synth.render(sound)
+    output = backend.streams[0].output[:, 0]
+    np.testing.assert_allclose(output[:len(expected)], expected, atol=1e-7)
+    assert not output[len(expected):].any()
+    assert len(output) % 256 == 0
+    assert player.frames_played == len(expected)
+    assert player.callbacks == len(backend.streams[0].blocks)
+    assert player.underruns == 0
+
+
+def test_play_realtime_counts_underruns(sound):
+    synth = create_synthesizer()
+    backend = py_synth.FakeStreamBackend(underflow_callbacks={1, 3})
+
+    player = synth.play_realtime(sound, block_size=256, backend=backend)
+
+    assert player.underruns == 2
+    # An underrun is reported by the device; the samples delivered stay continuous.
+    output = backend.streams[0].output[:, 0]
+    expected = synth.render(sound)
+    np.testing.assert_allclose(output[:len(expected)], expected, atol=1e-7)
+
+
+def test_callback_stops_and_pads_with_silence_when_blocks_run_out():
+    backend = py_synth.FakeStreamBackend()
+    player = py_synth.RealtimePlayer(iter([np.ones(100)]), 44100, block_size=64, backend=backend)
+
+    player.play()
+
+    blocks = backend.streams[0].blocks
+    assert len(blocks) == 2
+    assert np.all(blocks[0] == 1)
+    assert np.all(blocks[1][:36] == 1) and not blocks[1][36:].any()
+    assert player.frames_played == 100
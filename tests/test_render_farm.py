@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import py_synth
+from conftest import create_synthesizer
+
+
+def create_jobs(sound, count=4):
+    return [py_synth.RenderJob(sound, f"sound_{index}") for index in range(count)]
+
+
+@pytest.mark.parametrize("backend_type", [py_synth.MemoryBackend, py_synth.NullBackend])
+def test_render_many_keeps_in_process_output_in_the_callers_backend(sound, backend_type):
+    backend = backend_type()
+    synth = create_synthesizer(file_backend=backend)
+
+    counts = synth.render_many(create_jobs(sound), workers=2)
+
+    num_samples = int(synth.sample_rate * sound.duration)
+    assert counts == [num_samples] * 4
+    if backend_type is py_synth.MemoryBackend:
+        assert [stream.name for stream in backend.streams] == [f"sound_{index}" for index in range(4)]
+        np.testing.assert_array_equal(backend.streams[0].audio, synth.render(sound))
+    else:
+        assert backend.frames == 4 * num_samples
+
+
+def test_render_many_writes_files_from_worker_processes(sound, tmp_path):
+    pytest.importorskip("soundfile")
+    synth = create_synthesizer(file_backend=py_synth.SoundFileBackend(tmp_path))
+
+    counts = synth.render_many(create_jobs(sound), workers=2)
+
+    assert counts == [int(synth.sample_rate * sound.duration)] * 4
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"sound_{index}.wav" for index in range(4)]
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_render_many_rejects_non_positive_workers(sound, workers):
+    synth = create_synthesizer()
+
+    with pytest.raises(ValueError):
+        synth.render_many(create_jobs(sound), workers=workers)
+    with pytest.raises(ValueError):
+        py_synth.render_farm.render_many(synth._worker_config(), create_jobs(sound), workers)
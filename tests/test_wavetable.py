@@ -0,0 +1,44 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import py_synth
+
+
+def test_wavetable_copies_the_callers_samples():
+    samples = np.sin(2 * np.pi * np.arange(1024) / 1024)
+    table = py_synth.Wavetable(samples, size=1024)
+
+    assert samples.flags.writeable
+    assert not table.table.flags.writeable
+    samples[0] = 1.0
+    assert table.table[0] == 0.0
+
+
+def test_wavetable_oscillator_matches_the_computed_sine():
+    table = py_synth.Wavetable.from_waveform(py_synth.WaveformType.SINE, 4096)
+    oscillator = py_synth.WavetableOscillator(
+        table, 440.0, 44100, interpolation=py_synth.Interpolation.CUBIC
+    )
+    reference = py_synth.Oscillator(py_synth.WaveformType.SINE, 440.0, 44100)
+
+    np.testing.assert_allclose(oscillator.generate(10000), reference.generate(10000), atol=1e-9)
+
+
+def test_coefficients_are_computed_once_across_threads(monkeypatch):
+    table = py_synth.Wavetable(np.sin(2 * np.pi * np.arange(256) / 256), size=256)
+    calls = []
+    compute = py_synth.Wavetable._compute_coefficients
+
+    def slow_compute(self, interpolation, dtype):
+        calls.append(interpolation)
+        time.sleep(0.01)
+        return compute(self, interpolation, dtype)
+
+    monkeypatch.setattr(py_synth.Wavetable, "_compute_coefficients", slow_compute)
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: table.coefficients(py_synth.Interpolation.CUBIC), range(8)))
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)